@@ -0,0 +1,5 @@
+import os
+import sys
+
+# ui.py lives at the repo root, next to this folder :3
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
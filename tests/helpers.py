@@ -0,0 +1,37 @@
+import threading
+import time
+
+
+def make_mod(name, version='1.0.0'):
+    return {'title': name, 'id': name, 'thunderstore_id': f"Author-{name}", 'download': f"https://example.com/{name}/{version}"}
+
+
+def wait_for(predicate, timeout=5):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+# a runner that holds each job until the test lets it go, checking for interrupts like a download does :3
+class GatedRunner:
+    def __init__(self):
+        self.started = []
+        self.gates = {}
+        self.lock = threading.Lock()
+
+    def release(self, title):
+        self.gate(title).set()
+
+    def gate(self, title):
+        with self.lock:
+            return self.gates.setdefault(title, threading.Event())
+
+    def __call__(self, job):
+        self.started.append(job.title)
+        gate = self.gate(job.title)
+        while not gate.wait(0.01):
+            job.check_interrupt()
+        return job.title
@@ -0,0 +1,97 @@
+import os
+
+import pytest
+
+from ui import ArchiveCache, hash_file
+
+
+def write_archive(directory, name, data):
+    path = os.path.join(directory, name)
+    with open(path, 'wb') as f:
+        f.write(data)
+    return path
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ArchiveCache(str(tmp_path / 'cache'), max_bytes=250)
+
+
+def test_archive_cache_returns_what_was_put(cache, tmp_path):
+    source = write_archive(tmp_path, 'a.zip', b'a' * 100)
+    sha256 = cache.put('a', source)
+    destination = str(tmp_path / 'out.zip')
+    assert cache.get('a', destination) == sha256 == hash_file(destination)
+    assert cache.get('missing', destination) is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_archive_cache_evicts_least_recently_used(cache, tmp_path):
+    cache.put('a', write_archive(tmp_path, 'a.zip', b'a' * 100))
+    cache.put('b', write_archive(tmp_path, 'b.zip', b'b' * 100))
+    cache.get('a', str(tmp_path / 'out.zip'))  # a is now the most recently used :3
+    cache.put('c', write_archive(tmp_path, 'c.zip', b'c' * 100))
+
+    assert list(cache.entries) == ['a', 'c']
+    assert cache.evictions == 1
+    assert cache.total_size() == 200
+    assert sorted(os.listdir(cache.cache_dir)) == sorted(['index.json'] + [f"{cache.entries[key]['sha256']}.zip" for key in ('a', 'c')])
+
+
+def test_archive_cache_counts_shared_blobs_once(cache, tmp_path):
+    cache.put('a', write_archive(tmp_path, 'a.zip', b'a' * 100))
+    cache.put('a-again', write_archive(tmp_path, 'a2.zip', b'a' * 100))
+    assert cache.total_size() == 100
+
+    cache.put('b', write_archive(tmp_path, 'b.zip', b'b' * 100))
+    cache.put('c', write_archive(tmp_path, 'c.zip', b'c' * 100))
+    # dropping one key of the shared blob frees nothing, so the second one has to go as well :3
+    assert list(cache.entries) == ['b', 'c']
+    assert cache.total_size() == 200
+
+
+def test_archive_cache_drops_corrupt_blobs(cache, tmp_path):
+    sha256 = cache.put('a', write_archive(tmp_path, 'a.zip', b'a' * 100))
+    with open(cache.blob_path(sha256), 'wb') as f:
+        f.write(b'not the archive')
+    assert cache.get('a', str(tmp_path / 'out.zip')) is None
+    assert 'a' not in cache.entries
+    assert cache.total_size() == 0
+
+
+def test_archive_cache_index_survives_a_reload(cache, tmp_path):
+    cache.put('a', write_archive(tmp_path, 'a.zip', b'a' * 100))
+    cache.put('b', write_archive(tmp_path, 'b.zip', b'b' * 100))
+    reloaded = ArchiveCache(cache.cache_dir, max_bytes=250)
+    assert list(reloaded.entries) == ['a', 'b']
+    assert reloaded.total_size() == 200
+
+
+def test_archive_cache_partials_share_the_budget(cache, tmp_path):
+    cache.put('a', write_archive(tmp_path, 'a.zip', b'a' * 100))
+    cache.put('b', write_archive(tmp_path, 'b.zip', b'b' * 100))
+    cache.set_partial_size(100)
+    assert list(cache.entries) == ['b']
+
+
+def test_archive_cache_get_survives_an_eviction_while_reading(cache, tmp_path, monkeypatch):
+    import ui
+
+    sha256 = cache.put('a', write_archive(tmp_path, 'a.zip', b'a' * 100))
+    real_hash_file = ui.hash_file
+
+    # another worker fills the cache while this get is still checking the blob :3
+    def hash_while_evicting(path):
+        monkeypatch.setattr(ui, 'hash_file', real_hash_file)
+        cache.put('b', write_archive(tmp_path, 'b.zip', b'b' * 100))
+        cache.put('c', write_archive(tmp_path, 'c.zip', b'c' * 100))
+        assert 'a' not in cache.entries
+        return real_hash_file(path)
+
+    monkeypatch.setattr(ui, 'hash_file', hash_while_evicting)
+    destination = str(tmp_path / 'out.zip')
+    assert cache.get('a', destination) == sha256 == hash_file(destination)
+    assert 'a' not in cache.entries
+    # the evicted blob goes once nothing is reading it any more :3
+    assert not os.path.exists(cache.blob_path(sha256))
+    assert cache.total_size() == 200
@@ -0,0 +1,27 @@
+import time
+
+from ui import BandwidthLimiter, TokenBucket
+
+
+def test_token_bucket_holds_transfers_to_its_rate():
+    bucket = TokenBucket(200_000)
+    start = time.monotonic()
+    for _ in range(10):
+        bucket.consume(20_000)
+    # 200KB at 200KB/s, a fresh bucket starts with nothing banked :3
+    assert 0.9 <= time.monotonic() - start < 1.5
+
+
+def test_token_bucket_without_a_rate_never_waits():
+    bucket = TokenBucket(0)
+    start = time.monotonic()
+    bucket.consume(10 ** 12)
+    assert time.monotonic() - start < 0.1
+
+
+def test_background_transfers_use_their_own_cap():
+    limiter = BandwidthLimiter(foreground_rate=0, background_rate=100_000)
+    assert limiter.bucket(background=True) is limiter.background
+    start = time.monotonic()
+    limiter.consume(10 ** 9)
+    assert time.monotonic() - start < 0.1
@@ -0,0 +1,48 @@
+from ui import FuzzySearchIndex, bounded_edit_distance
+
+
+def make_index():
+    index = FuzzySearchIndex()
+    index.add('boats', [("Better Boats", 1.0), ("Faster boats for everyone", 0.5)])
+    index.add('fishing', [("Fishing Plus", 1.0), ("More fish to catch", 0.5)])
+    index.add('camera', [("Camera Tweaks", 1.0), ("Zoom out further", 0.5)])
+    return index
+
+
+def test_edit_distance_counts_swaps_once_and_stops_at_the_bound():
+    assert bounded_edit_distance('boats', 'baots', 2) == 1
+    assert bounded_edit_distance('boats', 'boats', 2) == 0
+    assert bounded_edit_distance('boats', 'camera', 2) == 3
+
+
+def test_exact_match_ranks_first():
+    results = make_index().search("fishing")
+    assert results[0][0] == 'fishing'
+
+
+def test_typos_and_prefixes_still_match():
+    index = make_index()
+    assert [key for key, _ in index.search("fihsing")] == ['fishing']
+    assert index.search("cam")[0][0] == 'camera'
+    assert [key for key, _ in index.search("camrea twe")] == ['camera']
+
+
+def test_unrelated_query_finds_nothing():
+    assert make_index().search("xylophone") == []
+
+
+def test_limit_and_allowed_keys_narrow_the_results():
+    index = make_index()
+    index.add('boats2', [("Boats Extra", 1.0)])
+    assert len(index.search("boats", limit=1)) == 1
+    assert [key for key, _ in index.search("boats", allowed={'boats2'})] == ['boats2']
+
+
+def test_removed_documents_stop_matching():
+    index = make_index()
+    index.remove('camera')
+    assert 'camera' not in index
+    assert index.search("camera") == []
+    assert 'camera' not in index.vocabulary
+    index.add('camera', [("Camera Again", 1.0)])
+    assert [key for key, _ in index.search("camera")] == ['camera']
@@ -0,0 +1,44 @@
+import http.server
+import threading
+import time
+
+import pytest
+import requests
+
+from ui import HttpClient
+
+
+@pytest.fixture
+def server():
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header('Content-Length', '2')
+            self.end_headers()
+            self.wfile.write(b'ok')
+
+        def log_message(self, format, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"127.0.0.1:{server.server_port}"
+    server.shutdown()
+
+
+def test_waiting_for_a_host_slot_times_out(server):
+    client = HttpClient(timeout=(0.2, 5), host_connections=1)
+    held = client.get(f"http://{server}/", stream=True)
+    start = time.monotonic()
+    with pytest.raises(requests.Timeout):
+        client.get(f"http://{server}/", stream=True)
+    assert time.monotonic() - start < 2
+    held.close()
+    assert client.get(f"http://{server}/", stream=True).status_code == 200
+
+
+def test_streams_dont_hold_up_other_requests(server):
+    client = HttpClient(timeout=(0.2, 5), host_connections=1)
+    held = client.get(f"http://{server}/", stream=True)
+    assert client.get(f"http://{server}/").text == 'ok'
+    held.close()
@@ -0,0 +1,64 @@
+import concurrent.futures
+import threading
+import time
+
+import pytest
+
+from helpers import make_mod, wait_for
+from ui import InstallExecutor, InstallJob, PipelineStage
+
+
+def test_future_result_finishes_the_job_later():
+    stage_future = concurrent.futures.Future()
+    executor = InstallExecutor(lambda job: stage_future, workers=1)
+    job = executor.submit(make_mod('a'))
+    assert wait_for(lambda: job.deploying)
+    assert job.state == InstallJob.RUNNING
+    # the download half is over, so there's nothing left to pause or cancel :3
+    assert not executor.pause(job.id)
+    assert not executor.cancel(job.id)
+
+    stage_future.set_result({'title': 'a'})
+    assert job.future.result(timeout=5) == {'title': 'a'}
+    assert job.state == InstallJob.DONE
+
+
+def test_failed_stage_future_fails_the_job():
+    stage_future = concurrent.futures.Future()
+    executor = InstallExecutor(lambda job: stage_future, workers=1)
+    job = executor.submit(make_mod('a'))
+    assert wait_for(lambda: job.deploying)
+    stage_future.set_exception(ValueError("extract failed"))
+    with pytest.raises(ValueError):
+        job.future.result(timeout=5)
+    assert job.state == InstallJob.FAILED
+
+
+def test_pipeline_stage_runs_work_and_reports_errors():
+    stage = PipelineStage('test', workers=2, capacity=4)
+    assert stage.submit(lambda a, b: a + b, 2, 3).result(timeout=5) == 5
+
+    def fail():
+        raise RuntimeError("no")
+
+    with pytest.raises(RuntimeError):
+        stage.submit(fail).result(timeout=5)
+
+
+def test_pipeline_stage_runs_in_parallel_up_to_its_worker_count():
+    stage = PipelineStage('test', workers=2, capacity=4)
+    lock = threading.Lock()
+    running = [0, 0]  # now, most at once :3
+
+    def work():
+        with lock:
+            running[0] += 1
+            running[1] = max(running[1], running[0])
+        time.sleep(0.1)
+        with lock:
+            running[0] -= 1
+
+    futures = [stage.submit(work) for _ in range(4)]
+    for future in futures:
+        future.result(timeout=5)
+    assert running[1] == 2
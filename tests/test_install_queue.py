@@ -0,0 +1,51 @@
+import pytest
+
+from helpers import GatedRunner, make_mod, wait_for
+from ui import InstallExecutor, InstallJob
+
+
+@pytest.fixture
+def runner():
+    return GatedRunner()
+
+
+def test_pause_requeues_a_running_job_and_resume_finishes_it(runner):
+    executor = InstallExecutor(runner, workers=1)
+    job = executor.submit(make_mod('a'))
+    assert wait_for(lambda: job.state == InstallJob.RUNNING)
+
+    assert executor.pause(job.id)
+    assert wait_for(lambda: job.state == InstallJob.PAUSED)
+    assert job in executor.queue
+    assert not job.future.done()
+
+    assert executor.resume(job.id)
+    assert wait_for(lambda: runner.started.count('a') == 2)
+    runner.release('a')
+    assert job.future.result(timeout=5) == 'a'
+
+
+def test_cancel_stops_a_running_job(runner):
+    executor = InstallExecutor(runner, workers=1)
+    job = executor.submit(make_mod('a'))
+    assert wait_for(lambda: job.state == InstallJob.RUNNING)
+    assert executor.cancel(job.id)
+    assert wait_for(lambda: job.state == InstallJob.CANCELLED)
+    assert job.future.cancelled()
+    assert 'a' not in {queued.title for queued in executor.queue}
+
+
+def test_pending_state_round_trips_through_restore(runner):
+    executor = InstallExecutor(runner, workers=1)
+    executor.pause_all()
+    dependency = executor.submit(make_mod('dependency'))
+    executor.submit(make_mod('dependent'), depends_on=[dependency])
+    executor.pause(dependency.id)
+    state = executor.pending_state()
+
+    restored_executor = InstallExecutor(runner, workers=1)
+    restored = restored_executor.restore(state)
+    assert restored_executor.paused
+    assert [job.title for job in restored] == ['dependency', 'dependent']
+    assert restored[0].state == InstallJob.PAUSED
+    assert restored[1].depends_on == [restored[0]]
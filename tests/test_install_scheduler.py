@@ -0,0 +1,96 @@
+import time
+
+import pytest
+
+from helpers import GatedRunner, make_mod, wait_for
+from ui import InstallExecutor, InstallJob
+
+
+@pytest.fixture
+def runner():
+    return GatedRunner()
+
+
+def test_same_package_attaches_to_the_pending_job(runner):
+    executor = InstallExecutor(runner, workers=1)
+    blocker = executor.submit(make_mod('blocker'))
+    first = executor.submit(make_mod('a'))
+    second = executor.submit(make_mod('a'))
+    assert second is first
+    assert first.requests == 2
+
+    runner.release('blocker')
+    runner.release('a')
+    assert first.future.result(timeout=5) == 'a'
+    assert blocker.future.result(timeout=5) == 'blocker'
+    assert runner.started.count('a') == 1
+
+
+def test_waiting_job_switches_to_the_newest_version(runner):
+    executor = InstallExecutor(runner, workers=1)
+    executor.submit(make_mod('blocker'))
+    job = executor.submit(make_mod('a', '1.0.0'))
+    assert executor.submit(make_mod('a', '2.0.0')) is job
+    assert job.mod['download'].endswith('2.0.0')
+    runner.release('blocker')
+    runner.release('a')
+    job.future.result(timeout=5)
+
+
+def test_dependencies_run_first(runner):
+    executor = InstallExecutor(runner, workers=2)
+    dependency = executor.submit(make_mod('dependency'), priority=InstallJob.PRIORITY_DEPENDENCY)
+    dependent = executor.submit(make_mod('dependent'), depends_on=[dependency])
+    assert wait_for(lambda: dependency.state == InstallJob.RUNNING)
+    time.sleep(0.05)
+    assert dependent.state == InstallJob.QUEUED and dependent.blocked
+
+    runner.release('dependency')
+    runner.release('dependent')
+    dependent.future.result(timeout=5)
+    assert runner.started == ['dependency', 'dependent']
+
+
+def test_circular_dependency_is_ignored(runner):
+    executor = InstallExecutor(runner, workers=1)
+    executor.pause_all()
+    first = executor.submit(make_mod('first'))
+    second = executor.submit(make_mod('second'), depends_on=[first])
+    assert executor.submit(make_mod('first'), depends_on=[second]) is first
+    assert first.depends_on == []
+
+    executor.resume_all()
+    runner.release('first')
+    runner.release('second')
+    assert second.future.result(timeout=5) == 'second'
+
+
+def test_failed_dependency_fails_its_dependents():
+    def runner(job):
+        if job.title == 'broken':
+            raise ValueError("bad archive")
+        return job.title
+
+    executor = InstallExecutor(runner, workers=1)
+    executor.pause_all()
+    broken = executor.submit(make_mod('broken'))
+    middle = executor.submit(make_mod('middle'), depends_on=[broken])
+    top = executor.submit(make_mod('top'), depends_on=[middle])
+    executor.resume_all()
+
+    with pytest.raises(ValueError):
+        top.future.result(timeout=5)
+    assert broken.state == middle.state == top.state == InstallJob.FAILED
+
+    late = executor.submit(make_mod('late'), depends_on=[broken])
+    assert late.state == InstallJob.FAILED
+
+
+def test_cancelled_dependency_cancels_its_dependents(runner):
+    executor = InstallExecutor(runner, workers=1)
+    executor.pause_all()
+    dependency = executor.submit(make_mod('dependency'))
+    dependent = executor.submit(make_mod('dependent'), depends_on=[dependency])
+    assert executor.cancel(dependency.id)
+    assert dependency.state == dependent.state == InstallJob.CANCELLED
+    assert dependent.future.cancelled()
@@ -0,0 +1,77 @@
+import hashlib
+import http.server
+import threading
+import time
+
+import pytest
+import requests
+
+from ui import PeerCache
+
+ARCHIVE = b'PK' + b'x' * 4096
+ARCHIVE_SHA256 = hashlib.sha256(ARCHIVE).hexdigest()
+
+
+# a peer serving one archive with the digest it claims for it :3
+@pytest.fixture
+def peer():
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header('Content-Length', str(len(ARCHIVE)))
+            self.send_header('X-Archive-SHA256', ARCHIVE_SHA256)
+            self.end_headers()
+            self.wfile.write(ARCHIVE)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"127.0.0.1:{server.server_port}"
+    server.shutdown()
+
+
+def make_peer_cache(static=(), discovered=()):
+    peers = PeerCache(None, requests.Session())
+    peers.use_peers = True
+    peers.static_peers = list(static)
+    peers.trust_discovered = True
+    peers.discovered = list(discovered)
+    peers.discovered_at = time.time()
+    return peers
+
+
+def test_known_digest_is_fetched_from_any_peer(peer, tmp_path):
+    peers = make_peer_cache(discovered=[peer])
+    destination = tmp_path / 'a.zip'
+    assert peers.fetch('a', str(destination), expected_sha256=ARCHIVE_SHA256) == ARCHIVE_SHA256
+    assert destination.read_bytes() == ARCHIVE
+
+
+def test_unknown_digest_isnt_taken_from_peers_by_default(peer, tmp_path):
+    peers = make_peer_cache(static=[peer])
+    assert peers.fetch('a', str(tmp_path / 'a.zip')) is None
+
+
+def test_unverified_archives_only_come_from_configured_peers(peer, tmp_path):
+    discovered = make_peer_cache(discovered=[peer])
+    discovered.accept_unverified = True
+    assert discovered.fetch('a', str(tmp_path / 'a.zip')) is None
+
+    static = make_peer_cache(static=[peer])
+    static.accept_unverified = True
+    assert static.fetch('a', str(tmp_path / 'a.zip')) == ARCHIVE_SHA256
+
+
+def test_fetch_goes_through_the_throttle_and_size_check(peer, tmp_path):
+    peers = make_peer_cache(static=[peer])
+    throttled = []
+    assert peers.fetch('a', str(tmp_path / 'a.zip'), expected_sha256=ARCHIVE_SHA256, throttle=throttled.append) == ARCHIVE_SHA256
+    assert sum(throttled) == len(ARCHIVE)
+
+    def refuse(total):
+        raise ValueError(f"{total} is too large")
+
+    with pytest.raises(ValueError):
+        peers.fetch('a', str(tmp_path / 'b.zip'), expected_sha256=ARCHIVE_SHA256, on_size=refuse)
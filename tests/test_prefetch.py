@@ -0,0 +1,59 @@
+import threading
+
+from helpers import make_mod, wait_for
+from ui import SpeculativePrefetcher
+
+
+# a fetch that streams forever in small chunks until the prefetcher's throttle stops it :3
+class EndlessFetch:
+    def __init__(self):
+        self.started = []
+        self.chunk_sent = threading.Event()
+
+    def __call__(self, mod, throttle):
+        self.started.append(mod['title'])
+        while True:
+            throttle(1)
+            self.chunk_sent.set()
+
+
+def test_prefetch_fetches_each_mod():
+    fetched = []
+    prefetcher = SpeculativePrefetcher(lambda mod, throttle: fetched.append(mod['title']) or True, rate=0)
+    prefetcher.prefetch([make_mod('a'), make_mod('b')])
+    assert wait_for(lambda: prefetcher.fetched == 2)
+    assert fetched == ['a', 'b']
+
+
+def test_cancel_stops_at_the_next_chunk_and_skips_the_rest():
+    fetch = EndlessFetch()
+    prefetcher = SpeculativePrefetcher(fetch, rate=0)
+    prefetcher.prefetch([make_mod('a'), make_mod('b')])
+    assert fetch.chunk_sent.wait(5)
+
+    prefetcher.cancel()
+    assert wait_for(lambda: not prefetcher.busy)
+    assert prefetcher.cancelled == 1
+    assert fetch.started == ['a']
+
+
+def test_new_selection_replaces_the_running_prefetch():
+    fetch = EndlessFetch()
+    prefetcher = SpeculativePrefetcher(fetch, rate=0)
+    prefetcher.prefetch([make_mod('a')])
+    assert fetch.chunk_sent.wait(5)
+
+    prefetcher.prefetch([make_mod('b')])
+    assert wait_for(lambda: fetch.started == ['a', 'b'])
+    assert prefetcher.cancelled == 1
+    prefetcher.cancel()
+    assert wait_for(lambda: not prefetcher.busy)
+
+
+def test_prefetch_goes_through_the_shared_throttle():
+    shared = []
+    prefetcher = SpeculativePrefetcher(lambda mod, throttle: throttle(10) or True, rate=0, shared_throttle=shared.append)
+    prefetcher.prefetch([make_mod('a')])
+    assert wait_for(lambda: prefetcher.fetched == 1)
+    assert shared == [10]
+    assert prefetcher.bytes == 10
@@ -0,0 +1,108 @@
+import collections
+import threading
+import types
+
+import pytest
+
+import ui
+from helpers import make_mod
+from ui import ArchiveCache, HookLineSinkerUI
+
+MB = 1048576
+
+
+def sized_mod(name, size):
+    mod = make_mod(name)
+    mod['file_size'] = size
+    return mod
+
+
+# holds tk thread callbacks until the test runs them, like the batcher's after loop would :3
+class HeldBatcher:
+    def __init__(self):
+        self.calls = []
+
+    def call(self, callback, *args):
+        self.calls.append((callback, args))
+
+    def run(self):
+        calls, self.calls = self.calls, []
+        for callback, args in calls:
+            callback(*args)
+
+
+# just enough of the app for the disk check, 10MB archives need 30MB each with the ratio at 1 :3
+@pytest.fixture
+def app(monkeypatch):
+    monkeypatch.setattr(ui, 'get_disk_space', lambda path: (ui.DISK_SPACE_RESERVE + 70 * MB, 1))
+    app = types.SimpleNamespace(
+        settings={},
+        app_data_dir='app data',
+        jobs=[],
+        statuses=[],
+        ui_batcher=HeldBatcher(),
+        preflight_reserved=collections.Counter(),
+        preflight_lock=threading.Lock(),
+        get_extract_ratio=lambda: 1.0,
+        get_archive_sizes=lambda mods: [(mod['file_size'], False) for mod in mods],
+    )
+    app.install_executor = types.SimpleNamespace(snapshot=lambda: app.jobs)
+    app.set_status = app.statuses.append
+    app._confirm_install_plan = types.MethodType(HookLineSinkerUI._confirm_install_plan, app)
+    return app
+
+
+def measure(app, mods):
+    plans = []
+    HookLineSinkerUI._measure_install_plan(app, mods, plans.append, False)
+    return plans
+
+
+def test_plan_that_fits_is_kept_whole(app):
+    mods = [sized_mod('a', 10 * MB), sized_mod('b', 10 * MB)]
+    plans = measure(app, mods)
+    app.ui_batcher.run()
+    assert plans == [mods]
+
+
+def test_plan_is_trimmed_to_the_prefix_that_fits(app):
+    mods = [sized_mod(name, 10 * MB) for name in 'abc']
+    plans = measure(app, mods)
+    app.ui_batcher.run()
+    assert plans == [mods[:2]]
+    assert app.statuses == ["Low disk space, only installing 2 of 3 mods"]
+
+
+def test_queued_jobs_count_against_free_space(app):
+    queued = ui.InstallJob(sized_mod('queued', 10 * MB))
+    app.jobs.append(queued)
+    mods = [sized_mod('a', 10 * MB), sized_mod('b', 10 * MB)]
+    plans = measure(app, mods)
+    app.ui_batcher.run()
+    assert plans == [mods[:1]]
+
+
+def test_queued_job_for_a_package_in_the_plan_isnt_counted_twice(app):
+    app.jobs.append(ui.InstallJob(sized_mod('a', 10 * MB)))
+    mods = [sized_mod('a', 10 * MB), sized_mod('b', 10 * MB)]
+    plans = measure(app, mods)
+    app.ui_batcher.run()
+    assert plans == [mods]
+
+
+def test_back_to_back_plans_dont_share_the_same_space(app):
+    first = measure(app, [sized_mod('a', 10 * MB), sized_mod('b', 10 * MB)])
+    second = measure(app, [sized_mod('c', 10 * MB), sized_mod('d', 10 * MB)])
+    app.ui_batcher.run()
+    assert len(first[0]) == 2
+    assert second == [[]]
+    assert not app.preflight_reserved
+
+
+def test_archive_sizes_come_from_the_listing_before_the_network(tmp_path):
+    def head(*args, **kwargs):
+        raise AssertionError("sent a HEAD for a mod with a known size")
+
+    app = types.SimpleNamespace(archive_cache=ArchiveCache(str(tmp_path)), http=types.SimpleNamespace(head=head))
+    sizes = HookLineSinkerUI.get_archive_sizes(app, [sized_mod('a', 3 * MB)])
+    assert sizes == [(3 * MB, False)]
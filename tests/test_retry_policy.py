@@ -0,0 +1,65 @@
+import pytest
+import requests
+
+from ui import RetryPolicy
+
+
+def http_error(status):
+    response = requests.Response()
+    response.status_code = status
+    return requests.HTTPError(response=response)
+
+
+@pytest.mark.parametrize('error, transient', [
+    (requests.ConnectionError(), True),
+    (requests.Timeout(), True),
+    (requests.exceptions.ChunkedEncodingError(), True),
+    (http_error(503), True),
+    (http_error(429), True),
+    (http_error(404), False),
+    (http_error(403), False),
+    (ValueError("not a zip"), False),
+])
+def test_retry_policy_classifies_errors(error, transient):
+    assert RetryPolicy.is_transient(error) is transient
+
+
+def test_retry_policy_retries_transient_errors_until_it_works():
+    policy = RetryPolicy(attempts=4, base_delay=0, max_delay=0)
+    calls = []
+    retries = []
+
+    def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise requests.ConnectionError("reset")
+        return "ok"
+
+    assert policy.call(flaky, lambda attempt, error, wait: retries.append(attempt)) == "ok"
+    assert retries == [1, 2]
+
+
+def test_retry_policy_gives_up_on_permanent_errors():
+    policy = RetryPolicy(attempts=4, base_delay=0, max_delay=0)
+    calls = []
+
+    def missing():
+        calls.append(1)
+        raise http_error(404)
+
+    with pytest.raises(requests.HTTPError):
+        policy.call(missing)
+    assert len(calls) == 1
+
+
+def test_retry_policy_stops_after_its_attempts():
+    policy = RetryPolicy(attempts=3, base_delay=0, max_delay=0)
+    calls = []
+
+    def down():
+        calls.append(1)
+        raise requests.ConnectionError("down")
+
+    with pytest.raises(requests.ConnectionError):
+        policy.call(down)
+    assert len(calls) == 3
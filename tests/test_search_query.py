@@ -0,0 +1,72 @@
+import time
+
+import pytest
+
+from ui import ModQueryIndex, parse_search_query
+
+
+def test_free_text_and_predicates_are_split_apart():
+    query = parse_search_query('boats author:Nuko downloads>10k -deprecated -slow')
+    assert query.text == 'boats'
+    assert ('author', '=', 'nuko', False) in query.predicates
+    assert ('downloads', '>', 10000, False) in query.predicates
+    assert ('is', '=', 'deprecated', True) in query.predicates
+    assert query.excluded == ['slow']
+    assert query.structured
+
+
+def test_quoted_values_and_aliases():
+    query = parse_search_query('cat:"Quality of Life" by:someone')
+    assert query.predicates == [('category', '=', 'quality of life', False), ('author', '=', 'someone', False)]
+    assert query.text == ''
+
+
+def test_relative_dates_flip_the_operator():
+    before = time.time()
+    field, operator, value, negated = parse_search_query('updated<30d').predicates[0]
+    assert (field, operator, negated) == ('updated', '>', False)
+    assert value == pytest.approx(before - 30 * 86400, abs=5)
+
+
+def test_terms_that_dont_parse_stay_free_text():
+    query = parse_search_query('likes>lots colour:red')
+    assert not query.predicates
+    assert query.text == 'likes>lots colour:red'
+
+
+def make_index():
+    mods = [
+        {'title': 'Boats', 'author': 'Nuko', 'downloads': 50000, 'description': 'fast boats'},
+        {'title': 'Fishing', 'author': 'Nuko', 'downloads': 500, 'description': 'slow fishing'},
+        {'title': 'Camera', 'author': 'Someone', 'downloads': 20000, 'description': 'zoom'},
+    ]
+    index = ModQueryIndex()
+    index.build(
+        ((mod['title'], mod) for mod in mods),
+        lambda mod: ({'author': [mod['author']]}, {'downloads': mod['downloads']})
+    )
+    return index
+
+
+def titles(rows):
+    return [row['title'] for row in rows]
+
+
+def test_predicates_are_intersected_in_insertion_order():
+    index = make_index()
+    assert titles(index.execute(parse_search_query('author:nuko'))) == ['Boats', 'Fishing']
+    assert titles(index.execute(parse_search_query('author:nuko downloads>=1k'))) == ['Boats']
+    assert titles(index.execute(parse_search_query('downloads>1k'))) == ['Boats', 'Camera']
+
+
+def test_negated_predicates_and_exclusions_are_subtracted():
+    index = make_index()
+    assert titles(index.execute(parse_search_query('-author:nuko'))) == ['Camera']
+    assert titles(index.execute(parse_search_query('author:nuko -slow'))) == ['Boats']
+
+
+def test_plan_runs_the_most_selective_predicate_first():
+    index = make_index()
+    positive, negative = index.plan(parse_search_query('downloads>1 author:someone'))
+    assert positive[0][0] == 'author'
+    assert index.estimate(positive[0]) == 1
@@ -0,0 +1,77 @@
+import random
+
+from ui import ServerIndex, apply_listbox_diff
+
+
+# list backed stand in for a tk listbox, delete takes an inclusive range like the real one :3
+class FakeListbox:
+    def __init__(self, items=()):
+        self.items = list(items)
+        self.operations = 0
+
+    def delete(self, first, last):
+        del self.items[first:last + 1]
+        self.operations += 1
+
+    def insert(self, index, *items):
+        self.items[index:index] = items
+        self.operations += 1
+
+
+def test_diff_reaches_the_new_items():
+    rng = random.Random(7)
+    for _ in range(200):
+        old = [rng.choice('abcdef') for _ in range(rng.randint(0, 12))]
+        new = [rng.choice('abcdef') for _ in range(rng.randint(0, 12))]
+        listbox = FakeListbox(old)
+        apply_listbox_diff(listbox, old, new)
+        assert listbox.items == new
+
+
+def test_diff_only_touches_what_changed():
+    old = [f"server {i}" for i in range(100)]
+    new = old[:50] + ["new server"] + old[50:]
+    listbox = FakeListbox(old)
+    apply_listbox_diff(listbox, old, new)
+    assert listbox.items == new
+    assert listbox.operations == 1
+
+    listbox = FakeListbox(old)
+    apply_listbox_diff(listbox, old, old)
+    assert listbox.operations == 0
+
+
+def make_server(host, title, players=1, cap=10, updated=1, **extra):
+    return dict(host=host, title=title, current_players=players, player_cap=cap, last_updated=updated, **extra)
+
+
+def test_update_keeps_the_newest_server_per_host():
+    index = ServerIndex()
+    assert index.update([make_server('a', 'Old', updated=1), make_server('a', 'New', updated=2), make_server('b', 'Other')])
+    assert sorted(server['title'] for server in index.servers) == ['New', 'Other']
+
+
+def test_unchanged_refresh_reports_no_change():
+    servers = [make_server('a', 'Alpha'), make_server('b', 'Beta')]
+    index = ServerIndex()
+    assert index.update(servers)
+    assert not index.update([dict(server) for server in servers])
+    assert index.update([make_server('a', 'Alpha', players=2), servers[1]])
+
+
+def test_query_filters_and_sorts():
+    index = ServerIndex()
+    index.update([
+        make_server('a', 'Zebra Lake', players=3, cap=12),
+        make_server('b', 'Apple Bay', players=1, cap=4),
+        make_server('c', 'Empty', players=0),
+        make_server('d', 'Late Night', age_restricted=True),
+    ])
+
+    def titles(positions):
+        return [index.servers[position]['title'] for position in positions]
+
+    assert titles(index.query('', 'name', False)) == ['Apple Bay', 'Zebra Lake']
+    assert titles(index.query('', 'player_cap', False)) == ['Zebra Lake', 'Apple Bay']
+    assert titles(index.query('lake', 'name', False)) == ['Zebra Lake']
+    assert 'Late Night' in titles(index.query('', 'name', True))
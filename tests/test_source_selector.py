@@ -0,0 +1,47 @@
+from ui import DOWNLOAD_CHUNK_SIZE, SourceSelector, parse_thunderstore_download_url
+
+MB = 1048576
+
+
+def test_faster_source_ranks_first():
+    selector = SourceSelector()
+    selector.record('https://slow.example/a.zip', 0.1, 10 * MB, 10.0)
+    selector.record('https://fast.example/a.zip', 0.1, 10 * MB, 1.0)
+    assert selector.rank(['https://slow.example/a.zip', 'https://fast.example/a.zip'], 10 * MB) == [
+        'https://fast.example/a.zip', 'https://slow.example/a.zip'
+    ]
+
+
+def test_recent_failure_goes_last_and_success_clears_it():
+    selector = SourceSelector()
+    urls = ['https://a.example/x.zip', 'https://b.example/x.zip']
+    selector.failure(urls[0])
+    assert selector.rank(urls) == urls[::-1]
+    selector.record(urls[0], 0.1, MB, 1.0)
+    assert selector.rank(urls)[0] == urls[0]
+
+
+def test_unknown_sources_keep_their_order_and_duplicates_are_dropped():
+    selector = SourceSelector()
+    urls = ['https://a.example/x.zip', 'https://b.example/x.zip', 'https://a.example/x.zip']
+    assert selector.rank(urls) == urls[:2]
+
+
+def test_capped_transfers_only_record_latency():
+    selector = SourceSelector()
+    selector.record('https://a.example/x.zip', 0.2, 10 * MB)
+    stats = selector.stats['a.example']
+    assert stats['latency'] == 0.2
+    assert stats['throughput'] is None
+    assert stats['downloads'] == 1
+
+
+def test_tiny_files_dont_set_throughput():
+    selector = SourceSelector()
+    selector.record('https://a.example/x.zip', 0.2, DOWNLOAD_CHUNK_SIZE - 1, 0.001)
+    assert selector.stats['a.example']['throughput'] is None
+
+
+def test_thunderstore_download_urls_are_parsed():
+    assert parse_thunderstore_download_url('https://thunderstore.io/package/download/Owner/Name/1.2.3/') == ('Owner', 'Name', '1.2.3')
+    assert parse_thunderstore_download_url('https://example.com/file.zip') is None
@@ -1,12 +1,23 @@
 # standard library imports :3
+import asyncio
+import bisect
+import collections
+import concurrent.futures
+import difflib
+import hashlib
+import heapq
 import html.parser
+import http.server
+import ipaddress
 import json
 import os
 import stat
 import platform
 import queue
+import random
 import re
 import shutil
+import socket
 import subprocess
 import sys
 import threading
@@ -14,12 +25,14 @@ import time
 import traceback
 import webbrowser
 import zipfile
-from urllib.parse import urlparse
+from urllib.parse import urlparse, quote, unquote
+from email.utils import parsedate_to_datetime
 import argparse
 from packaging import version
 from datetime import datetime, timezone
 import logging
 import uuid
+import weakref
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, simpledialog
 
@@ -97,6 +110,2156 @@ def get_version():
             logging.info(f"Error reading version file: {e}")
             return 'Unknown'
 
+# how many ranked results fuzzy search keeps :3
+FUZZY_RESULT_LIMIT = 100
+
+# splits text into lowercase search tokens, underscores count as spaces :3
+def tokenize_search_text(text):
+    return re.findall(r'[^\W_]+', (text or '').lower())
+
+# restricted damerau-levenshtein distance that gives up once max_distance is exceeded :3
+# returns max_distance + 1 when the strings are further apart than that :3
+def bounded_edit_distance(a, b, max_distance):
+    if a == b:
+        return 0
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+
+    previous_previous = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        row_min = i
+        char_a = a[i - 1]
+        for j in range(1, len(b) + 1):
+            cost = 0 if char_a == b[j - 1] else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            # swapped neighbouring letters only cost one edit :3
+            if previous_previous is not None and j > 1 and char_a == b[j - 2] and a[i - 2] == b[j - 1]:
+                value = min(value, previous_previous[j - 2] + 1)
+            current[j] = value
+            if value < row_min:
+                row_min = value
+        if row_min > max_distance:
+            return max_distance + 1
+        previous_previous, previous = previous, current
+    return min(previous[len(b)], max_distance + 1)
+
+# typo tolerant search index built from precomputed n-gram signatures :3
+# candidates come from the n-gram postings, get scored with a bounded edit distance and only the best k are kept on a heap :3
+class FuzzySearchIndex:
+    def __init__(self, ngram_size=3):
+        self.ngram_size = ngram_size
+        self.documents = {}  # key -> (token weights, n-gram signature) :3
+        self.postings = {}  # n-gram -> keys of documents containing it :3
+        self.initials = {}  # first letter of a token -> keys, for queries too short to have n-grams :3
+        self.vocabulary = {}  # token -> how many documents contain it :3
+        self.sequence = 0
+
+    def __len__(self):
+        return len(self.documents)
+
+    def __contains__(self, key):
+        return key in self.documents
+
+    # n-grams of a token padded with $ on both sides, or only the front when matching prefixes :3
+    def _ngrams(self, token, pad_end=True):
+        padded = f"${token}$" if pad_end else f"${token}"
+        if len(padded) <= self.ngram_size:
+            return {padded}
+        return {padded[i:i + self.ngram_size] for i in range(len(padded) - self.ngram_size + 1)}
+
+    # how many typos a query token may contain and still match :3
+    @staticmethod
+    def max_typos(token):
+        if len(token) <= 2:
+            return 0
+        if len(token) <= 4:
+            return 1
+        return 2
+
+    # adds or replaces a document, fields is a list of (text, weight) pairs :3
+    def add(self, key, fields):
+        if key in self.documents:
+            self.remove(key)
+
+        tokens = {}
+        for text, weight in fields:
+            for token in tokenize_search_text(text):
+                if weight > tokens.get(token, 0):
+                    tokens[token] = weight
+
+        signature = set()
+        for token in tokens:
+            signature |= self._ngrams(token)
+
+        self.documents[key] = (tokens, signature)
+        for gram in signature:
+            self.postings.setdefault(gram, set()).add(key)
+        for initial in {token[0] for token in tokens}:
+            self.initials.setdefault(initial, set()).add(key)
+        for token in tokens:
+            self.vocabulary[token] = self.vocabulary.get(token, 0) + 1
+
+    def remove(self, key):
+        document = self.documents.pop(key, None)
+        if not document:
+            return
+        for gram in document[1]:
+            keys = self.postings.get(gram)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.postings[gram]
+        for initial in {token[0] for token in document[0]}:
+            keys = self.initials.get(initial)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.initials[initial]
+        for token in document[0]:
+            if self.vocabulary.get(token, 0) <= 1:
+                self.vocabulary.pop(token, None)
+            else:
+                self.vocabulary[token] -= 1
+
+    def clear(self):
+        self.documents.clear()
+        self.postings.clear()
+        self.initials.clear()
+        self.vocabulary.clear()
+
+    # finds documents sharing enough n-grams with every query token :3
+    def candidates(self, query_tokens):
+        result = None
+        for token in query_tokens:
+            grams = self._ngrams(token, pad_end=False)
+            if len(token) < self.ngram_size - 1:
+                # single characters have no useful n-grams and can only match as a prefix :3
+                matched = set(self.initials.get(token[0], ()))
+            else:
+                counts = {}
+                for gram in grams:
+                    for key in self.postings.get(gram, ()):
+                        counts[key] = counts.get(key, 0) + 1
+                # every edit can destroy at most ngram_size n-grams :3
+                needed = max(1, len(grams) - self.ngram_size * self.max_typos(token))
+                matched = {key for key, count in counts.items() if count >= needed}
+            result = matched if result is None else result & matched
+            if not result:
+                return set()
+        return result or set()
+
+    # scores a document against the query, None if any query token has no close enough match :3
+    def score(self, query_tokens, key):
+        tokens = self.documents[key][0]
+        total = 0.0
+        for query_token in query_tokens:
+            bound = self.max_typos(query_token)
+            best = 0.0
+            # exact and prefix matches are cheap, a fuzzy match can never score above 0.8 so skip it if we beat that :3
+            for token, weight in tokens.items():
+                if token == query_token:
+                    best = max(best, weight)
+                elif token.startswith(query_token):
+                    best = max(best, 0.9 * weight)
+            if best >= 0.8:
+                total += best
+                continue
+            for token, weight in tokens.items():
+                if token.startswith(query_token):
+                    continue
+                distance = bounded_edit_distance(query_token, token, bound)
+                if distance <= bound:
+                    similarity = 0.8 - 0.15 * distance
+                elif len(token) > len(query_token):
+                    # allow typos in a prefix that is still being typed :3
+                    distance = bounded_edit_distance(query_token, token[:len(query_token)], bound)
+                    if distance > bound:
+                        continue
+                    similarity = 0.7 - 0.15 * distance
+                else:
+                    continue
+                best = max(best, similarity * weight)
+            if not best:
+                return None
+            total += best
+        return total / len(query_tokens)
+
+    # returns up to limit (key, score) pairs, best first, optionally restricted to allowed keys :3
+    def search(self, query, limit=FUZZY_RESULT_LIMIT, allowed=None):
+        query_tokens = tokenize_search_text(query)
+        if not query_tokens or limit <= 0:
+            return []
+
+        candidates = self.candidates(query_tokens)
+        if allowed is not None:
+            candidates &= allowed
+
+        # best score any document could reach (field weights are at most 1.0), once the heap is full of those we can stop :3
+        ceiling = sum(1.0 if token in self.vocabulary else 0.9 for token in query_tokens) / len(query_tokens)
+
+        heap = []
+        for key in candidates:
+            if len(heap) >= limit and heap[0][0] >= ceiling:
+                break
+            score = self.score(query_tokens, key)
+            if score is None:
+                continue
+            self.sequence += 1
+            entry = (score, -self.sequence, key)
+            if len(heap) < limit:
+                heapq.heappush(heap, entry)
+            elif entry > heap[0]:
+                heapq.heapreplace(heap, entry)
+
+        return [(key, score) for score, _, key in sorted(heap, reverse=True)]
+
+# field names (and aliases) the structured search understands :3
+SEARCH_KEYWORD_FIELDS = {
+    'author': 'author', 'by': 'author', 'owner': 'author',
+    'category': 'category', 'cat': 'category',
+    'id': 'id',
+    'is': 'is'
+}
+SEARCH_NUMERIC_FIELDS = {
+    'downloads': 'downloads', 'dl': 'downloads',
+    'likes': 'likes', 'rating': 'likes',
+    'updated': 'updated'
+}
+SEARCH_FLAGS = {'deprecated', 'nsfw', 'modpack', 'enabled', 'disabled', 'thirdparty'}
+SEARCH_DURATION_UNITS = {'h': 3600, 'd': 86400, 'w': 604800, 'm': 2592000, 'y': 31536000}
+SEARCH_TERM_PATTERN = re.compile(r'(-?)([a-z]+)(:|>=|<=|>|<|=)("[^"]*"|\S+)$', re.IGNORECASE)
+SEARCH_SPLIT_PATTERN = re.compile(r'-?[a-zA-Z]+(?::|>=|<=|>|<|=)"[^"]*"|\S+')
+
+# a parsed search box query, predicates are (field, operator, value, negated) :3
+class SearchQuery:
+    def __init__(self, text='', predicates=None, excluded=None):
+        self.text = text
+        self.predicates = predicates or []
+        self.excluded = excluded or []  # -word terms that aren't flags :3
+
+    @property
+    def structured(self):
+        return bool(self.predicates or self.excluded)
+
+# turns "updated<30d" style values into a unix timestamp, flipping the operator for relative ages :3
+def parse_search_time(value, operator):
+    match = re.fullmatch(r'(\d+(?:\.\d+)?)([hdwmy])', value.lower())
+    if match:
+        age = float(match.group(1)) * SEARCH_DURATION_UNITS[match.group(2)]
+        flipped = {'<': '>', '>': '<', '<=': '>=', '>=': '<=', '=': '>='}
+        return time.time() - age, flipped.get(operator, operator)
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp(), operator
+
+# converts a "10k" / "1.5m" / "2500" count into a number :3
+def parse_search_count(value):
+    match = re.fullmatch(r'(\d+(?:\.\d+)?)([km]?)', value.lower())
+    if not match:
+        raise ValueError(f"Invalid number: {value}")
+    return float(match.group(1)) * {'': 1, 'k': 1000, 'm': 1000000}[match.group(2)]
+
+# splits a search box string into predicates and free text, anything that doesn't parse stays free text :3
+def parse_search_query(query, flags=SEARCH_FLAGS):
+    predicates = []
+    excluded = []
+    text_parts = []
+    for part in SEARCH_SPLIT_PATTERN.findall(query or ''):
+        # -deprecated is shorthand for -is:deprecated :3
+        if part.startswith('-') and part[1:].lower() in flags:
+            predicates.append(('is', '=', part[1:].lower(), True))
+            continue
+
+        match = SEARCH_TERM_PATTERN.match(part)
+        if match:
+            negated, field, operator, value = match.groups()
+            field = field.lower()
+            value = value.strip('"')
+            try:
+                if field in SEARCH_KEYWORD_FIELDS and operator in (':', '='):
+                    predicates.append((SEARCH_KEYWORD_FIELDS[field], '=', value.lower(), bool(negated)))
+                    continue
+                if field in SEARCH_NUMERIC_FIELDS:
+                    field = SEARCH_NUMERIC_FIELDS[field]
+                    operator = '=' if operator == ':' else operator
+                    if field == 'updated':
+                        number, operator = parse_search_time(value, operator)
+                    else:
+                        number = parse_search_count(value)
+                    predicates.append((field, operator, number, bool(negated)))
+                    continue
+            except ValueError:
+                pass
+
+        if part.startswith('-') and len(part) > 1:
+            excluded.append(part[1:].lower())
+        else:
+            text_parts.append(part)
+
+    return SearchQuery(' '.join(text_parts), predicates, excluded)
+
+# precomputed columns over a mod list so structured queries become set lookups and range scans :3
+# keyword fields map value -> keys, numeric fields are kept sorted so ranges are found with bisect :3
+class ModQueryIndex:
+    def __init__(self):
+        self.rows = {}  # key -> mod, in insertion order :3
+        self.positions = {}
+        self.keywords = {field: {} for field in set(SEARCH_KEYWORD_FIELDS.values())}
+        self.numeric = {field: ([], []) for field in set(SEARCH_NUMERIC_FIELDS.values())}  # (sorted values, keys) :3
+
+    def __len__(self):
+        return len(self.rows)
+
+    # builds every column in one pass, extract(mod) returns (keywords by field, numbers by field) :3
+    def build(self, items, extract):
+        self.rows.clear()
+        self.positions.clear()
+        for postings in self.keywords.values():
+            postings.clear()
+        columns = {field: [] for field in self.numeric}
+
+        for key, mod in items:
+            self.positions[key] = len(self.rows)
+            self.rows[key] = mod
+            keywords, numbers = extract(mod)
+            for field, values in keywords.items():
+                for value in values:
+                    if value:
+                        self.keywords[field].setdefault(str(value).lower(), set()).add(key)
+            for field, number in numbers.items():
+                if number is not None:
+                    columns[field].append((number, self.positions[key], key))
+
+        for field, column in columns.items():
+            column.sort()
+            self.numeric[field] = ([number for number, _, _ in column], [key for _, _, key in column])
+
+    # the bisect slice of a numeric column matching operator/value :3
+    def _range(self, field, operator, value):
+        values = self.numeric[field][0]
+        if operator == '>':
+            return bisect.bisect_right(values, value), len(values)
+        if operator == '>=':
+            return bisect.bisect_left(values, value), len(values)
+        if operator == '<':
+            return 0, bisect.bisect_left(values, value)
+        if operator == '<=':
+            return 0, bisect.bisect_right(values, value)
+        return bisect.bisect_left(values, value), bisect.bisect_right(values, value)
+
+    # how many rows a predicate matches, used to order the plan :3
+    def estimate(self, predicate):
+        field, operator, value, _ = predicate
+        if field in self.keywords:
+            return len(self.keywords[field].get(value, ()))
+        start, end = self._range(field, operator, value)
+        return max(0, end - start)
+
+    def lookup(self, predicate):
+        field, operator, value, _ = predicate
+        if field in self.keywords:
+            return self.keywords[field].get(value, set())
+        start, end = self._range(field, operator, value)
+        return set(self.numeric[field][1][start:end])
+
+    # positive predicates run smallest first so the running intersection stays small, negated ones are subtracted after :3
+    def plan(self, query):
+        positive = sorted((p for p in query.predicates if not p[3]), key=self.estimate)
+        negative = sorted((p for p in query.predicates if p[3]), key=self.estimate, reverse=True)
+        return positive, negative
+
+    # returns the matching rows in insertion order :3
+    def execute(self, query, text_fields=('title', 'author', 'description')):
+        positive, negative = self.plan(query)
+        logging.debug(f"Query plan: {[(p, self.estimate(p)) for p in positive + negative]}")
+
+        matched = None
+        for predicate in positive:
+            keys = self.lookup(predicate)
+            matched = set(keys) if matched is None else matched & keys
+            if not matched:
+                return []
+        if matched is None:
+            matched = set(self.rows)
+        for predicate in negative:
+            matched -= self.lookup(predicate)
+
+        # -word exclusions only have to look at what's left :3
+        for word in query.excluded:
+            matched = {
+                key for key in matched
+                if not any(word in str(self.rows[key].get(field, '')).lower() for field in text_fields)
+            }
+
+        return [self.rows[key] for key in sorted(matched, key=self.positions.__getitem__)]
+
+# unix timestamp for the iso or epoch dates stored on mods, None when missing :3
+def parse_mod_timestamp(value):
+    if not value:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return datetime.fromisoformat(str(value).replace('Z', '+00:00')).timestamp()
+    except ValueError:
+        return None
+
+# how long after the window is created the mod data starts loading, so the first frame gets drawn first :3
+STARTUP_DEFER_MS = 50
+
+# how often queued ui updates get flushed, in milliseconds (about one frame) :3
+UI_FRAME_INTERVAL = 16
+
+# collects widget updates from any thread and applies them on the tk thread once per frame :3
+# updates sharing a slot replace each other so only the newest status text or progress value gets drawn :3
+# workers only ever touch the pending dict, a recurring after loop owned by the tk thread drains it :3
+class UIUpdateBatcher:
+    def __init__(self, root, interval=UI_FRAME_INTERVAL):
+        self.root = root
+        self.interval = interval
+        self.lock = threading.Lock()
+        self.pending = {}  # slot -> (callback, args), in the order they should run :3
+        self.sequence = 0
+        self._tick()  # must be constructed on the tk thread :3
+
+    # queues an update that replaces any earlier one in the same slot :3
+    def set(self, slot, callback, *args):
+        with self.lock:
+            self.pending.pop(slot, None)
+            self.pending[slot] = (callback, args)
+
+    # queues an update that always runs, in order with everything else :3
+    def call(self, callback, *args):
+        with self.lock:
+            self.sequence += 1
+            self.pending[('call', self.sequence)] = (callback, args)
+
+    def _tick(self):
+        try:
+            self.flush()
+        finally:
+            self.root.after(self.interval, self._tick)
+
+    def flush(self):
+        with self.lock:
+            if not self.pending:
+                return
+            pending = self.pending
+            self.pending = {}
+        for callback, args in pending.values():
+            try:
+                callback(*args)
+            except Exception as e:
+                logging.error(f"Queued UI update failed: {e}")
+
+# upper edges of the latency histogram buckets in milliseconds, the last bucket catches everything slower :3
+LATENCY_BUCKETS_MS = (8, 16, 33, 50, 100, 200, 500)
+# how many samples of one interaction get collected between debug log summaries :3
+LATENCY_LOG_EVERY = 50
+
+# measures how long it takes from a tk event to the redraw that follows it :3
+# the finish callback is queued behind a second after_idle so it runs after the redraws the handler scheduled :3
+class LatencyTracker:
+    def __init__(self, root, enabled=False):
+        self.root = root
+        self.enabled = enabled
+        self.stats = {}  # interaction -> {'buckets', 'samples', 'count', 'total', 'max'} :3
+
+    # call at the very start of handling an event :3
+    def track(self, name):
+        if not self.enabled:
+            return
+        start = time.perf_counter()
+        self.root.after_idle(lambda: self.root.after_idle(lambda: self.record(name, (time.perf_counter() - start) * 1000)))
+
+    def record(self, name, elapsed):
+        stats = self.stats.get(name)
+        if stats is None:
+            stats = self.stats[name] = {
+                'buckets': [0] * (len(LATENCY_BUCKETS_MS) + 1),
+                'samples': collections.deque(maxlen=500),
+                'count': 0,
+                'total': 0.0,
+                'max': 0.0
+            }
+        stats['buckets'][bisect.bisect_left(LATENCY_BUCKETS_MS, elapsed)] += 1
+        stats['samples'].append(elapsed)
+        stats['count'] += 1
+        stats['total'] += elapsed
+        stats['max'] = max(stats['max'], elapsed)
+
+        if stats['count'] % LATENCY_LOG_EVERY == 0:
+            logging.debug(f"UI latency: {self.format_stats(name)}")
+
+    def reset(self):
+        self.stats.clear()
+
+    @staticmethod
+    def percentile(samples, fraction):
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+    # one line summary plus histogram for an interaction :3
+    def format_stats(self, name):
+        stats = self.stats[name]
+        samples = stats['samples']
+        labels = [f"<{edge}ms" for edge in LATENCY_BUCKETS_MS] + [f">={LATENCY_BUCKETS_MS[-1]}ms"]
+        histogram = " ".join(f"{label}:{count}" for label, count in zip(labels, stats['buckets']))
+        return (
+            f"{name}: n={stats['count']} mean={stats['total'] / stats['count']:.1f}ms "
+            f"p50={self.percentile(samples, 0.5):.1f}ms p95={self.percentile(samples, 0.95):.1f}ms "
+            f"max={stats['max']:.1f}ms | {histogram}"
+        )
+
+# mods bigger than this (50MB) get a warning before they finish downloading :3
+LARGE_MOD_SIZE = 52428800
+# bytes read per chunk while streaming a download to disk :3
+DOWNLOAD_CHUNK_SIZE = 65536
+# seconds between interrupt checks while waiting for another stream to let go of a partial download :3
+PARTIAL_LOCK_POLL = 0.25
+
+# default size cap for the downloaded archive cache (1GB) :3
+ARCHIVE_CACHE_LIMIT = 1024 * 1024 * 1024
+# unfinished downloads older than this (seconds) are dropped at startup instead of resumed :3
+PARTIAL_DOWNLOAD_MAX_AGE = 7 * 24 * 60 * 60
+
+# sha256 of a file, read in chunks so big archives don't sit in memory :3
+def hash_file(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+# extracts every member of an open zip, hashing each file as it's written instead of reading it back afterwards :3
+# returns {member path: sha256}, on_progress(done, total) gets the uncompressed bytes written so far :3
+def extract_zip_with_digests(zip_ref, destination, on_progress=None):
+    members = zip_ref.infolist()
+    total = sum(member.file_size for member in members)
+    root = os.path.realpath(destination)
+    digests = {}
+    done = 0
+    if on_progress:
+        on_progress(done, total)
+    for member in members:
+        target = os.path.realpath(os.path.join(root, member.filename))
+        if os.path.commonpath([root, target]) != root:
+            raise ValueError(f"Archive entry {member.filename} points outside the mod folder")
+        if member.is_dir():
+            os.makedirs(target, exist_ok=True)
+            continue
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        digest = hashlib.sha256()
+        with zip_ref.open(member) as source, open(target, 'wb') as f:
+            for chunk in iter(lambda: source.read(DOWNLOAD_CHUNK_SIZE), b''):
+                digest.update(chunk)
+                f.write(chunk)
+        digests[member.filename.replace('\\', '/')] = digest.hexdigest()
+        done += member.file_size
+        if on_progress:
+            on_progress(done, total)
+    return digests
+
+# content addressed cache of downloaded mod archives, keyed by thunderstore full_name and version :3
+# blobs are stored by their sha256 and checked against it before use, least recently used ones go first when over the cap :3
+class ArchiveCache:
+    def __init__(self, cache_dir, max_bytes=ARCHIVE_CACHE_LIMIT):
+        self.cache_dir = cache_dir
+        self.index_path = os.path.join(cache_dir, 'index.json')
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.entries = collections.OrderedDict()  # key -> {'sha256', 'size', 'last_used'}, least recently used first :3
+        self.blob_refs = collections.Counter()  # sha256 -> how many keys point at that blob :3
+        self.blob_bytes = 0  # running total of the blobs on disk, blobs shared by several keys only count once :3
+        self.pinned = collections.Counter()  # sha256 -> gets reading that blob right now, its file outlives an eviction until they finish :3
+        self.orphaned = set()  # pinned blobs that were dropped from the index while being read :3
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.partial_bytes = 0  # unfinished downloads share the cache's space budget :3
+        os.makedirs(cache_dir, exist_ok=True)
+        self.load()
+
+    # keys on the version in the thunderstore download url when there is one, the url is what actually gets fetched :3
+    @staticmethod
+    def make_key(mod):
+        if package := parse_thunderstore_download_url(mod.get('download')):
+            return "-".join(package)
+        if mod.get('thunderstore_id') and mod.get('version'):
+            return f"{mod['thunderstore_id']}-{mod['version']}"
+        return None
+
+    def blob_path(self, sha256):
+        return os.path.join(self.cache_dir, f"{sha256}.zip")
+
+    def load(self):
+        try:
+            with open(self.index_path, 'r') as f:
+                data = json.load(f)
+            entries = sorted(data.get('entries', {}).items(), key=lambda item: item[1].get('last_used', 0))
+            self.hits = data.get('hits', 0)
+            self.misses = data.get('misses', 0)
+            self.evictions = data.get('evictions', 0)
+        except (OSError, ValueError):
+            entries = []
+        self.entries = collections.OrderedDict()
+        self.blob_refs.clear()
+        self.blob_bytes = 0
+        for key, entry in entries:
+            self._add_entry(key, entry)
+
+    def save(self):
+        try:
+            with open(self.index_path, 'w') as f:
+                json.dump({
+                    'entries': self.entries,
+                    'hits': self.hits,
+                    'misses': self.misses,
+                    'evictions': self.evictions
+                }, f)
+        except OSError as e:
+            logging.error(f"Failed to save archive cache index: {e}")
+
+    def total_size(self):
+        return self.blob_bytes
+
+    # copies the cached archive for key to destination and returns its sha256, None on a miss or if the blob fails its hash check :3
+    def get(self, key, destination):
+        with self.lock:
+            entry = self.entries.get(key)
+            if not entry:
+                # only counted, the index gets written with the counters the next time an entry changes :3
+                self.misses += 1
+                return None
+            sha256 = entry['sha256']
+            path = self.blob_path(sha256)
+            self.pinned[sha256] += 1
+
+        try:
+            valid = os.path.exists(path) and hash_file(path) == sha256
+            if valid:
+                shutil.copyfile(path, destination)
+            failed = None
+        except OSError as e:
+            valid = False
+            failed = e
+
+        with self.lock:
+            self._unpin(sha256)
+            current = self.entries.get(key) is entry  # put() may have replaced or evicted it meanwhile :3
+            if valid:
+                self.hits += 1
+                if current:
+                    entry['last_used'] = time.time()
+                    self.entries.move_to_end(key)
+            else:
+                self.misses += 1
+                if failed:
+                    logging.warning(f"Couldn't read the cached archive for {key}: {failed}")
+                elif current:
+                    logging.warning(f"Cached archive for {key} is missing or corrupt, dropping it")
+                    self._remove_entry(key)
+            self.save()
+        return sha256 if valid else None
+
+    # stores a downloaded archive under key, returns its sha256 :3
+    def put(self, key, source, sha256=None):
+        sha256 = sha256 or hash_file(source)
+        size = os.path.getsize(source)
+        if size > self.max_bytes:
+            return sha256
+
+        path = self.blob_path(sha256)
+        if not os.path.exists(path):
+            temp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+            shutil.copyfile(source, temp_path)
+            os.replace(temp_path, path)
+
+        with self.lock:
+            self._remove_entry(key, keep_blob=sha256)
+            self._add_entry(key, {'sha256': sha256, 'size': size, 'last_used': time.time()})
+            self._evict()
+            self.save()
+        return sha256
+
+    # (blob path, sha256, size) for a key without copying or counting it, used when serving peers :3
+    def lookup(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if not entry:
+                return None
+            path = self.blob_path(entry['sha256'])
+            if not os.path.exists(path):
+                return None
+            return path, entry['sha256'], entry['size']
+
+    def set_limit(self, max_bytes):
+        with self.lock:
+            self.max_bytes = max_bytes
+            self._evict()
+            self.save()
+
+    # how much the unfinished downloads take up, archives get evicted to keep both under the cap :3
+    def set_partial_size(self, size):
+        with self.lock:
+            self.partial_bytes = size
+            self._evict()
+            self.save()
+
+    def clear(self):
+        with self.lock:
+            for key in list(self.entries):
+                self._remove_entry(key)
+            self.save()
+
+    def stats(self):
+        with self.lock:
+            return {
+                'entries': len(self.entries),
+                'size': self.total_size(),
+                'partial_size': self.partial_bytes,
+                'limit': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions
+            }
+
+    def _evict(self):
+        while self.entries and self.blob_bytes + self.partial_bytes > self.max_bytes:
+            key = next(iter(self.entries))
+            self._remove_entry(key)
+            self.evictions += 1
+            logging.info(f"Evicted {key} from the archive cache")
+
+    # the helpers below are called with the lock held and keep blob_refs and blob_bytes in step with entries :3
+    def _add_entry(self, key, entry):
+        self.entries[key] = entry
+        if not self.blob_refs[entry['sha256']]:
+            self.blob_bytes += entry['size']
+        self.blob_refs[entry['sha256']] += 1
+
+    # drops key, and its blob once nothing else uses it, unless it's keep_blob which is about to be referenced again :3
+    def _remove_entry(self, key, keep_blob=None):
+        entry = self.entries.pop(key, None)
+        if not entry:
+            return
+        sha256 = entry['sha256']
+        self.blob_refs[sha256] -= 1
+        if self.blob_refs[sha256] > 0:
+            return
+        del self.blob_refs[sha256]
+        self.blob_bytes -= entry['size']
+        if sha256 == keep_blob:
+            return
+        if self.pinned[sha256]:
+            self.orphaned.add(sha256)
+            return
+        self._remove_blob(sha256)
+
+    def _unpin(self, sha256):
+        self.pinned[sha256] -= 1
+        if self.pinned[sha256] > 0:
+            return
+        del self.pinned[sha256]
+        if sha256 in self.orphaned:
+            self.orphaned.discard(sha256)
+            if not self.blob_refs[sha256]:
+                self._remove_blob(sha256)
+
+    def _remove_blob(self, sha256):
+        path = self.blob_path(sha256)
+        if os.path.exists(path):
+            os.remove(path)
+
+# lan mod sharing: archives are served over http and peers find each other with a udp broadcast :3
+PEER_HTTP_PORT = 47320
+PEER_DISCOVERY_PORT = 47321
+PEER_DISCOVERY_MESSAGE = b"HLS-PEER-DISCOVER"
+# how long to listen for answers to a discovery broadcast, and how long the answers are trusted :3
+PEER_DISCOVERY_WAIT = 1.0
+PEER_REFRESH_SECONDS = 60
+# peers are on the lan, so give up on them quickly and fall back to thunderstore :3
+PEER_TIMEOUT = (2, 10)
+
+# address of the interface the lan route goes out of, so sharing isn't exposed on every interface :3
+# connecting a udp socket sends nothing, it only picks the route :3
+def get_lan_address():
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            sock.connect(('10.255.255.255', 1))
+            address = sock.getsockname()[0]
+    except OSError:
+        return None
+    return address if is_lan_address(address) else None
+
+def is_lan_address(address):
+    try:
+        parsed = ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    return parsed.is_private and not parsed.is_loopback
+
+# shares the local archive cache with other machines on the lan and fetches from theirs :3
+# peers are only fetched from if the user listed them or chose to trust the ones found by broadcast :3
+# when we already know an archive's sha256 (from an earlier install of that version) the download has to match it,
+# otherwise the X-Archive-SHA256 header only guards against a broken transfer from a peer the user trusts :3
+class PeerCache:
+    def __init__(self, cache, http_client, port=PEER_HTTP_PORT):
+        self.cache = cache
+        self.http = http_client
+        self.port = port
+        self.instance_id = uuid.uuid4().hex
+        self.lock = threading.Lock()
+        self.server = None
+        self.discovery_socket = None
+        self.use_peers = False
+        self.trust_discovered = False  # discovered peers are only used when the user opted in :3
+        self.accept_unverified = False  # configured peers may send a version we have no digest for yet, discovered ones never can :3
+        self.static_peers = []  # "host:port" strings from the settings :3
+        self.discovered = []
+        self.discovered_at = 0
+        self.hits = 0
+
+    # starts serving our cache, the http server and the discovery responder both run on daemon threads :3
+    def start_server(self):
+        if self.server:
+            return
+        cache = self.cache
+
+        class ArchiveHandler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                if not self.path.startswith('/archive/'):
+                    self.send_error(404)
+                    return
+                entry = cache.lookup(unquote(self.path[len('/archive/'):]))
+                if not entry:
+                    self.send_error(404)
+                    return
+                path, sha256, size = entry
+                try:
+                    with open(path, 'rb') as f:
+                        self.send_response(200)
+                        self.send_header('Content-Type', 'application/zip')
+                        self.send_header('Content-Length', str(size))
+                        self.send_header('X-Archive-SHA256', sha256)
+                        self.end_headers()
+                        shutil.copyfileobj(f, self.wfile, DOWNLOAD_CHUNK_SIZE)
+                except OSError:
+                    pass
+
+            def log_message(self, format, *args):
+                logging.debug(f"Peer cache: {self.address_string()} {format % args}")
+
+        lan_address = get_lan_address()
+        if not lan_address:
+            raise OSError("No local network address to share on")
+        self.server = http.server.ThreadingHTTPServer((lan_address, self.port), ArchiveHandler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+        self.discovery_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.discovery_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.discovery_socket.bind(('', PEER_DISCOVERY_PORT))
+        threading.Thread(target=self._answer_discovery, args=(self.discovery_socket,), daemon=True).start()
+        logging.info(f"Sharing cached mods on {lan_address}:{self.port}")
+
+    def stop_server(self):
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+        if self.discovery_socket:
+            self.discovery_socket.close()
+            self.discovery_socket = None
+
+    def _answer_discovery(self, sock):
+        while True:
+            try:
+                message, address = sock.recvfrom(512)
+            except OSError:
+                return  # socket closed by stop_server :3
+            # the responder has to listen on every interface to hear broadcasts, but only answers the lan :3
+            if message == PEER_DISCOVERY_MESSAGE and is_lan_address(address[0]):
+                sock.sendto(f"HLS-PEER {self.instance_id} {self.port}".encode(), address)
+
+    # configured peers first, then whatever answered the last broadcast if those are trusted :3
+    def peers(self):
+        with self.lock:
+            if not self.trust_discovered:
+                return list(self.static_peers)
+            if time.time() - self.discovered_at > PEER_REFRESH_SECONDS:
+                self.discovered = self._discover()
+                self.discovered_at = time.time()
+            return self.static_peers + [peer for peer in self.discovered if peer not in self.static_peers]
+
+    def _discover(self):
+        found = []
+        try:
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+                sock.settimeout(PEER_DISCOVERY_WAIT)
+                sock.sendto(PEER_DISCOVERY_MESSAGE, ('<broadcast>', PEER_DISCOVERY_PORT))
+                deadline = time.monotonic() + PEER_DISCOVERY_WAIT
+                while time.monotonic() < deadline:
+                    try:
+                        reply, address = sock.recvfrom(512)
+                    except socket.timeout:
+                        break
+                    parts = reply.decode(errors='ignore').split()
+                    if (len(parts) == 3 and parts[0] == "HLS-PEER" and parts[1] != self.instance_id
+                            and parts[2].isdigit() and is_lan_address(address[0])):
+                        found.append(f"{address[0]}:{parts[2]}")
+        except OSError as e:
+            logging.info(f"Peer discovery failed: {e}")
+        if found:
+            logging.info(f"Found mod sharing peers: {', '.join(found)}")
+        return found
+
+    # tries each peer for key, streaming into destination, returns the verified sha256 or None :3
+    # expected_sha256 is a digest we recorded ourselves, a peer sending anything else is ignored :3
+    # without one only configured peers are asked and only if accept_unverified is on, their own header is all there is to check :3
+    # on_size(total) runs before any bytes are written and can raise to refuse the archive, throttle(amount) runs for every chunk :3
+    def fetch(self, key, destination, on_progress=None, expected_sha256=None, throttle=None, on_size=None):
+        if not self.use_peers:
+            return None
+        peers = self.peers()
+        if not expected_sha256:
+            if not self.accept_unverified:
+                return None
+            peers = [peer for peer in peers if peer in self.static_peers]
+        for peer in peers:
+            try:
+                if throttle:
+                    throttle(0)
+                with self.http.get(f"http://{peer}/archive/{quote(key, safe='')}", stream=True, timeout=PEER_TIMEOUT) as response:
+                    if response.status_code != 200:
+                        continue
+                    expected = expected_sha256 or response.headers.get('X-Archive-SHA256', '')
+                    total = int(response.headers.get('Content-Length', 0))
+                    if on_size:
+                        on_size(total)
+                    digest = hashlib.sha256()
+                    done = 0
+                    with open(destination, 'wb') as f:
+                        for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                            if throttle:
+                                throttle(len(chunk))
+                            f.write(chunk)
+                            digest.update(chunk)
+                            done += len(chunk)
+                            if on_progress:
+                                on_progress(done, total)
+                if not expected or digest.hexdigest() != expected:
+                    logging.warning(f"Archive {key} from peer {peer} failed its hash check")
+                    continue
+                self.hits += 1
+                logging.info(f"Fetched {key} from peer {peer}")
+                return expected
+            except (requests.RequestException, OSError) as e:
+                logging.info(f"Peer {peer} couldn't provide {key}: {e}")
+        if os.path.exists(destination):
+            os.remove(destination)
+        return None
+
+# how many mods download and install at the same time by default, and the most the setting allows :3
+DEFAULT_INSTALL_WORKERS = 3
+MAX_INSTALL_WORKERS = 8
+# how many downloaded archives get extracted and copied into place at once, and how many can wait for that :3
+DEFAULT_DEPLOY_WORKERS = 2
+MAX_DEPLOY_WORKERS = 4
+DEPLOY_QUEUE_SIZE = 4
+
+# how strongly the smoothed download rate follows the newest sample :3
+PROGRESS_RATE_SMOOTHING = 0.3
+# rate samples closer together than this are merged so tiny chunks don't make it jump around :3
+PROGRESS_SAMPLE_INTERVAL = 0.25
+
+# readable byte counts for the progress panel :3
+def format_bytes(count):
+    for unit in ('B', 'KB', 'MB'):
+        if count < 1024:
+            return f"{count:.0f}{unit}" if unit == 'B' else f"{count:.1f}{unit}"
+        count /= 1024
+    return f"{count:.1f}GB"
+
+# where one install job is at, updated from the worker thread and read by the ui :3
+# rate is the latest sample, smoothed_rate an exponential moving average the eta is based on :3
+class InstallProgress:
+    DOWNLOADING = "Downloading"
+    CACHED = "Cached"
+    DOWNLOADED = "Waiting to extract"
+    EXTRACTING = "Extracting"
+    INSTALLING = "Installing"
+
+    def __init__(self):
+        self.stage = None
+        self.done = 0
+        self.total = 0
+        self.rate = 0.0
+        self.smoothed_rate = 0.0
+        self.eta = None
+        self.sample_time = None
+        self.sample_done = 0
+
+    def update(self, stage, done, total=0):
+        now = time.monotonic()
+        if stage != self.stage:
+            self.stage = stage
+            self.rate = self.smoothed_rate = 0.0
+            self.eta = None
+            self.sample_time, self.sample_done = now, done
+        elif now - self.sample_time >= PROGRESS_SAMPLE_INTERVAL:
+            self.rate = (done - self.sample_done) / (now - self.sample_time)
+            if self.smoothed_rate:
+                self.smoothed_rate += PROGRESS_RATE_SMOOTHING * (self.rate - self.smoothed_rate)
+            else:
+                self.smoothed_rate = self.rate
+            self.sample_time, self.sample_done = now, done
+        self.done = done
+        self.total = total
+        if total and self.smoothed_rate > 0:
+            self.eta = max(0.0, (total - done) / self.smoothed_rate)
+
+    @property
+    def fraction(self):
+        return min(1.0, self.done / self.total) if self.total else 0.0
+
+# raised inside a running job once it's been paused or cancelled, the partial download stays for next time :3
+class InstallInterrupted(Exception):
+    def __init__(self, state):
+        super().__init__(f"Install interrupted ({state})")
+        self.state = state  # what the job becomes: queued, paused or cancelled :3
+
+# one queued mod download/install, future resolves to the installed mod_info :3
+class InstallJob:
+    QUEUED = "Queued"
+    PAUSED = "Paused"
+    RUNNING = "Running"
+    DONE = "Done"
+    FAILED = "Failed"
+    CANCELLED = "Cancelled"
+
+    # lower runs first, dependencies go ahead of the mods that need them :3
+    PRIORITY_DEPENDENCY = 0
+    PRIORITY_NORMAL = 1
+
+    def __init__(self, mod, install=True, priority=PRIORITY_NORMAL, depends_on=(), background=False):
+        self.id = uuid.uuid4().hex
+        self.mod = mod
+        self.key = self.package_key(mod)
+        self.title = mod.get('title', mod.get('id', 'Unknown'))
+        self.install = install
+        self.priority = priority
+        self.depends_on = list(depends_on)
+        self.requests = 1  # how many callers are waiting on this job :3
+        self.background = background  # automatic installs use the background bandwidth cap :3
+        self.progress = InstallProgress()
+        self.state = self.QUEUED
+        self.interrupt = None  # state a running job was asked to stop and become :3
+        self.deploying = False  # downloaded and handed to a later stage, too late to pause or cancel :3
+        self.error = None
+        self.future = concurrent.futures.Future()
+        self.queued_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+
+    # every install of a package ends up in the same mods_dir/<Id> folder, so jobs are deduped on this :3
+    @staticmethod
+    def package_key(mod):
+        return (mod.get('thunderstore_id') or mod.get('id') or mod.get('title', '')).lower()
+
+    @property
+    def finished(self):
+        return self.state in (self.DONE, self.FAILED, self.CANCELLED)
+
+    # queued or paused, either way it hasn't started :3
+    @property
+    def waiting(self):
+        return self.state in (self.QUEUED, self.PAUSED)
+
+    # called between download chunks, stops a running job once pause or cancel has been asked for :3
+    def check_interrupt(self):
+        if self.interrupt:
+            raise InstallInterrupted(self.interrupt)
+
+    # waiting on dependencies that haven't installed yet, ones that failed or were cancelled take this job down with them :3
+    @property
+    def blocked(self):
+        return any(dependency.state != self.DONE for dependency in self.depends_on)
+
+    # depends on target directly or through its dependencies :3
+    def depends_on_job(self, target):
+        pending = [self]
+        seen = set()
+        while pending:
+            job = pending.pop()
+            if job is target:
+                return True
+            if job.id not in seen:
+                seen.add(job.id)
+                pending.extend(job.depends_on)
+        return False
+
+# fixed size pool of worker threads pulling install jobs off a priority queue :3
+# a package only ever has one live job, later requests for it attach to that job instead of installing it twice :3
+# jobs start in (priority, submit order) once their dependencies have finished and no other job is writing the same package :3
+# the worker count can change while running, extra workers exit once they finish their current job :3
+# jobs can be paused, resumed and cancelled one at a time or all together, running ones stop at their next download chunk :3
+class InstallExecutor:
+    def __init__(self, runner, workers=DEFAULT_INSTALL_WORKERS, on_change=None, history=200):
+        self.runner = runner  # runner(job) does the work and returns the result, or a future from a later stage that will :3
+        self.on_change = on_change
+        self.condition = threading.Condition()
+        self.queue = []  # queued jobs in submit order, _next_job picks from these :3
+        self.jobs = collections.OrderedDict()  # id -> job, newest last, finished ones trimmed to history :3
+        self.active = {}  # package key -> newest queued or running job for it :3
+        self.running_keys = set()
+        self.batch = []  # jobs submitted since the queue was last empty, drives the aggregate progress bar :3
+        self.history = history
+        self.workers = max(1, min(MAX_INSTALL_WORKERS, int(workers)))
+        self.thread_count = 0
+        self.in_flight = 0
+        self.paused = False  # the whole queue is paused, nothing new starts :3
+
+    # queues a mod, or hands back the live job for the same package so callers share its future :3
+    # paused jobs sit in the queue without starting until they're resumed :3
+    def submit(self, mod, install=True, priority=InstallJob.PRIORITY_NORMAL, depends_on=(), background=False, paused=False):
+        with self.condition:
+            key = InstallJob.package_key(mod)
+            existing = self.active.get(key)
+            if existing and not existing.finished and existing.interrupt != InstallJob.CANCELLED and (
+                    existing.waiting or existing.mod.get('download') == mod.get('download')):
+                if existing.waiting and existing.mod.get('download') != mod.get('download'):
+                    # still waiting, so it can just install the version asked for last :3
+                    logging.info(f"Install of {existing.title} switched to the most recently requested version")
+                    existing.mod = mod
+                if not paused:
+                    # asked for again, so it's wanted now :3
+                    self._resume(existing)
+                existing.requests += 1
+                existing.install = existing.install or install
+                existing.priority = min(existing.priority, priority)
+                # someone is waiting on it now, so it stops being a background transfer :3
+                existing.background = existing.background and background
+                for dependency in depends_on:
+                    # an edge back to this job would leave both waiting on each other forever :3
+                    if dependency.depends_on_job(existing):
+                        logging.warning(f"Ignoring circular dependency of {existing.title} on {dependency.title}")
+                    elif dependency not in existing.depends_on:
+                        existing.depends_on.append(dependency)
+                logging.info(f"Attached to the pending install of {existing.title}")
+                job = existing
+            else:
+                # a different version of a package that's being written right now waits for it :3
+                job = InstallJob(mod, install, priority, depends_on, background)
+                if paused:
+                    job.state = InstallJob.PAUSED
+                if not self.queue and not self.in_flight:
+                    self.batch = []
+                self.batch.append(job)
+                self.jobs[job.id] = job
+                self.queue.append(job)
+                self.active[key] = job
+                self._trim_history()
+                if self.thread_count < self.workers:
+                    self._start_worker()
+            # a dependency that already failed or was cancelled means this can't install either :3
+            if lost := next((dependency for dependency in job.depends_on
+                             if dependency.finished and dependency.state != InstallJob.DONE), None):
+                self._drop_for_dependency(job, lost)
+            self.condition.notify_all()
+        self._changed()
+        return job
+
+    def set_workers(self, workers):
+        with self.condition:
+            self.workers = max(1, min(MAX_INSTALL_WORKERS, int(workers)))
+            self._wake()
+
+    # cancels a job, a running one stops at its next download chunk, one that's already been handed to the deploy stage can't be :3
+    def cancel(self, job_id):
+        with self.condition:
+            job = self.jobs.get(job_id)
+            if not job or not self._cancel(job):
+                return False
+            self.condition.notify_all()
+        self._changed()
+        return True
+
+    def pause(self, job_id):
+        with self.condition:
+            job = self.jobs.get(job_id)
+            if not job or not self._pause(job, InstallJob.PAUSED):
+                return False
+        self._changed()
+        return True
+
+    def resume(self, job_id):
+        with self.condition:
+            job = self.jobs.get(job_id)
+            if not job or not self._resume(job):
+                return False
+            self._wake()
+        self._changed()
+        return True
+
+    # stops the whole queue, running downloads go back to the queue and pick up from their partial on resume :3
+    def pause_all(self):
+        with self.condition:
+            self.paused = True
+            for job in self.jobs.values():
+                if job.state == InstallJob.RUNNING:
+                    self._pause(job, InstallJob.QUEUED)
+        self._changed()
+
+    def resume_all(self):
+        with self.condition:
+            self.paused = False
+            for job in self.jobs.values():
+                self._resume(job)
+            self._wake()
+        self._changed()
+
+    def cancel_all(self):
+        with self.condition:
+            for job in list(self.jobs.values()):
+                self._cancel(job)
+            self.condition.notify_all()
+        self._changed()
+
+    def clear_finished(self):
+        with self.condition:
+            for job_id in [job_id for job_id, job in self.jobs.items() if job.finished]:
+                del self.jobs[job_id]
+        self._changed()
+
+    def snapshot(self):
+        with self.condition:
+            return list(self.jobs.values())
+
+    def counts(self):
+        with self.condition:
+            return self.in_flight, len(self.queue)
+
+    # something is running or could start right now, bulk installs hold their ui refresh until this goes false :3
+    def busy(self):
+        with self.condition:
+            return bool(self.in_flight) or self._next_job() is not None
+
+    # unfinished jobs as plain data that can be saved and handed to restore, running ones come back queued :3
+    def pending_state(self):
+        with self.condition:
+            jobs = [job for job in self.jobs.values() if not job.finished and job.interrupt != InstallJob.CANCELLED]
+            return {
+                'paused': self.paused,
+                'jobs': [{
+                    'id': job.id,
+                    'mod': job.mod,
+                    'install': job.install,
+                    'priority': job.priority,
+                    'background': job.background,
+                    'paused': InstallJob.PAUSED in (job.state, job.interrupt),
+                    'depends_on': [dependency.id for dependency in job.depends_on if not dependency.finished]
+                } for job in jobs]
+            }
+
+    # queues the jobs from pending_state again, dependencies are matched up by their old ids :3
+    def restore(self, state):
+        with self.condition:
+            self.paused = self.paused or state.get('paused', False)
+        restored = {}
+        for entry in state.get('jobs', []):
+            depends_on = [restored[job_id] for job_id in entry.get('depends_on', []) if job_id in restored]
+            restored[entry['id']] = self.submit(
+                entry['mod'], entry.get('install', True), entry.get('priority', InstallJob.PRIORITY_NORMAL),
+                depends_on, entry.get('background', False), paused=entry.get('paused', False)
+            )
+        return list(restored.values())
+
+    # (finished jobs, jobs in the batch, overall fraction, combined download rate) for the current batch :3
+    def batch_progress(self):
+        with self.condition:
+            batch = list(self.batch)
+        finished = sum(1 for job in batch if job.finished)
+        if not batch:
+            return 0, 0, 0.0, 0.0
+        fraction = sum(1.0 if job.finished else job.progress.fraction if job.state == InstallJob.RUNNING else 0.0
+                       for job in batch) / len(batch)
+        rate = sum(job.progress.smoothed_rate for job in batch
+                   if job.state == InstallJob.RUNNING and job.progress.stage == InstallProgress.DOWNLOADING)
+        return finished, len(batch), fraction, rate
+
+    def _trim_history(self):
+        finished = [job_id for job_id, job in self.jobs.items() if job.finished]
+        for job_id in finished[:max(0, len(self.jobs) - self.history)]:
+            del self.jobs[job_id]
+
+    def _start_worker(self):
+        self.thread_count += 1
+        threading.Thread(target=self._worker, daemon=True).start()
+
+    # best queued job that can start right now, called with the condition held :3
+    def _next_job(self):
+        if self.paused:
+            return None
+        ready = [job for job in self.queue
+                 if job.state == InstallJob.QUEUED and not job.blocked and job.key not in self.running_keys]
+        if not ready:
+            return None
+        # min keeps the earliest submitted job on ties :3
+        return min(ready, key=lambda job: job.priority)
+
+    def _release(self, job):
+        if self.active.get(job.key) is job:
+            del self.active[job.key]
+
+    # the helpers below are called with the condition held :3
+    def _cancel(self, job):
+        if job.state == InstallJob.RUNNING:
+            if job.deploying:
+                return False
+            job.interrupt = InstallJob.CANCELLED
+            return True
+        if not job.waiting:
+            return False
+        self.queue.remove(job)
+        job.state = InstallJob.CANCELLED
+        job.finished_at = time.time()
+        job.future.cancel()
+        self._release(job)
+        self._drop_dependents(job)
+        return True
+
+    # waiting jobs that need one which ended without installing get cancelled or failed along with it :3
+    def _drop_dependents(self, dependency):
+        for job in [job for job in self.queue if dependency in job.depends_on]:
+            self._drop_for_dependency(job, dependency)
+
+    def _drop_for_dependency(self, job, dependency):
+        if job not in self.queue:
+            return  # already dropped through another of its dependencies :3
+        if dependency.state == InstallJob.CANCELLED:
+            self._cancel(job)
+            return
+        self.queue.remove(job)
+        job.state = InstallJob.FAILED
+        job.error = f"Dependency {dependency.title} failed to install"
+        job.finished_at = time.time()
+        logging.warning(f"Not installing {job.title}: {job.error}")
+        job.future.set_exception(ValueError(job.error))
+        self._release(job)
+        self._drop_dependents(job)
+
+    def _pause(self, job, state):
+        if job.state == InstallJob.RUNNING:
+            if job.deploying:
+                return False
+            job.interrupt = state
+            return True
+        if job.state != InstallJob.QUEUED:
+            return False
+        job.state = state
+        return True
+
+    def _resume(self, job):
+        if job.state == InstallJob.RUNNING and job.interrupt in (InstallJob.QUEUED, InstallJob.PAUSED):
+            job.interrupt = None
+            return True
+        if job.state != InstallJob.PAUSED:
+            return False
+        job.state = InstallJob.QUEUED
+        return True
+
+    def _wake(self):
+        while self.thread_count < min(self.workers, len(self.queue)):
+            self._start_worker()
+        self.condition.notify_all()
+
+    def _worker(self):
+        while True:
+            with self.condition:
+                job = None
+                while self.thread_count <= self.workers:
+                    job = self._next_job()
+                    if job or not self.condition.wait(timeout=30):
+                        break
+                # idle for a while or too many workers after the setting was lowered :3
+                if not job or self.thread_count > self.workers:
+                    self.thread_count -= 1
+                    return
+                self.queue.remove(job)
+                self.running_keys.add(job.key)
+                job.state = InstallJob.RUNNING
+                job.started_at = time.time()
+                self.in_flight += 1
+            self._changed()
+
+            try:
+                result = self.runner(job)
+            except Exception as e:
+                self._finish(job, error=e)
+                continue
+            if isinstance(result, concurrent.futures.Future):
+                # the rest of the job runs on a later stage, this worker can take the next one meanwhile :3
+                # nothing checks for interrupts from here on, so a pause or cancel that just missed the download is dropped :3
+                with self.condition:
+                    job.deploying = True
+                    job.interrupt = None
+                self._changed()
+                result.add_done_callback(lambda stage_future, job=job: self._finish_stage(job, stage_future))
+            else:
+                self._finish(job, result)
+
+    def _finish_stage(self, job, stage_future):
+        error = stage_future.exception()
+        self._finish(job, None if error else stage_future.result(), error)
+
+    # records how a running job ended and frees its package :3
+    def _finish(self, job, result=None, error=None):
+        interrupted = error.state if isinstance(error, InstallInterrupted) else None
+        if error is None:
+            job.state = InstallJob.DONE
+            job.future.set_result(result)
+        elif not interrupted:
+            job.state = InstallJob.FAILED
+            job.error = str(error)
+            job.future.set_exception(error)
+        with self.condition:
+            self.in_flight -= 1
+            self.running_keys.discard(job.key)
+            job.interrupt = None
+            if interrupted in (InstallJob.QUEUED, InstallJob.PAUSED):
+                # back to the front of the queue, it keeps its package slot and its future :3
+                job.state = interrupted
+                job.started_at = None
+                self.queue.insert(0, job)
+            else:
+                if interrupted == InstallJob.CANCELLED:
+                    job.state = InstallJob.CANCELLED
+                    job.future.cancel()
+                job.finished_at = time.time()
+                self._release(job)
+                if job.state != InstallJob.DONE:
+                    self._drop_dependents(job)
+            # jobs waiting on this one or on its package may be ready now :3
+            self._wake()
+        self._changed()
+
+    def _changed(self):
+        if self.on_change:
+            try:
+                self.on_change()
+            except Exception as e:
+                logging.error(f"Install queue listener failed: {e}")
+
+# one stage of the install pipeline: a few worker threads fed by a bounded queue :3
+# submit blocks while the queue is full, so a stage that falls behind slows the one feeding it instead of piling up archives :3
+class PipelineStage:
+    def __init__(self, name, workers, capacity, max_workers=MAX_DEPLOY_WORKERS):
+        self.name = name
+        self.max_workers = max_workers
+        self.workers = max(1, min(max_workers, int(workers)))
+        self.queue = queue.Queue(maxsize=capacity)
+        self.lock = threading.Lock()
+        self.thread_count = 0
+
+    # queues func(*args) and returns a future for its result :3
+    def submit(self, func, *args):
+        future = concurrent.futures.Future()
+        self.queue.put((future, func, args))
+        with self.lock:
+            if self.thread_count < self.workers:
+                self._start_worker()
+        return future
+
+    def set_workers(self, workers):
+        with self.lock:
+            self.workers = max(1, min(self.max_workers, int(workers)))
+            while self.thread_count < min(self.workers, self.queue.qsize()):
+                self._start_worker()
+
+    def _start_worker(self):
+        self.thread_count += 1
+        threading.Thread(target=self._worker, name=f"hls-{self.name}", daemon=True).start()
+
+    def _worker(self):
+        while True:
+            with self.lock:
+                # too many workers after the setting was lowered :3
+                if self.thread_count > self.workers:
+                    self.thread_count -= 1
+                    return
+            try:
+                future, func, args = self.queue.get(timeout=30)
+            except queue.Empty:
+                with self.lock:
+                    # idle for a while, unless something was queued just now :3
+                    if self.queue.empty():
+                        self.thread_count -= 1
+                        return
+                continue
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(func(*args))
+                except Exception as e:
+                    future.set_exception(e)
+
+# how many results the command palette shows :3
+PALETTE_RESULT_LIMIT = 30
+
+# one incremental index over everything the command palette can find :3
+# each kind of entity is synced separately and only entries whose text changed get re-indexed :3
+class CommandPaletteIndex:
+    def __init__(self):
+        self.search_index = FuzzySearchIndex()
+        self.entries = {}  # (kind, id) -> (label, fields, action) :3
+        self.kinds = {}  # kind -> keys currently indexed for it :3
+
+    def __len__(self):
+        return len(self.entries)
+
+    # items maps id -> (label, fields, action), returns how many entries were (re)indexed or dropped :3
+    def sync(self, kind, items):
+        changes = 0
+        current = self.kinds.get(kind, set())
+        wanted = set()
+        for item_id, (label, fields, action) in items.items():
+            key = (kind, item_id)
+            wanted.add(key)
+            existing = self.entries.get(key)
+            if existing is None or existing[0] != label or existing[1] != fields:
+                self.search_index.add(key, [(label, 1.0)] + list(fields))
+                changes += 1
+            self.entries[key] = (label, fields, action)
+
+        for key in current - wanted:
+            self.search_index.remove(key)
+            del self.entries[key]
+            changes += 1
+
+        self.kinds[kind] = wanted
+        return changes
+
+    # returns (label, action) pairs best first :3
+    def search(self, query, limit=PALETTE_RESULT_LIMIT):
+        if not query.strip():
+            return []
+        return [(self.entries[key][0], self.entries[key][2]) for key, _ in self.search_index.search(query, limit=limit)]
+
+# Above this many compared pairs the listbox diff just replaces the changed block
+LISTBOX_DIFF_LIMIT = 250000
+
+# Server browser index, fields are normalised and every sort order is computed once per refresh
+# so typing in the search box or switching the sort only has to walk a precomputed list
+class ServerIndex:
+    SORT_KEYS = {
+        "name": (lambda entry: entry['title_lower'], False),
+        "region": (lambda entry: entry['country'], False),
+        "map": (lambda entry: entry['map_sort'], False),
+        "player_cap": (lambda entry: entry['player_cap'], True),
+        "slots": (lambda entry: entry['slots'], True),
+        "version": (lambda entry: entry['version'], False)
+    }
+
+    def __init__(self):
+        self.servers = []  # deduplicated servers, positions are what the listbox maps to
+        self.entries = []  # normalised fields for each position
+        self.by_host = {}  # host -> normalised entry from the previous refresh
+        self.orders = {}  # sort name -> positions in sorted order
+
+    def __len__(self):
+        return len(self.servers)
+
+    @staticmethod
+    def normalise(server):
+        title = server.get('title', 'Unnamed Server')
+        map_name = server.get('map', 'Unknown Map')
+        current_players = server.get('current_players', 0)
+        player_cap = server.get('player_cap', 0)
+        return {
+            'server': server,
+            'title_lower': title.lower(),
+            'map_lower': server.get('map', '').lower(),
+            'map_sort': server.get('map', 'Unknown').lower(),
+            'country': server.get('country', 'Unknown'),
+            'player_cap': player_cap,
+            'slots': player_cap - current_players,
+            'version': server.get('version', '0.0.0'),
+            'age_restricted': server.get('age_restricted', False),
+            'has_players': current_players > 0,
+            'display': f"{title} - {map_name.title()} ({server.get('current_players', '?')}/{server.get('player_cap', '?')})"
+        }
+
+    # Keeps only the most recently updated server per host, reusing the normalised
+    # entry of any host whose server hasn't changed since the last refresh
+    def update(self, servers):
+        latest = {}
+        for server in servers:
+            host = server.get('host')
+            last_updated = server.get('last_updated')
+            if host not in latest or last_updated > latest[host].get('last_updated'):
+                latest[host] = server
+
+        changed = len(latest) != len(self.by_host)
+        by_host = {}
+        for host, server in latest.items():
+            previous = self.by_host.get(host)
+            if previous and previous['server'] == server:
+                by_host[host] = previous
+            else:
+                by_host[host] = self.normalise(server)
+                changed = True
+
+        self.by_host = by_host
+        if not changed and self.orders:
+            return False
+
+        self.entries = list(by_host.values())
+        self.servers = [entry['server'] for entry in self.entries]
+        self.orders = {}
+        for sort_by, (key, reverse) in self.SORT_KEYS.items():
+            positions = list(range(len(self.entries)))
+            positions.sort(key=lambda position: key(self.entries[position]), reverse=reverse)
+            self.orders[sort_by] = positions
+        return True
+
+    # Positions of the servers to show, in display order
+    def query(self, search_text, sort_by, show_18plus):
+        order = self.orders.get(sort_by, range(len(self.entries)))
+        result = []
+        for position in order:
+            entry = self.entries[position]
+            if entry['age_restricted'] and not show_18plus:
+                continue
+            if not entry['has_players']:
+                continue
+            if search_text and search_text not in entry['title_lower'] and search_text not in entry['map_lower']:
+                continue
+            result.append(position)
+        return result
+
+# Brings a listbox from old_items to new_items with the fewest inserts and deletes,
+# rows that stay put keep their selection and the view doesn't jump around
+def apply_listbox_diff(listbox, old_items, new_items):
+    start = 0
+    limit = min(len(old_items), len(new_items))
+    while start < limit and old_items[start] == new_items[start]:
+        start += 1
+    old_end, new_end = len(old_items), len(new_items)
+    while old_end > start and new_end > start and old_items[old_end - 1] == new_items[new_end - 1]:
+        old_end -= 1
+        new_end -= 1
+
+    old_middle = old_items[start:old_end]
+    new_middle = new_items[start:new_end]
+    if len(old_middle) * len(new_middle) > LISTBOX_DIFF_LIMIT:
+        opcodes = [('replace', 0, len(old_middle), 0, len(new_middle))]
+    else:
+        opcodes = difflib.SequenceMatcher(None, old_middle, new_middle, autojunk=False).get_opcodes()
+
+    # Apply back to front so earlier indices stay valid
+    for tag, old_start, old_stop, new_start, new_stop in reversed(opcodes):
+        if tag == 'equal':
+            continue
+        if old_stop > old_start:
+            listbox.delete(start + old_start, start + old_stop - 1)
+        if new_stop > new_start:
+            listbox.insert(start + old_start, *new_middle[new_start:new_stop])
+
+# how strongly the per source latency and throughput estimates follow the newest download :3
+SOURCE_SMOOTHING = 0.3
+# a source that just failed is ranked behind the others for this long, in seconds :3
+SOURCE_FAILURE_COOLDOWN = 120
+# guesses used to rank a source nothing has been downloaded from yet :3
+SOURCE_DEFAULT_LATENCY = 0.5
+SOURCE_DEFAULT_THROUGHPUT = 1048576
+# size assumed when ranking sources for a download of unknown size :3
+SOURCE_ESTIMATE_SIZE = 5 * 1048576
+# a download going slower than this (bytes/s) after the grace period moves on to the next source if there is one :3
+SLOW_SOURCE_RATE = 51200
+SLOW_SOURCE_GRACE = 10
+# direct thunderstore cdn path, skips the redirect the package download url goes through :3
+THUNDERSTORE_CDN_TEMPLATE = "https://gcdn.thunderstore.io/live/repository/packages/{owner}-{name}-{version}.zip"
+
+# raised when a source is too slow to be worth waiting on while another one is available :3
+class SlowSourceError(requests.ConnectionError):
+    pass
+
+# (owner, name, version) from a thunderstore package download url, None for anything else :3
+def parse_thunderstore_download_url(url):
+    parts = [part for part in urlparse(url or '').path.split('/') if part]
+    if len(parts) >= 3 and 'download' in parts[:-3]:
+        return tuple(parts[-3:])
+    return None
+
+# keeps smoothed latency and throughput per download host and ranks alternative urls by expected download time :3
+class SourceSelector:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.stats = {}  # host -> {'latency', 'throughput', 'failed_at', 'downloads', 'failures'} :3
+
+    @staticmethod
+    def source_of(url):
+        return urlparse(url).netloc
+
+    def _entry(self, host):
+        return self.stats.setdefault(host, {
+            'latency': None, 'throughput': None, 'failed_at': 0, 'downloads': 0, 'failures': 0
+        })
+
+    # seconds a download of size bytes is expected to take from url :3
+    def estimate(self, url, size=0):
+        with self.lock:
+            stats = self.stats.get(self.source_of(url), {})
+        latency = stats.get('latency') or SOURCE_DEFAULT_LATENCY
+        throughput = stats.get('throughput') or SOURCE_DEFAULT_THROUGHPUT
+        return latency + (size or SOURCE_ESTIMATE_SIZE) / throughput
+
+    # fastest expected first, sources that failed recently go last, ties keep the given order :3
+    def rank(self, urls, size=0):
+        now = time.time()
+        def key(item):
+            position, url = item
+            with self.lock:
+                failed_at = self.stats.get(self.source_of(url), {}).get('failed_at', 0)
+            return (now - failed_at < SOURCE_FAILURE_COOLDOWN, self.estimate(url, size), position)
+        return [url for _, url in sorted(enumerate(dict.fromkeys(urls)), key=key)]
+
+    # seconds is None when the transfer was held back by our own bandwidth cap, only its latency says anything about the source :3
+    def record(self, url, latency, size, seconds=None):
+        with self.lock:
+            stats = self._entry(self.source_of(url))
+            stats['downloads'] += 1
+            stats['failed_at'] = 0
+            stats['latency'] = latency if stats['latency'] is None else \
+                stats['latency'] + SOURCE_SMOOTHING * (latency - stats['latency'])
+            # tiny files say more about latency than throughput :3
+            if seconds and size >= DOWNLOAD_CHUNK_SIZE:
+                throughput = size / seconds
+                stats['throughput'] = throughput if stats['throughput'] is None else \
+                    stats['throughput'] + SOURCE_SMOOTHING * (throughput - stats['throughput'])
+
+    def failure(self, url):
+        with self.lock:
+            stats = self._entry(self.source_of(url))
+            stats['failures'] += 1
+            stats['failed_at'] = time.time()
+
+    def format_stats(self):
+        with self.lock:
+            stats = {host: dict(entry) for host, entry in self.stats.items()}
+        lines = []
+        for host in sorted(stats):
+            entry = stats[host]
+            latency = f"{entry['latency'] * 1000:.0f}ms" if entry['latency'] is not None else "?"
+            throughput = f"{format_bytes(entry['throughput'])}/s" if entry['throughput'] else "?"
+            lines.append(f"{host}: {entry['downloads']} downloads, {entry['failures']} failures, "
+                         f"latency {latency}, throughput {throughput}")
+        return "\n".join(lines)
+
+# token bucket rate limiter, a rate of 0 means unlimited :3
+# callers take what they need and sleep off any debt, so many threads sharing one bucket split the rate between them :3
+class TokenBucket:
+    def __init__(self, rate=0):
+        self.lock = threading.Lock()
+        self.rate = 0
+        self.tokens = 0.0
+        self.updated = time.monotonic()
+        self.set_rate(rate)
+
+    def set_rate(self, rate):
+        with self.lock:
+            self.rate = max(0, rate)
+            self.tokens = min(self.tokens, self.rate)  # at most a second of burst :3
+            self.updated = time.monotonic()
+
+    def consume(self, amount):
+        with self.lock:
+            if not self.rate:
+                return
+            now = time.monotonic()
+            self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= amount
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
+
+# every transfer goes through one of two buckets, user started ones and automatic background ones :3
+class BandwidthLimiter:
+    def __init__(self, foreground_rate=0, background_rate=0):
+        self.foreground = TokenBucket(foreground_rate)
+        self.background = TokenBucket(background_rate)
+
+    def bucket(self, background=False):
+        return self.background if background else self.foreground
+
+    def consume(self, amount, background=False):
+        self.bucket(background).consume(amount)
+
+# how long a mod has to stay selected before its archive gets prefetched, in milliseconds :3
+PREFETCH_DWELL_MS = 1500
+# default speed cap for speculative prefetching in KB/s :3
+PREFETCH_LIMIT_KBPS = 1024
+
+# fetches the archives of the selected mod and its missing dependencies into the archive cache before install is clicked :3
+# only one selection is worked on at a time, and moving on cancels it at the next chunk (the partial download is kept) :3
+class SpeculativePrefetcher:
+    def __init__(self, fetch, rate=PREFETCH_LIMIT_KBPS * 1024, shared_throttle=None):
+        self.fetch = fetch  # fetch(mod, throttle) downloads one archive into the cache, returns False if it was already there :3
+        self.bucket = TokenBucket(rate)
+        self.shared_throttle = shared_throttle  # the background cap applies on top of the prefetch one :3
+        self.lock = threading.Lock()
+        self.running = threading.Lock()  # held by the thread doing the fetching :3
+        self.generation = 0
+        self.fetched = 0
+        self.cancelled = 0
+        self.bytes = 0
+
+    def prefetch(self, mods):
+        with self.lock:
+            self.generation += 1
+            generation = self.generation
+        threading.Thread(target=self._run, args=(list(mods), generation), daemon=True).start()
+
+    # stops the current prefetch at its next chunk, the partial download lock keeps an install from writing alongside it :3
+    def cancel(self):
+        with self.lock:
+            self.generation += 1
+
+    @property
+    def busy(self):
+        return self.running.locked()
+
+    def _run(self, mods, generation):
+        def throttle(amount):
+            if generation != self.generation:
+                raise InstallInterrupted(InstallJob.CANCELLED)
+            self.bucket.consume(amount)
+            if self.shared_throttle:
+                self.shared_throttle(amount)
+            self.bytes += amount
+
+        # an older prefetch that's been cancelled finishes its chunk first :3
+        with self.running:
+            for mod in mods:
+                if generation != self.generation:
+                    return
+                try:
+                    if self.fetch(mod, throttle):
+                        self.fetched += 1
+                except InstallInterrupted:
+                    self.cancelled += 1
+                    logging.info(f"Prefetch of {mod.get('title')} cancelled")
+                    return
+                except Exception as e:
+                    logging.info(f"Prefetch of {mod.get('title')} failed: {e}")
+
+    def format_stats(self):
+        return f"Prefetched {self.fetched} archives ({format_bytes(self.bytes)}), {self.cancelled} cancelled"
+
+# retries back off exponentially from the base delay up to the max, with full jitter so queued jobs spread out :3
+RETRY_ATTEMPTS = 4
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
+# consecutive failures before a host's circuit opens, and how long it stays open before one request may try again :3
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_RESET_SECONDS = 30
+# http statuses worth retrying, everything else 4xx/5xx fails straight away :3
+RETRYABLE_STATUS_CODES = {408, 425, 429, 500, 502, 503, 504}
+
+# raised instead of sending a request to a host whose circuit is open :3
+class CircuitOpenError(requests.ConnectionError):
+    def __init__(self, host, retry_at):
+        super().__init__(f"{host} is failing, not retrying for {max(0, retry_at - time.time()):.0f}s")
+        self.host = host
+        self.retry_at = retry_at
+
+# seconds to wait from a Retry-After header, which is either a number or an http date :3
+def parse_retry_after(value):
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+# per host circuit breaker shared by every request :3
+# after enough failures in a row the host is left alone for a while, then a single request probes it :3
+class CircuitBreaker:
+    def __init__(self, threshold=CIRCUIT_FAILURE_THRESHOLD, reset_after=CIRCUIT_RESET_SECONDS):
+        self.threshold = threshold
+        self.reset_after = reset_after
+        self.lock = threading.Lock()
+        self.failures = {}  # host -> consecutive failures :3
+        self.open_until = {}  # host -> time requests may go out again :3
+        self.probing = set()  # hosts with a probe request in flight :3
+
+    # raises CircuitOpenError if requests to host should not go out right now :3
+    def before(self, host):
+        with self.lock:
+            retry_at = self.open_until.get(host)
+            if retry_at is None:
+                return
+            if time.time() < retry_at or host in self.probing:
+                raise CircuitOpenError(host, max(retry_at, time.time() + 1))
+            self.probing.add(host)
+
+    def success(self, host):
+        with self.lock:
+            self.failures.pop(host, None)
+            self.open_until.pop(host, None)
+            self.probing.discard(host)
+
+    def failure(self, host):
+        with self.lock:
+            self.failures[host] = self.failures.get(host, 0) + 1
+            if host in self.probing or self.failures[host] >= self.threshold:
+                self.open_until[host] = time.time() + self.reset_after
+                logging.warning(f"Too many failures from {host}, pausing requests for {self.reset_after}s")
+            self.probing.discard(host)
+
+    # the server asked everyone to wait, e.g. a 429 or 503 with Retry-After :3
+    def hold(self, host, seconds):
+        with self.lock:
+            self.open_until[host] = max(self.open_until.get(host, 0), time.time() + seconds)
+            self.probing.discard(host)
+
+# shared retry rules: which errors are worth another try and how long to wait before it :3
+class RetryPolicy:
+    def __init__(self, attempts=RETRY_ATTEMPTS, base_delay=RETRY_BASE_DELAY, max_delay=RETRY_MAX_DELAY):
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    @staticmethod
+    def is_transient(error):
+        if isinstance(error, requests.HTTPError):
+            return error.response is not None and error.response.status_code in RETRYABLE_STATUS_CODES
+        if isinstance(error, (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError)):
+            return True
+        return 'ConnectionResetError' in str(error) or '10054' in str(error)
+
+    # full jitter backoff, stretched to whatever Retry-After or an open circuit asks for :3
+    def delay(self, attempt, error):
+        wait = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+        response = getattr(error, 'response', None)
+        if response is not None:
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            if retry_after is not None:
+                wait = max(wait, retry_after)
+        if isinstance(error, CircuitOpenError):
+            # spread the waiting jobs out a little so they don't all hit the probe at once :3
+            wait = max(wait, error.retry_at - time.time() + random.uniform(0, self.base_delay))
+        return wait
+
+    # calls func until it works, a non transient error comes up or the attempts run out :3
+    # on_retry(attempt, error, wait) is told about each retry before the wait :3
+    def call(self, func, on_retry=None):
+        attempt = 0
+        while True:
+            try:
+                return func()
+            except Exception as e:
+                attempt += 1
+                if attempt >= self.attempts or not self.is_transient(e):
+                    raise
+                wait = self.delay(attempt - 1, e)
+                if on_retry:
+                    on_retry(attempt, e, wait)
+                time.sleep(wait)
+
+# (connect, read) timeouts in seconds for any request that doesn't pass its own :3
+HTTP_TIMEOUT = (10, 30)
+# most requests in flight to one host at a time, streamed downloads and everything else each get this many :3
+HTTP_HOST_CONNECTIONS = 6
+
+# one shared requests session so connections and tls sessions get reused across the whole app :3
+# every call gets a default timeout, each host has a cap on concurrent requests and timings are kept per host :3
+# streams hold their slot for the whole download, so they have their own slots and api calls never queue behind them :3
+# waiting for a slot counts against the connect timeout like waiting for the connection itself would :3
+# responses also feed a per host circuit breaker, so a host that's down gets left alone by everyone at once :3
+class HttpClient:
+    def __init__(self, timeout=HTTP_TIMEOUT, host_connections=HTTP_HOST_CONNECTIONS):
+        self.timeout = timeout
+        self.host_connections = host_connections
+        self.breaker = CircuitBreaker()
+        self.retry = RetryPolicy()
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=host_connections * 2)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.lock = threading.Lock()
+        self.host_limits = {}  # (host, streamed) -> semaphore capping its concurrent requests :3
+        self.metrics = {}  # host -> {'requests', 'errors', 'total', 'slowest'} with times in seconds :3
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def head(self, url, **kwargs):
+        return self.request('HEAD', url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request('POST', url, **kwargs)
+
+    # streamed responses hold their host slot until they're closed or garbage collected :3
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault('timeout', self.timeout)
+        host = urlparse(url).netloc
+        with self.lock:
+            limit = self.host_limits.setdefault((host, bool(kwargs.get('stream'))), threading.BoundedSemaphore(self.host_connections))
+        timeout = kwargs['timeout']
+        if not limit.acquire(timeout=timeout[0] if isinstance(timeout, tuple) else timeout):
+            raise requests.Timeout(f"No free connection to {host}")
+        # checked once we have a slot, so a half open circuit's probe isn't left stuck behind the wait :3
+        try:
+            self.breaker.before(host)
+        except CircuitOpenError:
+            limit.release()
+            raise
+
+        released = False
+        def release():
+            nonlocal released
+            if not released:
+                released = True
+                limit.release()
+
+        started = time.monotonic()
+        try:
+            response = self.session.request(method, url, **kwargs)
+        except Exception as e:
+            self.record(host, time.monotonic() - started, failed=True)
+            if RetryPolicy.is_transient(e):
+                self.breaker.failure(host)
+            else:
+                self.breaker.success(host)
+            release()
+            raise
+        self.record(host, time.monotonic() - started, failed=response.status_code >= 400)
+        if response.status_code in RETRYABLE_STATUS_CODES:
+            self.breaker.failure(host)
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            if retry_after:
+                self.breaker.hold(host, retry_after)
+        else:
+            self.breaker.success(host)
+
+        if not kwargs.get('stream'):
+            release()
+            return response
+        # only a weak reference here, a strong one would keep the response alive in a cycle :3
+        response_ref = weakref.ref(response)
+        def close_and_release():
+            try:
+                if current := response_ref():
+                    requests.Response.close(current)
+            finally:
+                release()
+        response.close = close_and_release
+        weakref.finalize(response, release)
+        return response
+
+    def record(self, host, elapsed, failed=False):
+        with self.lock:
+            stats = self.metrics.setdefault(host, {'requests': 0, 'errors': 0, 'total': 0.0, 'slowest': 0.0})
+            stats['requests'] += 1
+            stats['errors'] += int(failed)
+            stats['total'] += elapsed
+            stats['slowest'] = max(stats['slowest'], elapsed)
+
+    # one line per host, time is until the response headers arrived :3
+    def format_stats(self):
+        with self.lock:
+            metrics = {host: dict(stats) for host, stats in self.metrics.items()}
+        lines = []
+        for host in sorted(metrics):
+            stats = metrics[host]
+            average = stats['total'] / stats['requests'] * 1000
+            lines.append(f"{host}: {stats['requests']} requests, {stats['errors']} errors, "
+                         f"avg {average:.0f}ms, slowest {stats['slowest'] * 1000:.0f}ms")
+        return "\n".join(lines)
+
+# how long each startup fetch may take in seconds, they all run at once so startup waits for the slowest one :3
+STARTUP_FETCH_DEADLINES = {
+    'thunderstore': 30,
+    'servers': 15,
+    'hls_version': 10,
+    'program_version': 10,
+    'gdweave_version': 15
+}
+# how long a prefetched result stays good before callers fetch it again :3
+PREFETCH_TTL = 300
+
+# asyncio event loop on its own thread that runs a group of blocking fetches at once :3
+# each fetch gets its own deadline and its result is handed over as soon as it arrives :3
+class AsyncNetworkLoop:
+    def __init__(self, max_workers=8):
+        self.loop = asyncio.new_event_loop()
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='hls-net')
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    # fetches maps name -> (callable, deadline), on_result(name, value, error) runs for each one as it
+    # finishes and on_done(results) after the last, both on the loop thread :3
+    def fetch_all(self, fetches, on_result, on_done=None):
+        return asyncio.run_coroutine_threadsafe(self._fetch_all(fetches, on_result, on_done), self.loop)
+
+    async def _fetch(self, name, fetch, deadline):
+        started = time.monotonic()
+        try:
+            value = await asyncio.wait_for(self.loop.run_in_executor(self.executor, fetch), deadline)
+            logging.info(f"Fetch {name} finished in {time.monotonic() - started:.2f}s")
+            return name, value, None
+        except asyncio.TimeoutError:
+            return name, None, TimeoutError(f"{name} took longer than {deadline}s")
+        except Exception as e:
+            return name, None, e
+
+    async def _fetch_all(self, fetches, on_result, on_done):
+        results = {}
+        pending = [self._fetch(name, fetch, deadline) for name, (fetch, deadline) in fetches.items()]
+        for finished in asyncio.as_completed(pending):
+            name, value, error = await finished
+            results[name] = (value, error)
+            try:
+                on_result(name, value, error)
+            except Exception as e:
+                logging.error(f"Handling fetch result {name} failed: {e}")
+        if on_done:
+            on_done(results)
+        return results
+
+# extracted mods are assumed to be this many times bigger than their zips until some installs have been measured :3
+DEFAULT_EXTRACT_RATIO = 2.5
+# how much older installs count towards the learned extract ratio each time a new one is added :3
+EXTRACT_RATIO_DECAY = 0.9
+# space left free on each drive after a batch so the game and os aren't starved (200MB) :3
+DISK_SPACE_RESERVE = 200 * 1048576
+# how long the size check before a batch waits on each archive's HEAD request in seconds :3
+PREFLIGHT_DEADLINE = 5
+
+# free bytes and device id of the drive a path is on, walks up to the nearest folder that exists :3
+def get_disk_space(path):
+    path = os.path.abspath(path)
+    while not os.path.exists(path):
+        parent = os.path.dirname(path)
+        if parent == path:
+            break
+        path = parent
+    return shutil.disk_usage(path).free, os.stat(path).st_dev
+
 # main class for the hook line sinker user interface :3
 class HookLineSinkerUI:
     def __init__(self, root):
@@ -119,11 +2282,22 @@ class HookLineSinkerUI:
         self.gui_queue = queue.Queue()
         self.gdweave_queue = queue.Queue()
         print("Queues initialized")
+
+        # every http request goes through this one client :3
+        self.http = HttpClient()
+        self.source_selector = SourceSelector()
+        self.last_outage_dialog = 0
         
         print("Loading settings...")
         self.load_settings()
         print("Settings loaded")
 
+        # separate download speed caps for things the user started and things running in the background :3
+        self.bandwidth = BandwidthLimiter(
+            self.settings.get('foreground_limit_kbps', 0) * 1024,
+            self.settings.get('background_limit_kbps', 0) * 1024
+        )
+
         # define dark mode colors :3
         self.dark_mode_colors = {
             'bg': '#2b2b2b',
@@ -212,6 +2386,8 @@ class HookLineSinkerUI:
         print(f"Mods directory: {self.mods_dir}")
         print(f"Mod cache file: {self.mod_cache_file}")
         os.makedirs(self.mods_dir, exist_ok=True)
+        self.modpacks_dir = os.path.join(self.app_data_dir, "modpacks")
+        os.makedirs(self.modpacks_dir, exist_ok=True)
         print("Mod directories created")
 
         print("Initializing mod lists...")
@@ -229,6 +2405,15 @@ class HookLineSinkerUI:
         self.filtered_installed_mods = []
         self.mod_categories = {}  # will be populated dynamically from Thunderstore categories :3
 
+        # fuzzy search indexes for both mod lists :3
+        self.available_search_index = FuzzySearchIndex()
+        self.installed_search_index = FuzzySearchIndex()
+        self.installed_search_index_token = None
+        self.available_query_index = ModQueryIndex()
+        self.installed_query_index = ModQueryIndex()
+        self.available_search_mode = tk.StringVar(value=self.settings.get('available_search_mode', 'Exact'))
+        self.installed_search_mode = tk.StringVar(value=self.settings.get('installed_search_mode', 'Exact'))
+
         # initialize sort preferences from settings :3
         self.available_sort_by = tk.StringVar(value=self.settings.get('available_sort_by', 'Last Updated'))
         self.installed_sort_by = tk.StringVar(value=self.settings.get('installed_sort_by', 'Recently Installed'))
@@ -238,7 +2423,52 @@ class HookLineSinkerUI:
         self.last_installed_category = self.settings.get('installed_category', 'All')
 
         self.load_mod_cache()
-        self.mod_downloading = False
+
+        # installs are a pipeline: a pool of download workers hands archives to a smaller pool that extracts and deploys them :3
+        self.deploy_stage = PipelineStage(
+            'deploy', self.settings.get('deploy_workers', DEFAULT_DEPLOY_WORKERS), DEPLOY_QUEUE_SIZE
+        )
+        self.install_executor = InstallExecutor(
+            self.run_install_job,
+            self.settings.get('install_workers', DEFAULT_INSTALL_WORKERS),
+            on_change=self.on_install_queue_change
+        )
+        self.install_queue_window = None
+        # unfinished jobs are kept on disk so a batch carries on after a restart :3
+        self.install_queue_path = os.path.join(self.app_data_dir, 'install_queue.json')
+        self.install_queue_restored = False
+        self.completed_installs = []  # installed since the mod lists were last refreshed :3
+        # only one stream writes a partial download at a time, a second one for the same url waits its turn :3
+        self.partial_locks = {}  # part path -> lock :3
+        self.partial_locks_lock = threading.Lock()
+        # space held by plans that passed the disk check but haven't been queued yet, so a second batch can't count it too :3
+        self.preflight_reserved = collections.Counter()  # device -> bytes :3
+        self.preflight_lock = threading.Lock()
+
+        # startup fetches run together on their own event loop, results are kept for a while so nothing asks twice :3
+        self.network_loop = AsyncNetworkLoop()
+        self.prefetched = {}  # name -> (value, fetched at) :3
+        self.startup_fetch_pending = False
+
+        # downloaded archives are kept around so reinstalls and profile switches skip the network :3
+        self.archive_cache = ArchiveCache(
+            os.path.join(self.app_data_dir, 'archive_cache'),
+            self.settings.get('archive_cache_mb', ARCHIVE_CACHE_LIMIT // 1048576) * 1048576
+        )
+
+        self.prune_partial_downloads()
+
+        # machines on the same lan can share their archive caches with each other :3
+        self.peer_cache = PeerCache(self.archive_cache, self.http)
+        self.apply_peer_cache_settings()
+
+        # the selected mod can be downloaded into the archive cache ahead of time so install runs at disk speed :3
+        self.prefetcher = SpeculativePrefetcher(
+            self.prefetch_mod_archive,
+            self.settings.get('prefetch_limit_kbps', PREFETCH_LIMIT_KBPS) * 1024,
+            self.bandwidth.background.consume
+        )
+        self.prefetch_after = None
 
         # initialize attributes :3
         self.windowed_mode = tk.BooleanVar(value=self.settings.get('windowed_mode', True))
@@ -248,26 +2478,35 @@ class HookLineSinkerUI:
         self.show_nsfw = tk.BooleanVar(value=self.settings.get('show_nsfw', False))
         self.show_deprecated = tk.BooleanVar(value=self.settings.get('show_deprecated', False))
         self.game_path_entry = tk.StringVar(value=self.settings.get('game_path', ''))
+        self.auto_backup = tk.BooleanVar(value=self.settings.get('auto_backup', True))
+        self.suppress_mod_warning = tk.BooleanVar(value=self.settings.get('suppress_mod_warning', False))
+        self.latency_tracking = tk.BooleanVar(value=self.settings.get('latency_tracking', False))
+        self.speculative_prefetch = tk.BooleanVar(value=self.settings.get('speculative_prefetch', False))
 
         logging.info(f"Initial game path: {self.game_path_entry.get()}")
 
+        # batches widget updates so they get drawn once per frame :3
+        self.ui_batcher = UIUpdateBatcher(self.root)
+
+        # optional event-to-redraw latency measurements :3
+        self.latency_tracker = LatencyTracker(self.root, self.settings.get('latency_tracking', False))
+        self.latency_window = None
+
         # create status bar :3
         self.create_status_bar()
 
         # initialize notebook :3
         self.notebook = None
 
-        # setup keyboard combinations :3
-        self.last_key = None
-        self.last_key_time = 0
-        self.root.bind('<KeyPress>', self.handle_keypress)
-        self.root.bind('<KeyRelease>', self.handle_keyrelease)
+
+        # ctrl+k command palette :3
+        self.command_palette = None
+        self.command_palette_index = CommandPaletteIndex()
+        self.root.bind('<Control-k>', self.show_command_palette)
+        self.root.bind('<Control-K>', self.show_command_palette)
 
         self.start_time = time.time()
         
-        # track if mod limit is disabled :3
-        self.mod_limit_disabled = False
-
         self.create_rotating_backup()
         logging.info("Made rotating backup")
         self.create_main_ui()
@@ -275,30 +2514,14 @@ class HookLineSinkerUI:
         if self.dark_mode.get():
             self.toggle_dark_mode(show_restart_prompt=False)
 
-        # check for updates on startup and show discord prompt :3
-        self.check_for_fresh_update()
-        self.show_discord_prompt()
-        self.check_for_duplicate_mods()
-        self.multi_mod_warning_shown = False
-
-        # check for updates silently after 5 seconds removed :3
-        if self.auto_update.get():
-            self.check_for_updates(silent=True)
-        else:
-            self.check_for_program_updates()
-            logging.info("Auto update is disabled, not prompting for any updates or program updates")
-
         # check if this is a fresh update :3
         parser = argparse.ArgumentParser()
         parser.add_argument('--fresh-update', action='store_true')
         args = parser.parse_args()
+        self.fresh_update = args.fresh_update
 
-        if args.fresh_update:
-            self.show_update_complete()
-
-        # start update checking thread :3
-        self.update_thread = threading.Thread(target=self.periodic_update_check, daemon=True)
-        self.update_thread.start()
+        # mod loading and the startup checks wait until the window has been drawn :3
+        self.root.after(STARTUP_DEFER_MS, self.finish_startup)
 
     def save_sort_preferences(self):
         self.settings.update({
@@ -307,6 +2530,283 @@ class HookLineSinkerUI:
         })
         self.save_settings()
 
+    def save_search_modes(self):
+        self.settings.update({
+            'available_search_mode': self.available_search_mode.get(),
+            'installed_search_mode': self.installed_search_mode.get()
+        })
+        self.save_settings()
+
+    # rebuilds the fuzzy and structured query indexes over the thunderstore catalog :3
+    def rebuild_available_search_index(self):
+        self.available_search_index.clear()
+        for mod in self.available_mods:
+            self.available_search_index.add(mod['id'], [
+                (mod.get('title', ''), 1.0),
+                (mod.get('author', ''), 0.8),
+                (mod.get('description', ''), 0.4)
+            ])
+        self.available_query_index.build(((mod['id'], mod) for mod in self.available_mods), self.get_mod_query_columns)
+
+    # the columns structured search can filter a mod on :3
+    def get_mod_query_columns(self, mod):
+        flags = []
+        if mod.get('is_deprecated', False):
+            flags.append('deprecated')
+        if mod.get('has_nsfw_content', False):
+            flags.append('nsfw')
+        if 'Modpacks' in mod.get('categories', []):
+            flags.append('modpack')
+        if mod.get('third_party', False):
+            flags.append('thirdparty')
+        flags.append('enabled' if mod.get('enabled', True) else 'disabled')
+
+        keywords = {
+            'author': [mod.get('author', '')],
+            'category': mod.get('categories', []),
+            'id': [mod.get('id', ''), mod.get('thunderstore_id', '')],
+            'is': flags
+        }
+        numbers = {
+            'downloads': mod.get('downloads'),
+            'likes': mod.get('likes'),
+            'updated': parse_mod_timestamp(mod.get('last_updated') or mod.get('date_updated'))
+        }
+        return keywords, numbers
+
+    def get_installed_search_key(self, mod):
+        return (mod.get('third_party', False), mod['id'])
+
+    # rebuilds the fuzzy index over installed mods, only when the installed list actually changed :3
+    def refresh_installed_search_index(self):
+        token = tuple((self.get_installed_search_key(mod), mod.get('version'), mod['title'], mod.get('enabled', True)) for mod in self.installed_mods)
+        if token == self.installed_search_index_token:
+            return
+        self.installed_search_index.clear()
+        for mod in self.installed_mods:
+            self.installed_search_index.add(self.get_installed_search_key(mod), [
+                (mod.get('title', ''), 1.0),
+                (mod.get('author', ''), 0.8),
+                (mod.get('description', ''), 0.4)
+            ])
+        self.installed_query_index.build(
+            ((self.get_installed_search_key(mod), mod) for mod in self.installed_mods), self.get_mod_query_columns
+        )
+        self.installed_search_index_token = token
+
+    # opens the ctrl+k palette that searches mods, profiles, servers, backups and actions at once :3
+    def show_command_palette(self, event=None):
+        if self.command_palette and self.command_palette.winfo_exists():
+            self.command_palette.lift()
+            self.command_palette_entry.focus_set()
+            return "break"
+
+        self.sync_command_palette_index()
+
+        self.command_palette = tk.Toplevel(self.root)
+        self.command_palette.title("Command Palette")
+        self.command_palette.geometry("520x380")
+        self.command_palette.transient(self.root)
+
+        frame = ttk.Frame(self.command_palette, padding=10)
+        frame.pack(fill=tk.BOTH, expand=True)
+
+        self.command_palette_var = tk.StringVar()
+        self.command_palette_var.trace('w', lambda *args: self.update_command_palette_results())
+        self.command_palette_entry = ttk.Entry(frame, textvariable=self.command_palette_var)
+        self.command_palette_entry.pack(fill=tk.X)
+
+        self.command_palette_listbox = tk.Listbox(frame, activestyle='none')
+        self.command_palette_listbox.pack(fill=tk.BOTH, expand=True, pady=(8, 4))
+        if self.dark_mode.get():
+            self.command_palette_listbox.configure(
+                bg=self.dark_mode_colors['bg'],
+                fg=self.dark_mode_colors['fg'],
+                selectbackground=self.dark_mode_colors['select_bg'],
+                selectforeground=self.dark_mode_colors['select_fg']
+            )
+
+        self.command_palette_info = ttk.Label(frame, text=f"{len(self.command_palette_index)} items indexed")
+        self.command_palette_info.pack(fill=tk.X)
+
+        self.command_palette_results = []
+        for widget in (self.command_palette_entry, self.command_palette_listbox):
+            widget.bind('<Return>', self.run_command_palette_selection)
+            widget.bind('<Down>', lambda e: self.move_command_palette_selection(1))
+            widget.bind('<Up>', lambda e: self.move_command_palette_selection(-1))
+        self.command_palette_listbox.bind('<Double-Button-1>', self.run_command_palette_selection)
+        self.command_palette.bind('<Escape>', lambda e: self.command_palette.destroy())
+
+        self.command_palette_entry.focus_set()
+        return "break"
+
+    # brings every entity type in the palette index up to date, unchanged entries are left alone :3
+    def sync_command_palette_index(self):
+        index = self.command_palette_index
+
+        installed_titles = {mod['title'] for mod in self.installed_mods if not mod.get('third_party', False)}
+        index.sync('available', {
+            mod['id']: (
+                f"Install {self.get_display_name(mod['title'])}",
+                ((mod.get('author', ''), 0.6),),
+                lambda mod=mod: self.palette_install_mod(mod)
+            )
+            for mod in self.available_mods if mod['title'] not in installed_titles
+        })
+
+        installed = {}
+        for mod in self.installed_mods:
+            verb = "Disable" if mod.get('enabled', True) else "Enable"
+            installed[self.get_installed_search_key(mod)] = (
+                f"{verb} {self.get_display_name(mod['title'])}",
+                ((mod.get('author', ''), 0.6),),
+                lambda mod=mod: self.palette_toggle_installed_mod(mod)
+            )
+        index.sync('installed', installed)
+
+        profiles = {}
+        if os.path.exists(self.modpacks_dir):
+            for file in os.listdir(self.modpacks_dir):
+                if file.endswith('.json'):
+                    name = file[:-5]
+                    profiles[name] = (f"Apply profile {name}", (), lambda name=name: self.palette_apply_profile(name))
+        index.sync('profile', profiles)
+
+        servers = {}
+        if hasattr(self, 'server_index'):
+            for server in self.server_index.servers:
+                title = server.get('title', 'Unnamed Server')
+                servers[server.get('host')] = (
+                    f"Server {title}",
+                    ((server.get('map', ''), 0.6), (server.get('host', ''), 0.6)),
+                    lambda server=server: self.palette_select_server(server)
+                )
+        index.sync('server', servers)
+
+        backups = {}
+        backup_dir = os.path.join(self.app_data_dir, 'save_backups')
+        if os.path.exists(backup_dir):
+            for backup in os.listdir(backup_dir):
+                if backup.endswith('.save'):
+                    name_parts = backup.rsplit('_', 1)
+                    name = name_parts[0].replace('_', ' ') if len(name_parts) == 2 else backup
+                    backups[backup] = (f"Restore backup {name}", (), lambda backup=backup: self.palette_restore_backup(backup))
+        index.sync('backup', backups)
+
+        index.sync('action', {
+            name: (name, (), action) for name, action in (
+                ("Check for mod updates", self.check_for_updates),
+                ("Refresh all mods", self.refresh_all_mods),
+                ("Refresh servers", lambda: (self.select_tab("Server Browser"), self.refresh_servers())),
+                ("Import mod from zip", self.import_zip_mod),
+                ("Import mod profile", lambda: (self.select_tab("Mod Profiles"), self.import_modpack())),
+                ("Create mod profile", lambda: (self.select_tab("Mod Profiles"), self.create_modpack_window())),
+                ("Launch modded", self.launch_modded),
+                ("Launch vanilla", self.launch_vanilla),
+                ("Open HLS folder", self.open_hls_folder),
+                ("Open GDWeave folder", self.open_gdweave_folder),
+                ("Open latest log", self.open_latest_log),
+                ("UI latency diagnostics", self.show_latency_diagnostics),
+                ("Install queue", self.show_install_queue)
+            )
+        })
+
+    def update_command_palette_results(self):
+        start = time.perf_counter()
+        self.command_palette_results = self.command_palette_index.search(self.command_palette_var.get())
+        elapsed = (time.perf_counter() - start) * 1000
+
+        self.command_palette_listbox.delete(0, tk.END)
+        for label, _ in self.command_palette_results:
+            self.command_palette_listbox.insert(tk.END, label)
+        if self.command_palette_results:
+            self.command_palette_listbox.selection_set(0)
+        self.command_palette_info.config(
+            text=f"{len(self.command_palette_results)} results from {len(self.command_palette_index)} items in {elapsed:.1f} ms"
+        )
+
+    def move_command_palette_selection(self, step):
+        if not self.command_palette_results:
+            return "break"
+        selection = self.command_palette_listbox.curselection()
+        index = min(max((selection[0] if selection else -1) + step, 0), len(self.command_palette_results) - 1)
+        self.command_palette_listbox.selection_clear(0, tk.END)
+        self.command_palette_listbox.selection_set(index)
+        self.command_palette_listbox.see(index)
+        return "break"
+
+    def run_command_palette_selection(self, event=None):
+        selection = self.command_palette_listbox.curselection()
+        if not selection:
+            return "break"
+        _, action = self.command_palette_results[selection[0]]
+        self.command_palette.destroy()
+        action()
+        return "break"
+
+    # switches the notebook to the tab with the given title, building it first if needed :3
+    def select_tab(self, title):
+        for tab in self.notebook.tabs():
+            if self.notebook.tab(tab, 'text') == title:
+                self.build_tab(tab)
+                self.notebook.select(tab)
+                return
+
+    # selects a listbox row as if the user clicked it :3
+    def select_listbox_row(self, listbox, index):
+        listbox.selection_clear(0, tk.END)
+        listbox.selection_set(index)
+        listbox.see(index)
+        listbox.activate(index)
+        listbox.event_generate('<<ListboxSelect>>')
+
+    # installs straight from the mod dict, the mod list's search and category are left as they are :3
+    def palette_install_mod(self, mod):
+        if self.check_setup():
+            self.install_mods([mod])
+
+    def palette_toggle_installed_mod(self, mod):
+        self.select_tab("Mod Manager")
+        self.installed_search_var.set("")
+        self.installed_category.set("All")
+        self.filter_installed_mods()
+        for index, installed_mod in enumerate(self.filtered_installed_mods):
+            if installed_mod is mod:
+                self.select_listbox_row(self.installed_listbox, index)
+                if mod.get('enabled', True):
+                    self.disable_mod()
+                else:
+                    self.enable_mod()
+                return
+
+    def palette_apply_profile(self, name):
+        self.select_tab("Mod Profiles")
+        self.refresh_modpacks_list()
+        names = self.modpacks_listbox.get(0, tk.END)
+        if name in names:
+            self.select_listbox_row(self.modpacks_listbox, names.index(name))
+            self.apply_modpack()
+
+    def palette_select_server(self, server):
+        self.select_tab("Server Browser")
+        self.server_search_var.set("")
+        for row, position in enumerate(self.server_index_map):
+            if self.servers[position] is server:
+                self.select_listbox_row(self.server_listbox, row)
+                return
+        self.set_status(f"Server {server.get('title', 'Unnamed Server')} is not in the current list")
+
+    # backup is the file name, which is also the row's item id in the backup list :3
+    def palette_restore_backup(self, backup):
+        self.select_tab("Save Manager")
+        self.refresh_backup_list()
+        if self.backup_tree.exists(backup):
+            self.backup_tree.selection_set(backup)
+            self.backup_tree.see(backup)
+            self.restore_backup()
+        else:
+            self.set_status(f"Backup {backup} no longer exists")
+
     def get_user_id(self):
         # check if user id exists in settings :3
         user_id = self.settings.get('user_id')
@@ -323,33 +2823,6 @@ class HookLineSinkerUI:
                 logging.error(f"Failed to save user ID: {e}")
         return user_id
 
-    def handle_keypress(self, event):
-        current_time = time.time()
-        
-        # reset if too much time passed between keypresses :3
-        if current_time - self.last_key_time > 0.5:
-            self.last_key = None
-        
-        # store current key info :3
-        self.last_key_time = current_time
-        
-        # check for H + B combination   :3
-        if self.last_key == 'h' and event.char.lower() == 'b':
-            self.toggle_mod_limit()
-            
-        self.last_key = event.char.lower()
-
-    def handle_keyrelease(self, event):
-        # reset key tracking after release :3
-        self.last_key = None
-
-    def toggle_mod_limit(self):
-        self.mod_limit_disabled = not self.mod_limit_disabled
-        if self.mod_limit_disabled:
-            messagebox.showinfo("Easter Egg", "Mod selection limit warnings disabled. Please be careful when installing mods.")
-        else:
-            messagebox.showinfo("Easter Egg", "Mod selection limit warnings re-enabled.")
-
     def toggle_dark_mode(self, show_restart_prompt=True):
         is_dark = self.dark_mode.get()
         style = ttk.Style()
@@ -402,21 +2875,7 @@ class HookLineSinkerUI:
             style.map('Treeview',
                       background=[('selected', self.dark_mode_colors['select_bg'])],
                       foreground=[('selected', self.dark_mode_colors['select_fg'])])
-            listboxes = [
-                self.available_listbox,
-                self.installed_listbox,
-                self.mod_details,
-                self.modpacks_listbox,
-                self.modpack_details,
-            ]
-            listboxes = [lb for lb in listboxes if lb is not None]
-            for listbox in listboxes:
-                listbox.configure(
-                    bg=self.dark_mode_colors['bg'],
-                    fg=self.dark_mode_colors['fg'],
-                    selectbackground=self.dark_mode_colors['select_bg'],
-                    selectforeground=self.dark_mode_colors['select_fg']
-                )
+            self.apply_dark_mode_to_lists()
             self.root.configure(bg=self.dark_mode_colors['bg'])
         else:
             style.configure('TFrame', background='')
@@ -447,8 +2906,8 @@ class HookLineSinkerUI:
                 self.available_listbox,
                 self.installed_listbox,
                 self.mod_details,
-                self.modpacks_listbox,
-                self.modpack_details,
+                getattr(self, 'modpacks_listbox', None),
+                getattr(self, 'modpack_details', None),
                 getattr(self, 'save_listbox', None)
             ]
             listboxes = [lb for lb in listboxes if lb is not None]
@@ -469,6 +2928,24 @@ class HookLineSinkerUI:
                 "A restart is required for the theme change to take full effect. Press OK to close HLS. Please manually start it back up.")
             self.root.destroy()
 
+    # colours the plain tk lists, tabs built later call this again for their own lists :3
+    def apply_dark_mode_to_lists(self):
+        listboxes = [
+            self.available_listbox,
+            self.installed_listbox,
+            self.mod_details,
+            getattr(self, 'modpacks_listbox', None),
+            getattr(self, 'modpack_details', None),
+        ]
+        listboxes = [lb for lb in listboxes if lb is not None]
+        for listbox in listboxes:
+            listbox.configure(
+                bg=self.dark_mode_colors['bg'],
+                fg=self.dark_mode_colors['fg'],
+                selectbackground=self.dark_mode_colors['select_bg'],
+                selectforeground=self.dark_mode_colors['select_fg']
+            )
+
     # sets up logging to write to latestlog.txt and fulllatestlog.txt :3
     def setup_logging(self):
         print("Setting up logging system...")
@@ -748,21 +3225,128 @@ class HookLineSinkerUI:
         self.notebook = ttk.Notebook(self.root)
         self.notebook.pack(expand=True, fill='both')
 
-        # create various tabs for different functionalities :3
+        # create various tabs for different functionalities, only the mod manager is built up front :3
+        # the rest get an empty frame now and are built the first time they're selected :3
+        self.tab_frames = {}
+        self.tab_builders = {}
         self.create_mod_manager_tab()
-        self.create_modpacks_tab()
-        self.create_game_manager_tab()
-        self.server_browser_frame = ttk.Frame(self.notebook)
-        self.notebook.add(self.server_browser_frame, text="Server Browser")
-        self.setup_server_browser()
-        self.create_hls_setup_tab()
+        self.add_lazy_tab("Mod Profiles", self.create_modpacks_tab)
+        self.add_lazy_tab("Save Manager", self.create_game_manager_tab)
+        self.server_browser_frame = self.add_lazy_tab("Server Browser", self.setup_server_browser)
+        self.add_lazy_tab("HLS Setup", self.create_hls_setup_tab)
         # self.create_profile_tab() :3
-        self.create_settings_tab()
-        
-        # initialize mod-related functions :3
+        self.add_lazy_tab("HLS Settings", self.create_settings_tab)
+        self.notebook.bind('<<NotebookTabChanged>>', self.on_tab_changed)
+
+    # adds an empty tab that gets filled in by builder the first time it's shown :3
+    def add_lazy_tab(self, title, builder):
+        frame = ttk.Frame(self.notebook)
+        self.notebook.add(frame, text=title)
+        self.tab_frames[title] = frame
+        self.tab_builders[str(frame)] = builder
+        return frame
+
+    # builds a lazy tab if it hasn't been built yet, tab is the tab's frame or its widget name :3
+    def build_tab(self, tab):
+        builder = self.tab_builders.pop(str(tab), None)
+        if not builder:
+            return
+        start = time.perf_counter()
+        builder()
+        logging.debug(f"Built tab {self.notebook.tab(tab, 'text')} in {(time.perf_counter() - start) * 1000:.0f}ms")
+        if self.dark_mode.get():
+            self.apply_dark_mode_to_lists()
+
+    def on_tab_changed(self, event=None):
+        self.build_tab(self.notebook.select())
+
+    # runs the startup work that needs mod data once the first window is already on screen :3
+    def finish_startup(self):
+        # initialize mod-related functions, thunderstore mods show up once the startup fetches land :3
         self.copy_existing_gdweave_mods()
-        self.load_available_mods()
+        self.start_startup_fetches()
         self.refresh_mod_lists()
+        self.restore_install_queue()
+
+        # check for updates on startup and show discord prompt :3
+        self.check_for_fresh_update()
+        self.show_discord_prompt()
+        self.check_for_duplicate_mods()
+
+        if self.fresh_update:
+            self.show_update_complete()
+
+        # start update checking thread :3
+        self.update_thread = threading.Thread(target=self.periodic_update_check, daemon=True)
+        self.update_thread.start()
+
+    # sends every request startup needs at once, so startup waits for the slowest one instead of all of them in a row :3
+    def start_startup_fetches(self):
+        def fetch_json(url, deadline, **kwargs):
+            response = self.http.get(url, timeout=deadline, **kwargs)
+            response.raise_for_status()
+            return response.json()
+
+        def fetch_gdweave_version():
+            data = fetch_json("https://api.github.com/repos/NotNite/GDWeave/releases/latest",
+                              STARTUP_FETCH_DEADLINES['gdweave_version'],
+                              headers={'Accept': 'application/vnd.github.v3+json'})
+            return data['tag_name'].lstrip('v')
+
+        urls = {
+            'thunderstore': "https://thunderstore.io/c/webfishing/api/v1/package/",
+            'servers': "https://hooklinesinker.lol/servers",
+            'hls_version': "https://hooklinesinker.lol/download/version.json",
+            'program_version': "https://raw.githubusercontent.com/isovel/HookLineSinker/main/version.json"
+        }
+        fetches = {
+            name: (lambda url=url, deadline=STARTUP_FETCH_DEADLINES[name]: fetch_json(url, deadline), STARTUP_FETCH_DEADLINES[name])
+            for name, url in urls.items()
+        }
+        fetches['gdweave_version'] = (fetch_gdweave_version, STARTUP_FETCH_DEADLINES['gdweave_version'])
+
+        self.startup_fetch_pending = True
+        self.set_status("Loading mods...")
+        self.network_loop.fetch_all(
+            fetches,
+            lambda name, value, error: self.ui_batcher.call(self.on_startup_fetch, name, value, error),
+            lambda results: self.ui_batcher.call(self.finish_startup_fetches)
+        )
+
+    # runs on the ui thread as each startup fetch comes back :3
+    def on_startup_fetch(self, name, value, error):
+        if error:
+            logging.warning(f"Startup fetch {name} failed: {error}")
+            if name == 'thunderstore':
+                self.startup_fetch_pending = False
+                self.set_status(f"Failed to load mods: {error}")
+            return
+
+        self.prefetched[name] = (value, time.time())
+        if name == 'thunderstore':
+            self.startup_fetch_pending = False
+            self.load_available_mods(value)
+            self.set_status(f"Loaded {len(self.available_mods)} mods")
+        elif name == 'servers' and hasattr(self, 'server_listbox') and not self.server_refresh_in_progress:
+            self.finish_server_refresh(value)
+        elif name == 'hls_version' and hasattr(self, 'latest_version_label'):
+            self.latest_version_label.config(text=f"Latest Version: {value.get('version', 'Unknown')}")
+
+    # update checks need the mod list and version info, so they wait until every startup fetch has landed :3
+    def finish_startup_fetches(self):
+        self.startup_fetch_pending = False
+        if self.auto_update.get():
+            self.check_for_updates(silent=True)
+        else:
+            self.check_for_program_updates()
+            logging.info("Auto update is disabled, not prompting for any updates or program updates")
+
+    # a result from the startup fetches if it's still fresh, otherwise None and the caller fetches it itself :3
+    def get_prefetched(self, name):
+        value, fetched_at = self.prefetched.get(name, (None, 0))
+        if time.time() - fetched_at > PREFETCH_TTL:
+            return None
+        return value
 
     def create_mod_manager_tab(self):
         # create the mod manager tab for managing game modifications :3
@@ -796,9 +3380,15 @@ class HookLineSinkerUI:
         search_entry = ttk.Entry(search_frame, textvariable=self.search_var)
         search_entry.grid(row=0, column=1, sticky="ew", padx=5)
 
+        # search mode selector :3
+        available_mode = ttk.Combobox(search_frame, state="readonly", width=6,
+            values=["Exact", "Fuzzy"], textvariable=self.available_search_mode)
+        available_mode.grid(row=0, column=2, padx=(0, 5))
+        available_mode.bind('<<ComboboxSelected>>', lambda e: (self.filter_available_mods(), self.save_search_modes()))
+
         # create collapsible advanced filter section :3
         self.advanced_filters_visible = tk.BooleanVar(value=False)
-        ttk.Button(search_frame, text="Advanced Filters", command=self.toggle_advanced_filters).grid(row=0, column=2, padx=5)
+        ttk.Button(search_frame, text="Advanced Filters", command=self.toggle_advanced_filters).grid(row=0, column=3, padx=5)
 
         # create advanced filter frame (hidden by default) :3
         self.filter_frame = ttk.LabelFrame(available_frame, text="Advanced Filters")
@@ -838,6 +3428,9 @@ class HookLineSinkerUI:
         self.available_listbox.grid(row=2, column=0, pady=(2,2), padx=2, sticky="nsew")
         self.available_listbox.bind('<<ListboxSelect>>', self.on_available_listbox_select)
         self.available_listbox.bind('<Button-3>', self.show_context_menu)
+        self.instrument_latency(search_entry, '<KeyPress>', "Thunderstore search keystroke")
+        self.instrument_latency(self.available_listbox, '<<ListboxSelect>>', "Thunderstore list selection")
+        self.instrument_latency(self.available_listbox, '<Button-3>', "Thunderstore context menu")
 
         # add scrollbar :3
         scrollbar = ttk.Scrollbar(available_frame, orient="vertical", command=self.available_listbox.yview)
@@ -876,6 +3469,11 @@ class HookLineSinkerUI:
         ttk.Button(misc_frame, text="Import ZIP Mod", command=self.import_zip_mod).grid(row=0, column=0, padx=2, pady=2, sticky="ew")
         ttk.Button(misc_frame, text="Refresh Mods", command=self.refresh_all_mods).grid(row=1, column=0, pady=2, padx=2, sticky="ew")
         ttk.Button(misc_frame, text="Check for Updates", command=self.check_for_updates).grid(row=2, column=0, pady=2, padx=2, sticky="ew")
+        self.install_queue_button = ttk.Button(misc_frame, text="Install Queue", command=self.show_install_queue)
+        self.install_queue_button.grid(row=3, column=0, pady=2, padx=2, sticky="ew")
+        # overall progress of the current batch of installs :3
+        self.install_batch_bar = ttk.Progressbar(misc_frame, mode='determinate', maximum=100)
+        self.install_batch_bar.grid(row=4, column=0, pady=2, padx=2, sticky="ew")
 
         # create helpful links section :3
         help_frame = ttk.LabelFrame(action_frame, text="Helpful Links")
@@ -901,10 +3499,16 @@ class HookLineSinkerUI:
         installed_search_entry = ttk.Entry(installed_search_frame, textvariable=self.installed_search_var)
         installed_search_entry.grid(row=0, column=1, sticky="ew", padx=5)
 
+        # search mode selector :3
+        installed_mode = ttk.Combobox(installed_search_frame, state="readonly", width=6,
+            values=["Exact", "Fuzzy"], textvariable=self.installed_search_mode)
+        installed_mode.grid(row=0, column=2, padx=(0, 5))
+        installed_mode.bind('<<ComboboxSelected>>', lambda e: (self.filter_installed_mods(), self.save_search_modes()))
+
         # create collapsible advanced filter section :3
         self.installed_filters_visible = tk.BooleanVar(value=False)
-        ttk.Button(installed_search_frame, text="Advanced Filters", 
-                  command=self.toggle_installed_filters).grid(row=0, column=2, padx=5)
+        ttk.Button(installed_search_frame, text="Advanced Filters",
+                  command=self.toggle_installed_filters).grid(row=0, column=3, padx=5)
 
         # create advanced filter frame (hidden by default) :3
         self.installed_filter_frame = ttk.LabelFrame(installed_frame, text="Advanced Filters")
@@ -943,6 +3547,9 @@ class HookLineSinkerUI:
 
         self.installed_listbox.bind('<<ListboxSelect>>', lambda e: (self.update_mod_details(e), self.update_button_states()))
         self.installed_listbox.bind('<Button-3>', self.show_context_menu)
+        self.instrument_latency(installed_search_entry, '<KeyPress>', "Installed search keystroke")
+        self.instrument_latency(self.installed_listbox, '<<ListboxSelect>>', "Installed list selection")
+        self.instrument_latency(self.installed_listbox, '<Button-3>', "Installed context menu")
 
         installed_frame.grid_columnconfigure(0, weight=1)
         installed_frame.grid_rowconfigure(2, weight=1)
@@ -963,8 +3570,7 @@ class HookLineSinkerUI:
         self.update_button_states()
         
     def create_modpacks_tab(self):
-        modpacks_frame = ttk.Frame(self.notebook)
-        self.notebook.add(modpacks_frame, text="Mod Profiles")
+        modpacks_frame = self.tab_frames["Mod Profiles"]
 
         modpacks_frame.grid_columnconfigure(0, weight=1)
         modpacks_frame.grid_rowconfigure(2, weight=1)
@@ -1019,9 +3625,6 @@ class HookLineSinkerUI:
         details_scrollbar.grid(row=0, column=1, sticky="ns", pady=5, padx=(0,5))
         self.modpack_details.config(state='disabled')
 
-        self.modpacks_dir = os.path.join(self.app_data_dir, "modpacks")
-        os.makedirs(self.modpacks_dir, exist_ok=True)
-
         self.refresh_modpacks_list()
 
     def create_modpack_window(self):
@@ -1153,7 +3756,7 @@ class HookLineSinkerUI:
                     'api_paste_expire_date': 'N'
                 }
                 
-                response = requests.post(api_url, data=data)
+                response = self.http.post(api_url, data=data)
                 if response.status_code == 200 and response.text.startswith('https://pastebin.com/'):
                     paste_id = response.text.split('/')[-1]
                     
@@ -1215,7 +3818,7 @@ class HookLineSinkerUI:
 
         try:
             # fetch paste content :3
-            response = requests.get(f'https://pastebin.com/raw/{paste_id}')
+            response = self.http.get(f'https://pastebin.com/raw/{paste_id}')
             if response.status_code != 200:
                 raise Exception("Failed to fetch mod profile data")
 
@@ -1267,6 +3870,8 @@ class HookLineSinkerUI:
             self.set_status(error_message)
 
     def refresh_modpacks_list(self):
+        if not hasattr(self, 'modpacks_listbox'):
+            return
         self.modpacks_listbox.delete(0, tk.END)
         for file in os.listdir(self.modpacks_dir):
             if file.endswith('.json'):
@@ -1323,65 +3928,82 @@ class HookLineSinkerUI:
                 with open(modpack_path) as f:
                     modpack_info = json.load(f)
 
-                # disable all currently installed mods :3
-                for mod in self.installed_mods:
-                    mod['enabled'] = False
-                    self.save_mod_info(mod)
-
-                # process each mod in the modpack :3
+                # work out what needs downloading before touching anything :3
+                to_enable = []
+                to_install = []  # (mod to install, installed version it replaces or None) :3
                 for mod_entry in modpack_info['mods']:
                     mod_id = mod_entry['id']
                     
                     # check if mod exists :3
                     existing_mod = next((mod for mod in self.installed_mods if mod['id'] == mod_id), None)
                     
-                    if existing_mod:
-                        # check if versions match :3
-                        if existing_mod.get('version') != mod_entry.get('version'):
-                            # find the specific version in available mods :3
-                            if mod_entry.get('thunderstore_id'):
-                                available_mod = next((mod for mod in self.available_mods 
-                                            if mod['thunderstore_id'] == mod_entry['thunderstore_id']), None)
-                                if available_mod:
-                                    # uninstall current version :3
-                                    self.uninstall_mod_files(existing_mod)
-                                    # install specific version :3
-                                    temp_mod = available_mod.copy()
-                                    temp_mod.update({
-                                        'version': mod_entry['version'],
-                                        'id': mod_id,
-                                        'third_party': mod_entry.get('third_party', False)
-                                    })
-                                    self.download_and_install_mod(temp_mod)
-                                    continue
-
-                        # enable existing mod if version matches or couldn't find/install specific version :3
-                        existing_mod['enabled'] = True
-                        self.save_mod_info(existing_mod)
-                    else:
-                        # install mod if it doesn't exist :3
-                        if mod_entry.get('thunderstore_id'):
-                            available_mod = next((mod for mod in self.available_mods 
-                                            if mod['thunderstore_id'] == mod_entry['thunderstore_id']), None)
-                            if available_mod:
-                                temp_mod = available_mod.copy()
-                                temp_mod.update({
-                                    'version': mod_entry['version'],
-                                    'id': mod_id,
-                                    'third_party': mod_entry.get('third_party', False)
-                                })
-                                self.download_and_install_mod(temp_mod)
+                    # check if versions match :3
+                    if existing_mod and existing_mod.get('version') == mod_entry.get('version'):
+                        to_enable.append(existing_mod)
+                        continue
 
-                # refresh UI :3
-                self.refresh_mod_lists()
-                messagebox.showinfo("Success", f"Mod profile '{modpack_name}' applied successfully!")
-                self.set_status(f"Applied mod profile: {modpack_name}")
+                    # find the specific version in available mods :3
+                    available_mod = None
+                    if mod_entry.get('thunderstore_id'):
+                        available_mod = next((mod for mod in self.available_mods 
+                                    if mod['thunderstore_id'] == mod_entry['thunderstore_id']), None)
+                    if available_mod:
+                        temp_mod = available_mod.copy()
+                        temp_mod.update({
+                            'version': mod_entry['version'],
+                            'id': mod_id,
+                            'third_party': mod_entry.get('third_party', False)
+                        })
+                        to_install.append((temp_mod, existing_mod))
+                    elif existing_mod:
+                        # enable existing mod if we couldn't find the specific version :3
+                        to_enable.append(existing_mod)
+
+                # make sure the downloads fit on disk before anything moves :3
+                self.preflight_install_plan(
+                    [temp_mod for temp_mod, existing_mod in to_install],
+                    lambda plan: self.finish_apply_modpack(modpack_name, to_enable, to_install, plan)
+                )
 
             except Exception as e:
                 error_message = f"Failed to apply mod profile: {str(e)}"
                 messagebox.showerror("Error", error_message)
                 self.set_status(error_message)
 
+    # second half of apply_modpack, once the disk space check has decided which downloads go ahead :3
+    def finish_apply_modpack(self, modpack_name, to_enable, to_install, plan):
+        if to_install and not plan:
+            return
+        try:
+            # mods that didn't fit keep whatever version is already installed :3
+            to_enable.extend(existing_mod for temp_mod, existing_mod in to_install[len(plan):] if existing_mod)
+
+            # disable all currently installed mods :3
+            for mod in self.installed_mods:
+                mod['enabled'] = False
+                self.save_mod_info(mod)
+
+            for mod in to_enable:
+                mod['enabled'] = True
+                self.save_mod_info(mod)
+
+            for temp_mod, existing_mod in to_install[:len(plan)]:
+                if existing_mod:
+                    # uninstall current version :3
+                    self.uninstall_mod_files(existing_mod)
+                # install specific version :3
+                self.download_and_install_mod(temp_mod)
+
+            # refresh UI :3
+            self.refresh_mod_lists()
+            messagebox.showinfo("Success", f"Mod profile '{modpack_name}' applied successfully!")
+            self.set_status(f"Applied mod profile: {modpack_name}")
+
+        except Exception as e:
+            error_message = f"Failed to apply mod profile: {str(e)}"
+            messagebox.showerror("Error", error_message)
+            self.set_status(error_message)
+
     # i'm trying a new thing! maybe i should document my code more lmao :3
     def save_mod_info(self, mod):
         """Saves the mod information to its mod_info.json file"""
@@ -1452,8 +4074,68 @@ class HookLineSinkerUI:
 
     def on_available_listbox_select(self, event):
         self.update_mod_details(event)
-        self.check_selection_limit(event)
         self.update_button_states()
+        self.schedule_prefetch()
+
+    # waits for the selection to settle before prefetching, any change cancels what was being fetched :3
+    def schedule_prefetch(self):
+        if self.prefetch_after:
+            self.root.after_cancel(self.prefetch_after)
+            self.prefetch_after = None
+        self.prefetcher.cancel()
+        if self.speculative_prefetch.get():
+            self.prefetch_after = self.root.after(PREFETCH_DWELL_MS, self.start_prefetch)
+
+    # the selected mod plus whatever it needs that isn't installed, skipped while real installs are using the network :3
+    def start_prefetch(self):
+        self.prefetch_after = None
+        selection = self.available_listbox.curselection()
+        if len(selection) != 1 or self.install_executor.busy():
+            return
+        selected_title = self.available_listbox.get(selection[0])
+        selected_title = re.sub(r'^[✅❌]\s*(?:\[3rd\]\s*)?', '', selected_title)
+        if selected_title.startswith(('--', 'Category:')):
+            return
+        # looked up in the available list the same way install_mod does, the selection may not be known there :3
+        mods_by_name = {}
+        for available_mod in self.available_mods:
+            mods_by_name.setdefault(self.get_backend_name(available_mod['title'].strip()), available_mod)
+        mod = mods_by_name.get(self.get_backend_name(selected_title.replace('[3rd]', '').strip()))
+        if not mod or not mod.get('download'):
+            return
+        # nothing to fetch for a mod that's already installed at this version :3
+        if any(m.get('thunderstore_id') == mod.get('thunderstore_id') and m.get('version') == mod.get('version')
+               for m in self.installed_mods):
+            return
+
+        mods = [mod]
+        for dep in self.check_mod_dependencies(mod):
+            thunderstore_id = '-'.join(dep.split('-')[:2])
+            if dep_mod := next((m for m in self.available_mods if m.get('thunderstore_id') == thunderstore_id), None):
+                mods.append(dep_mod)
+        logging.info(f"Prefetching {len(mods)} archive{'s' if len(mods) != 1 else ''} for {mod['title']}")
+        self.prefetcher.prefetch(mods)
+
+    # downloads one archive straight into the archive cache, returns False if it was already there :3
+    def prefetch_mod_archive(self, mod, throttle):
+        cache_key = ArchiveCache.make_key(mod)
+        if not cache_key or self.archive_cache.lookup(cache_key) or InstallJob.package_key(mod) in self.install_executor.active:
+            return False
+        temp_dir = os.path.join(self.app_data_dir, 'temp')
+        os.makedirs(temp_dir, exist_ok=True)
+        zip_path = os.path.join(temp_dir, f"prefetch_{uuid.uuid4().hex}.zip")
+        try:
+            # large archives still need the user to agree to them, so they wait for a real install :3
+            archive_sha256 = self.stream_from_sources(
+                mod, zip_path, self.get_download_sources(mod), throttle=throttle, interactive=False, capped=True
+            )
+            self.archive_cache.put(cache_key, zip_path, archive_sha256)
+            logging.info(f"Prefetched {mod['title']} into the archive cache")
+            self.ui_batcher.set('archive_cache_label', self.update_archive_cache_label)
+            return True
+        finally:
+            if os.path.exists(zip_path):
+                os.remove(zip_path)
         
     def update_button_states(self):
         # get current selections :3
@@ -1491,40 +4173,11 @@ class HookLineSinkerUI:
 
         # update game management button state based on setup status :3
         start_game_btn = self.game_management_frame.winfo_children()[0]
-        start_game_btn.configure(state='normal' if self.check_setup() else 'disabled')
-
-    def check_selection_limit(self, event):
-        listbox = event.widget
-        if listbox != self.available_listbox:
-            return
-        
-        if self.mod_limit_disabled:
-            return
-            
-        selected = listbox.curselection()
-        
-        # ignore category headers :3
-        actual_mods = [i for i in selected if not listbox.get(i).startswith('--')]
-        
-        if len(actual_mods) > 10:
-            # keep only the first 10 selections :3
-            listbox.selection_clear(0, tk.END)
-            for i in actual_mods[:10]:
-                listbox.selection_set(i)
-            messagebox.showwarning("Selection Limit", "You can only select up to 10 mods for installation at once.")
-        elif len(actual_mods) > 3 and not self.multi_mod_warning_shown:
-            # show warning only once and allow the selection :3
-            messagebox.showwarning("Performance Warning", 
-                "You have selected more than 3 mods for installation.\n\n"
-                "The program may become unresponsive while downloading and installing multiple mods.\n\n"
-                "This is normal and the program will recover once the installation is complete.")
-            self.multi_mod_warning_shown = True
+        start_game_btn.configure(state='normal' if self.check_setup() else 'disabled')
 
     def set_status_safe(self, message):
-        if threading.current_thread() is threading.main_thread():
-            self.set_status(message)
-        else:
-            self.root.after(0, self.set_status, message)
+        # set_status goes through the ui batcher so it's safe from any thread now :3
+        self.set_status(message)
 
     def _format_timestamp(self, timestamp):
         try:
@@ -1576,7 +4229,9 @@ class HookLineSinkerUI:
         self.mod_details.config(state='disabled')
         
     def filter_available_mods(self, event=None):
-        search_text = self.search_var.get().lower()
+        # pull author:/category:/downloads>/updated< style predicates out of the search text :3
+        query = parse_search_query(self.search_var.get())
+        search_text = query.text.lower()
         selected_category = self.available_category.get()
         self.available_listbox.delete(0, tk.END)
         
@@ -1586,33 +4241,40 @@ class HookLineSinkerUI:
             if not mod.get('third_party', False)
         }
         
+        fuzzy = bool(search_text) and self.available_search_mode.get() == "Fuzzy"
+        candidate_mods = self.available_query_index.execute(query) if query.structured else self.available_mods
+
         filtered_mods = []
-        for mod in self.available_mods:
+        for mod in candidate_mods:
             # skip if mod is already installed :3
             if mod['title'] in installed_mod_titles:
                 continue
-                
+
             # only show modpacks in the Modpacks category :3
             if "Modpacks" in mod.get('categories', []) and selected_category != "Modpacks":
                 continue
-                
-            # check if mod matches search criteria :3
-            if search_text and not (
-                search_text in mod['title'].lower() or 
-                search_text in mod.get('author', '').lower() or 
+
+            # check if mod matches search criteria (fuzzy mode ranks with the index below) :3
+            if search_text and not fuzzy and not (
+                search_text in mod['title'].lower() or
+                search_text in mod.get('author', '').lower() or
                 search_text in mod.get('description', '').lower()
             ):
                 continue
-                
+
             # check if mod matches category filter :3
             if selected_category != "All" and selected_category not in mod.get('categories', []):
                 continue
-                
+
             filtered_mods.append(mod)
 
-        # sort the filtered mods based on selected method :3
+        # sort the filtered mods based on selected method, fuzzy results come back already ranked :3
         sort_method = self.sort_method.get()
-        if sort_method == "Last Updated":
+        if fuzzy:
+            mods_by_id = {mod['id']: mod for mod in filtered_mods}
+            ranked = self.available_search_index.search(search_text, allowed=set(mods_by_id))
+            filtered_mods = [mods_by_id[key] for key, _ in ranked]
+        elif sort_method == "Last Updated":
             filtered_mods.sort(key=lambda x: x.get('updated_on', ''), reverse=True)
         elif sort_method == "Most Downloads":
             filtered_mods.sort(key=lambda x: x.get('downloads', 0), reverse=True)
@@ -1739,7 +4401,8 @@ class HookLineSinkerUI:
             
             self.large_mod_list_warning_shown = True
             
-        search_text = self.installed_search_var.get().lower()
+        query = parse_search_query(self.installed_search_var.get())
+        search_text = query.text.lower()
         selected_filter = self.installed_category.get()
         
         # clear current items :3
@@ -1747,14 +4410,20 @@ class HookLineSinkerUI:
         
         # store filtered mods :3
         self.filtered_installed_mods = []
-        
-        for mod in self.installed_mods:
+
+        fuzzy = bool(search_text) and self.installed_search_mode.get() == "Fuzzy"
+        candidate_mods = self.installed_mods
+        if query.structured:
+            self.refresh_installed_search_index()
+            candidate_mods = self.installed_query_index.execute(query)
+
+        for mod in candidate_mods:
             # skip if hiding third party mods :3
             if self.hide_third_party.get() and mod.get('third_party', False):
                 continue
-                
-            # apply search filter :3
-            if search_text and search_text not in self.get_display_name(mod['title']).lower():
+
+            # apply search filter (fuzzy mode ranks with the index below) :3
+            if search_text and not fuzzy and search_text not in self.get_display_name(mod['title']).lower():
                 continue
                 
             # apply status/category filter :3
@@ -1770,9 +4439,14 @@ class HookLineSinkerUI:
             # add to filtered list :3
             self.filtered_installed_mods.append(mod)
         
-        # apply sorting :3
+        # apply sorting, fuzzy results come back already ranked :3
         sort_method = self.installed_sort_method.get()
-        if sort_method == "Name (A-Z)":
+        if fuzzy:
+            self.refresh_installed_search_index()
+            mods_by_key = {self.get_installed_search_key(mod): mod for mod in self.filtered_installed_mods}
+            ranked = self.installed_search_index.search(search_text, allowed=set(mods_by_key))
+            self.filtered_installed_mods = [mods_by_key[key] for key, _ in ranked]
+        elif sort_method == "Name (A-Z)":
             self.filtered_installed_mods.sort(key=lambda x: self.get_display_name(x['title']).lower())
         elif sort_method == "Name (Z-A)":
             self.filtered_installed_mods.sort(key=lambda x: self.get_display_name(x['title']).lower(), reverse=True)
@@ -1801,7 +4475,7 @@ class HookLineSinkerUI:
         """Launch the game with mods enabled"""
         if not self.check_setup():
             messagebox.showinfo("Setup Required", "Please follow all the steps for installation in the HLS Setup tab.")
-            self.notebook.select(3)  # switch to hls setup tab :3
+            self.select_tab("HLS Setup")
             return
 
         if not self.settings.get('game_path'):
@@ -1825,7 +4499,7 @@ class HookLineSinkerUI:
         """Launch the game without mods"""
         if not self.check_setup():
             messagebox.showinfo("Setup Required", "Please follow all the steps for installation in the HLS Setup tab.")
-            self.notebook.select(3)  # switch to hls setup tab :3
+            self.select_tab("HLS Setup")
             return
 
         if not self.settings.get('game_path'):
@@ -1846,8 +4520,7 @@ class HookLineSinkerUI:
 
     def create_game_manager_tab(self):
         # create the game manager tab for managing save files :3
-        game_manager_frame = ttk.Frame(self.notebook)
-        self.notebook.add(game_manager_frame, text="Save Manager")
+        game_manager_frame = self.tab_frames["Save Manager"]
 
         game_manager_frame.grid_columnconfigure(0, weight=1)
         game_manager_frame.grid_rowconfigure(5, weight=1)  # increased to accommodate the subtitle :3
@@ -1935,7 +4608,9 @@ class HookLineSinkerUI:
         self.refresh_backup_list()
 
     def refresh_backup_list(self):
-        # refresh the list of backups in the treeview :3
+        # refresh the list of backups in the treeview, nothing to do until the save manager tab is built :3
+        if not hasattr(self, 'backup_tree'):
+            return
         for i in self.backup_tree.get_children():
             self.backup_tree.delete(i)
     
@@ -1959,16 +4634,16 @@ class HookLineSinkerUI:
                             # fall back to file modification time :3
                             formatted_time = datetime.fromtimestamp(timestamp).strftime("%I:%M%p %d/%m/%Y")
                         
-                        backups.append((name, formatted_time, timestamp))
+                        backups.append((name, formatted_time, timestamp, backup))
                     else:
-                        backups.append((backup, 'Unknown', timestamp))
+                        backups.append((backup, 'Unknown', timestamp, backup))
             
             # sort backups by timestamp (most recent first) :3
             backups.sort(key=lambda x: x[2], reverse=True)
             
-            # insert into treeview :3
-            for name, formatted_time, _ in backups:
-                self.backup_tree.insert('', 'end', values=(name, formatted_time))
+            # insert into treeview, each row's item id is its file name so backups with the same name stay apart :3
+            for name, formatted_time, _, backup in backups:
+                self.backup_tree.insert('', 'end', iid=backup, values=(name, formatted_time))
                 
         self.set_status("Backup list refreshed")
 
@@ -2082,16 +4757,14 @@ class HookLineSinkerUI:
         backup_name = item['values'][0]
         
         backup_dir = os.path.join(self.app_data_dir, 'save_backups')
-        matching_backups = [f for f in os.listdir(backup_dir) if f.startswith(backup_name.replace(' ', '_')) and f.endswith('.save')]
+        backup_filename = selected[0]
         
-        if not matching_backups:
+        if not os.path.exists(os.path.join(backup_dir, backup_filename)):
             error_message = f"Backup file for '{backup_name}' not found."
             messagebox.showerror("Error", error_message)
             self.set_status(error_message)
             return
         
-        backup_filename = matching_backups[0]
-        
         # extract slot number from filename :3
         slot_match = re.search(r'_slot(\d)_', backup_filename)
         if slot_match:
@@ -2241,17 +4914,14 @@ class HookLineSinkerUI:
         
         if messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete the backup '{backup_name}'?"):
             backup_dir = os.path.join(self.app_data_dir, 'save_backups')
-            matching_backups = [f for f in os.listdir(backup_dir) if f.startswith(backup_name.replace(' ', '_')) and f.endswith('.save')]
+            backup_path = os.path.join(backup_dir, selected[0])
             
-            if not matching_backups:
+            if not os.path.exists(backup_path):
                 error_message = f"Backup file for '{backup_name}' not found."
                 messagebox.showerror("Error", error_message)
                 self.set_status(error_message)
                 return
             
-            backup_filename = matching_backups[0]
-            backup_path = os.path.join(backup_dir, backup_filename)
-            
             try:
                 os.remove(backup_path)
                 messagebox.showinfo("Success", f"Backup deleted: {backup_name}")
@@ -2264,8 +4934,7 @@ class HookLineSinkerUI:
 
     # creates the main setup tab for hook line & sinker :3
     def create_hls_setup_tab(self):
-        setup_frame = ttk.Frame(self.notebook)
-        self.notebook.add(setup_frame, text="HLS Setup")
+        setup_frame = self.tab_frames["HLS Setup"]
 
         setup_frame.grid_columnconfigure(0, weight=1)
         setup_frame.grid_rowconfigure(8, weight=1)
@@ -2423,12 +5092,21 @@ class HookLineSinkerUI:
 
         # bind selection event
         self.server_listbox.bind('<<ListboxSelect>>', self.on_server_select)
+        self.instrument_latency(search_entry, '<KeyPress>', "Server search keystroke")
+        self.instrument_latency(self.server_listbox, '<<ListboxSelect>>', "Server list selection")
 
         # store servers data
         self.servers = []
+        self.server_index = ServerIndex()
+        self.server_index_map = []
+        self.server_list_items = []
+        self.server_refresh_in_progress = False
         
-        # initial server load
-        self.refresh_servers()
+        # initial server load, the list fetched at startup is used if it's still fresh
+        if servers := self.get_prefetched('servers'):
+            self.finish_server_refresh(servers)
+        else:
+            self.refresh_servers()
 
     def check_companion_mod(self):
         companion_id = "Pyoid-Hook_Line_and_Sinker_Companion"
@@ -2438,26 +5116,34 @@ class HookLineSinkerUI:
         return False
 
     def refresh_servers(self):
+        # Fetch in the background so the list stays usable while it refreshes
+        if self.server_refresh_in_progress:
+            return
+        self.server_refresh_in_progress = True
+        threading.Thread(target=self._refresh_servers_thread, daemon=True).start()
+
+    def _refresh_servers_thread(self):
         try:
-            response = requests.get("https://hooklinesinker.lol/servers")
+            response = self.http.get("https://hooklinesinker.lol/servers", timeout=15)
             servers = response.json()
-            self.update_server_list(servers)
-            self.set_status(f"Loaded {len(servers)} servers successfully")
+            self.root.after(0, lambda: self.finish_server_refresh(servers))
         except Exception as e:
             error_msg = f"Failed to load servers: {str(e)}"
+            self.root.after(0, lambda: self.finish_server_refresh(None, error_msg))
+
+    def finish_server_refresh(self, servers, error_msg=None):
+        self.server_refresh_in_progress = False
+        if servers is None:
             self.set_status(error_msg)
+            return
+        self.update_server_list(servers)
+        self.set_status(f"Loaded {len(servers)} servers successfully")
 
     def update_server_list(self, servers):
-        # Group servers by host and keep only most recently updated
-        host_servers = {}
-        for server in servers:
-            host = server.get('host')
-            last_updated = server.get('last_updated')
-            if host not in host_servers or last_updated > host_servers[host]['last_updated']:
-                host_servers[host] = server
-                
-        self.servers = list(host_servers.values())
-        self.filter_servers()
+        # Group servers by host and keep only most recently updated, unchanged servers are reused
+        if self.server_index.update(servers):
+            self.servers = self.server_index.servers
+            self.filter_servers()
 
     def on_server_select(self, event):
         selection = self.server_listbox.curselection()
@@ -2553,77 +5239,48 @@ class HookLineSinkerUI:
             messagebox.showerror("Error", "No lobby code available for this server.")
             return
             
-        try:
-            # Check and install required mods
-            if required_mods and not self.check_and_install_server_mods(required_mods):
-                return
+        def launch():
+            try:
+                if not messagebox.askyesno("Join Server", "Ready to join the server? Wait until all mods are installed and enabled before joining (check the bottom left of the screen, when this stops changing you're ready to go!)"):
+                    return
 
-            if not messagebox.askyesno("Join Server", "Ready to join the server? Wait until all mods are installed and enabled before joining (check the bottom left of the screen, when this stops changing you're ready to go!)"):
-                return
+                exe_name = 'webfishing.exe'
+                exe_path = os.path.join(game_path, exe_name)
 
-            exe_name = 'webfishing.exe'
-            exe_path = os.path.join(game_path, exe_name)
-            
-            subprocess.Popen([exe_path, f'--join-code={lobby_code}'])
-            self.set_status(f"Launching game to join server: {server.get('title')}")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to launch game: {str(e)}")
+                subprocess.Popen([exe_path, f'--join-code={lobby_code}'])
+                self.set_status(f"Launching game to join server: {server.get('title')}")
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to launch game: {str(e)}")
+
+        # Check and install required mods, launching once they're queued
+        if required_mods:
+            self.check_and_install_server_mods(required_mods, launch)
+        else:
+            launch()
 
     def filter_servers(self):
+        if not hasattr(self, 'server_index'):
+            return
         search_text = self.server_search_var.get().lower()
         sort_by = self.sort_var.get()
         show_18plus = self.show_18plus.get()
         
-        # Store filtered servers with their original indices
-        filtered_servers_with_index = []
-        for i, server in enumerate(self.servers):
-            title = server.get('title', 'Unnamed Server').lower()
-            map_name = server.get('map', '').lower()
-            current_players = server.get('current_players', 0)
-            age_restricted = server.get('age_restricted', False)
-            
-            # Skip 18+ servers if checkbox is unchecked
-            if age_restricted and not show_18plus:
-                continue
-                
-            # Only include servers with at least 1 player
-            if current_players > 0 and (search_text in title or search_text in map_name):
-                filtered_servers_with_index.append((i, server))
-        
-        # Sort servers based on selected criteria while preserving original index
-        if sort_by == "name":
-            filtered_servers_with_index.sort(key=lambda x: x[1].get('title', 'Unnamed Server').lower())
-        elif sort_by == "region":
-            filtered_servers_with_index.sort(key=lambda x: x[1].get('country', 'Unknown'))
-        elif sort_by == "map":
-            filtered_servers_with_index.sort(key=lambda x: x[1].get('map', 'Unknown').lower())
-        elif sort_by == "player_cap":
-            filtered_servers_with_index.sort(key=lambda x: x[1].get('player_cap', 0), reverse=True)
-        elif sort_by == "slots":
-            filtered_servers_with_index.sort(key=lambda x: x[1].get('player_cap', 0) - x[1].get('current_players', 0), reverse=True)
-        elif sort_by == "version":
-            filtered_servers_with_index.sort(key=lambda x: x[1].get('version', '0.0.0'))
-        
-        # Clear and repopulate listbox
-        self.server_listbox.delete(0, tk.END)
+        # Walk the precomputed sort order, skipping 18+ and empty servers and search misses
+        positions = self.server_index.query(search_text, sort_by, show_18plus)
         
-        # Store mapping of listbox index to original server index
-        self.server_index_map = []
+        # Only touch the listbox rows that actually changed
+        items = [self.server_index.entries[position]['display'] for position in positions]
+        apply_listbox_diff(self.server_listbox, self.server_list_items, items)
+        self.server_list_items = items
         
-        for original_index, server in filtered_servers_with_index:
-            title = server.get('title', 'Unnamed Server')
-            map_name = server.get('map', 'Unknown Map')
-            current_players = server.get('current_players', '?')
-            player_cap = server.get('player_cap', '?')
-            display_text = f"{title} - {map_name.title()} ({current_players}/{player_cap})"
-            self.server_listbox.insert(tk.END, display_text)
-            self.server_index_map.append(original_index)
+        # Store mapping of listbox index to original server index
+        self.server_index_map = positions
         
         # Update server count in frame title
-        self.server_listbox.master.configure(text=f"Available Servers ({len(filtered_servers_with_index)})")
+        self.server_listbox.master.configure(text=f"Available Servers ({len(positions)})")
 
-    def check_and_install_server_mods(self, required_mods):
-        """Check for required mods and offer to install missing ones"""
+    def check_and_install_server_mods(self, required_mods, on_ready):
+        """Check for required mods and offer to install missing ones, on_ready runs once they're queued"""
         missing_mods = []
         disabled_mods = []
         
@@ -2641,7 +5298,8 @@ class HookLineSinkerUI:
                     disabled_mods.append(mod_id)
 
         if not missing_mods and not disabled_mods:
-            return True
+            on_ready()
+            return
 
         # Prepare message for user
         message = "This server requires the following mods:\n\n"
@@ -2665,7 +5323,7 @@ class HookLineSinkerUI:
         message += "Would you like to proceed with the installation/enabling of these mods?"
         
         if not messagebox.askyesno("Mods Required", message):
-            return False
+            return
 
         # Create progress dialog
         progress_dialog = tk.Toplevel(self.root)
@@ -2685,21 +5343,25 @@ class HookLineSinkerUI:
         progress = ttk.Progressbar(progress_dialog, mode='determinate')
         progress.pack(pady=10, padx=20, fill=tk.X)
 
-        def install_mods():
+        # Install missing mods, as many as fit on disk
+        available_by_id = {mod['thunderstore_id']: mod for mod in self.available_mods}
+        available = [available_by_id[mod_id] for mod_id in missing_mods if mod_id in available_by_id]
+
+        def install_mods(plan):
             try:
                 total_steps = len(missing_mods) + len(disabled_mods)
                 current_step = 0
 
-                # Install missing mods
-                for mod_id in missing_mods:
-                    # Find mod in available mods
-                    available_mod = next((mod for mod in self.available_mods 
-                                    if mod['thunderstore_id'] == mod_id), None)
-                    if available_mod:
-                        self.download_and_install_mod(available_mod)
+                if available and not plan:
+                    progress_dialog.destroy()
+                    return
+                for available_mod in plan:
+                    # joining a server shouldn't swamp the connection the game is about to use :3
+                    self.download_and_install_mod(available_mod, background=True)
                     current_step += 1
                     progress['value'] = (current_step / total_steps) * 100
                     progress_dialog.update()
+                current_step = len(missing_mods)
 
                 # Enable disabled mods using our enable_mod method
                 for mod_id in disabled_mods:
@@ -2723,21 +5385,19 @@ class HookLineSinkerUI:
 
                 progress_dialog.destroy()
                 self.refresh_mod_lists()
-                return True
 
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to install mods: {str(e)}")
                 progress_dialog.destroy()
-                return False
+                return
+            on_ready()
 
-        # Run installation in a separate thread
-        result = install_mods()
-        return result
+        # the disk space check runs off the tk thread and hands the plan back to install_mods :3
+        self.preflight_install_plan(available, install_mods)
 
     # creates the settings tab for hook line & sinker :3
     def create_settings_tab(self):
-        settings_frame = ttk.Frame(self.notebook)
-        self.notebook.add(settings_frame, text="HLS Settings")
+        settings_frame = self.tab_frames["HLS Settings"]
         user_id = self.get_user_id()
 
         settings_frame.grid_columnconfigure(0, weight=1)
@@ -2801,18 +5461,60 @@ class HookLineSinkerUI:
         right_frame = ttk.Frame(general_frame)
         right_frame.grid(row=0, column=1, sticky="w", padx=5)
         
-        self.auto_backup = tk.BooleanVar(value=self.settings.get('auto_backup', True))
         ttk.Checkbutton(right_frame, text="Auto-backup saves on launch", variable=self.auto_backup, command=self.save_settings).grid(row=0, column=0, pady=2, sticky="w")
         
-        self.suppress_mod_warning = tk.BooleanVar(value=self.settings.get('suppress_mod_warning', False))
         ttk.Checkbutton(right_frame, text="Suppress mod count warning", variable=self.suppress_mod_warning, command=self.save_settings).grid(row=1, column=0, pady=2, sticky="w")
 
+        ttk.Checkbutton(right_frame, text="Measure UI latency", variable=self.latency_tracking, command=self.toggle_latency_tracking).grid(row=2, column=0, pady=2, sticky="w")
+
         update_frame = ttk.Frame(general_frame)
         update_frame.grid(row=4, column=0, columnspan=2, pady=5, padx=5, sticky="w")
         update_frame.grid_columnconfigure(1, weight=1)
 
         ttk.Button(update_frame, text="Check for Updates", command=self.check_for_updates).grid(row=0, column=0, pady=2, sticky="w")
 
+        # how many mods get downloaded at once, and how many get extracted and copied into place at once :3
+        workers_frame = ttk.Frame(general_frame)
+        workers_frame.grid(row=5, column=0, columnspan=2, pady=5, padx=5, sticky="w")
+        ttk.Label(workers_frame, text="Simultaneous downloads:").grid(row=0, column=0, sticky="w")
+        self.install_workers = tk.IntVar(value=self.install_executor.workers)
+        ttk.Spinbox(workers_frame, from_=1, to=MAX_INSTALL_WORKERS, width=4, textvariable=self.install_workers,
+                    command=self.save_install_workers, state="readonly").grid(row=0, column=1, padx=5, sticky="w")
+        ttk.Label(workers_frame, text="Simultaneous extracts:").grid(row=0, column=2, padx=(10, 0), sticky="w")
+        self.deploy_workers = tk.IntVar(value=self.deploy_stage.workers)
+        ttk.Spinbox(workers_frame, from_=1, to=MAX_DEPLOY_WORKERS, width=4, textvariable=self.deploy_workers,
+                    command=self.save_deploy_workers, state="readonly").grid(row=0, column=3, padx=5, sticky="w")
+
+        # size cap and hit rate of the downloaded archive cache :3
+        cache_frame = ttk.Frame(general_frame)
+        cache_frame.grid(row=6, column=0, columnspan=2, pady=5, padx=5, sticky="w")
+        ttk.Label(cache_frame, text="Download cache size (MB):").grid(row=0, column=0, sticky="w")
+        self.archive_cache_mb = tk.IntVar(value=self.archive_cache.max_bytes // 1048576)
+        ttk.Spinbox(cache_frame, from_=0, to=20480, increment=256, width=6, textvariable=self.archive_cache_mb,
+                    command=self.save_archive_cache_limit).grid(row=0, column=1, padx=5, sticky="w")
+        ttk.Button(cache_frame, text="Clear Download Cache", command=self.clear_archive_cache).grid(row=0, column=2, padx=5, sticky="w")
+        self.archive_cache_label = ttk.Label(cache_frame, text="")
+        self.archive_cache_label.grid(row=1, column=0, columnspan=3, pady=2, sticky="w")
+        self.update_archive_cache_label()
+
+        # download speed caps, automatic updates and server join installs count as background :3
+        bandwidth_frame = ttk.Frame(general_frame)
+        bandwidth_frame.grid(row=7, column=0, columnspan=2, pady=5, padx=5, sticky="w")
+        ttk.Label(bandwidth_frame, text="Download speed limit in KB/s (0 = unlimited):").grid(row=0, column=0, columnspan=4, sticky="w")
+        self.foreground_limit = tk.IntVar(value=self.settings.get('foreground_limit_kbps', 0))
+        self.background_limit = tk.IntVar(value=self.settings.get('background_limit_kbps', 0))
+        self.prefetch_limit = tk.IntVar(value=self.settings.get('prefetch_limit_kbps', PREFETCH_LIMIT_KBPS))
+        limits = (("Foreground:", self.foreground_limit), ("Background:", self.background_limit), ("Prefetch:", self.prefetch_limit))
+        for column, (label, variable) in enumerate(limits):
+            ttk.Label(bandwidth_frame, text=label).grid(row=1, column=column * 2, pady=2, sticky="w")
+            spinbox = ttk.Spinbox(bandwidth_frame, from_=0, to=1048576, increment=256, width=8, textvariable=variable,
+                                  command=self.save_bandwidth_limits)
+            spinbox.grid(row=1, column=column * 2 + 1, padx=5, pady=2, sticky="w")
+            spinbox.bind('<Return>', lambda e: self.save_bandwidth_limits())
+            spinbox.bind('<FocusOut>', lambda e: self.save_bandwidth_limits())
+        ttk.Checkbutton(bandwidth_frame, text="Prefetch the selected mod in the background so installs finish faster",
+                        variable=self.speculative_prefetch, command=self.toggle_speculative_prefetch).grid(row=2, column=0, columnspan=6, pady=2, sticky="w")
+
         # hook line & sinker information :3
         info_frame = ttk.LabelFrame(settings_frame, text="Hook, Line, & Sinker Information")
         info_frame.grid(row=3, column=0, pady=10, padx=20, sticky="ew")
@@ -2835,6 +5537,44 @@ class HookLineSinkerUI:
         ttk.Button(info_frame, text="View Credits", command=self.show_credits).grid(row=2, column=2, pady=5, padx=5, sticky="ew")
 
         # troubleshooting options :3
+        # lan mod sharing and download mirrors :3
+        sharing_frame = ttk.LabelFrame(settings_frame, text="Download Sources")
+        sharing_frame.grid(row=4, column=0, pady=10, padx=20, sticky="ew")
+        sharing_frame.grid_columnconfigure(1, weight=1)
+
+        self.peer_cache_serve = tk.BooleanVar(value=self.settings.get('peer_cache_serve', False))
+        ttk.Checkbutton(sharing_frame, text="Share downloaded mods with other PCs on this network", variable=self.peer_cache_serve,
+                        command=self.save_peer_cache_settings).grid(row=0, column=0, columnspan=3, pady=2, padx=5, sticky="w")
+        self.peer_cache_use = tk.BooleanVar(value=self.settings.get('peer_cache_use', False))
+        ttk.Checkbutton(sharing_frame, text="Download mods from other PCs on this network first", variable=self.peer_cache_use,
+                        command=self.save_peer_cache_settings).grid(row=1, column=0, columnspan=3, pady=2, padx=5, sticky="w")
+
+        ttk.Label(sharing_frame, text="Peer addresses:").grid(row=2, column=0, pady=2, padx=5, sticky="w")
+        self.peer_addresses = tk.StringVar(value=self.settings.get('peer_addresses', ''))
+        peer_entry = ttk.Entry(sharing_frame, textvariable=self.peer_addresses)
+        peer_entry.grid(row=2, column=1, pady=2, padx=5, sticky="ew")
+        peer_entry.bind('<Return>', lambda e: self.save_peer_cache_settings())
+        peer_entry.bind('<FocusOut>', lambda e: self.save_peer_cache_settings())
+        ttk.Label(sharing_frame, text="(comma separated, only these are used unless the option below is on)").grid(row=2, column=2, pady=2, padx=5, sticky="w")
+        self.peer_trust_discovered = tk.BooleanVar(value=self.settings.get('peer_trust_discovered', False))
+        ttk.Checkbutton(sharing_frame, text="Also download from PCs found automatically (only if you trust everyone on this network)",
+                        variable=self.peer_trust_discovered, command=self.save_peer_cache_settings).grid(row=5, column=0, columnspan=3, pady=2, padx=5, sticky="w")
+        self.peer_accept_unverified = tk.BooleanVar(value=self.settings.get('peer_accept_unverified', False))
+        ttk.Checkbutton(sharing_frame, text="Let the peer addresses above send mods this PC hasn't installed before (only PCs you control)",
+                        variable=self.peer_accept_unverified, command=self.save_peer_cache_settings).grid(row=6, column=0, columnspan=3, pady=2, padx=5, sticky="w")
+
+        ttk.Label(sharing_frame, text="Download mirrors:").grid(row=3, column=0, pady=2, padx=5, sticky="w")
+        self.download_mirrors = tk.StringVar(value=", ".join(self.settings.get('download_mirrors', [])))
+        mirror_entry = ttk.Entry(sharing_frame, textvariable=self.download_mirrors)
+        mirror_entry.grid(row=3, column=1, pady=2, padx=5, sticky="ew")
+        mirror_entry.bind('<Return>', lambda e: self.save_peer_cache_settings())
+        mirror_entry.bind('<FocusOut>', lambda e: self.save_peer_cache_settings())
+        ttk.Label(sharing_frame, text="(url templates using {owner}, {name} and {version})").grid(row=3, column=2, pady=2, padx=5, sticky="w")
+
+        self.peer_cache_label = ttk.Label(sharing_frame, text="")
+        self.peer_cache_label.grid(row=7, column=0, columnspan=3, pady=2, padx=5, sticky="w")
+        self.update_peer_cache_label()
+
         troubleshoot_frame = ttk.LabelFrame(settings_frame, text="Troubleshooting")
         troubleshoot_frame.grid(row=5, column=0, pady=10, padx=20, sticky="ew")
         troubleshoot_frame.grid_columnconfigure((0, 1, 2), weight=1)
@@ -2862,6 +5602,8 @@ class HookLineSinkerUI:
         ttk.Button(troubleshoot_frame, text="Open GDWeave Folder", command=self.open_gdweave_folder).grid(row=4, column=1, pady=5, padx=5, sticky="ew")
         ttk.Button(troubleshoot_frame, text="Clear Temp Folder", command=self.delete_temp_files).grid(row=4, column=2, pady=5, padx=5, sticky="ew")
 
+        ttk.Button(troubleshoot_frame, text="UI Latency Diagnostics", command=self.show_latency_diagnostics).grid(row=5, column=0, pady=5, padx=5, sticky="ew")
+
         # settings status :3
         self.settings_status = ttk.Label(settings_frame, text="", font=("Helvetica", 12))
         self.settings_status.grid(row=6, column=0, pady=(10, 20), padx=20, sticky="w")
@@ -2870,6 +5612,161 @@ class HookLineSinkerUI:
         threading.Thread(target=self.update_latest_version_label, daemon=True).start()
         self.root.after(100, self.process_gui_queue)
 
+    def save_install_workers(self):
+        self.install_executor.set_workers(self.install_workers.get())
+        self.settings['install_workers'] = self.install_executor.workers
+        self.save_settings()
+
+    def save_deploy_workers(self):
+        self.deploy_stage.set_workers(self.deploy_workers.get())
+        self.settings['deploy_workers'] = self.deploy_stage.workers
+        self.save_settings()
+
+    def save_archive_cache_limit(self):
+        try:
+            limit_mb = max(0, int(self.archive_cache_mb.get()))
+        except (tk.TclError, ValueError):
+            return
+        self.archive_cache.set_limit(limit_mb * 1048576)
+        self.settings['archive_cache_mb'] = limit_mb
+        self.save_settings()
+        self.update_archive_cache_label()
+
+    # applies straight away, transfers already running slow down or speed up on their next chunk :3
+    def save_bandwidth_limits(self):
+        try:
+            foreground = max(0, int(self.foreground_limit.get()))
+            background = max(0, int(self.background_limit.get()))
+            prefetch = max(0, int(self.prefetch_limit.get()))
+        except (tk.TclError, ValueError):
+            return
+        self.bandwidth.foreground.set_rate(foreground * 1024)
+        self.bandwidth.background.set_rate(background * 1024)
+        self.prefetcher.bucket.set_rate(prefetch * 1024)
+        self.settings['foreground_limit_kbps'] = foreground
+        self.settings['background_limit_kbps'] = background
+        self.settings['prefetch_limit_kbps'] = prefetch
+        self.save_settings()
+
+    def save_peer_cache_settings(self):
+        self.settings['peer_cache_serve'] = self.peer_cache_serve.get()
+        self.settings['peer_cache_use'] = self.peer_cache_use.get()
+        self.settings['peer_trust_discovered'] = self.peer_trust_discovered.get()
+        self.settings['peer_accept_unverified'] = self.peer_accept_unverified.get()
+        self.settings['peer_addresses'] = self.peer_addresses.get().strip()
+        self.settings['download_mirrors'] = [mirror.strip() for mirror in self.download_mirrors.get().split(',') if mirror.strip()]
+        self.save_settings()
+        if error := self.apply_peer_cache_settings():
+            self.set_status(error)
+        self.update_peer_cache_label()
+
+    # the archive digest an earlier install of this exact version recorded in its mod_info :3
+    def get_known_archive_sha256(self, mod):
+        return next((installed.get('archive_sha256') for installed in self.installed_mods
+                     if installed.get('archive_sha256') and installed.get('thunderstore_id') == mod.get('thunderstore_id')
+                     and installed.get('version') == mod.get('version')), None)
+
+    # starts or stops sharing and points the peer cache at the configured addresses, returns an error message if sharing can't start :3
+    def apply_peer_cache_settings(self):
+        addresses = [address.strip() for address in self.settings.get('peer_addresses', '').split(',') if address.strip()]
+        self.peer_cache.static_peers = [address if ':' in address else f"{address}:{PEER_HTTP_PORT}" for address in addresses]
+        self.peer_cache.use_peers = self.settings.get('peer_cache_use', False)
+        self.peer_cache.trust_discovered = self.settings.get('peer_trust_discovered', False)
+        self.peer_cache.accept_unverified = self.settings.get('peer_accept_unverified', False)
+        self.peer_cache.discovered_at = 0
+        if self.settings.get('peer_cache_serve', False):
+            try:
+                self.peer_cache.start_server()
+            except OSError as e:
+                self.peer_cache.stop_server()
+                logging.error(f"Failed to start mod sharing: {e}")
+                return f"Failed to start mod sharing: {e}"
+        else:
+            self.peer_cache.stop_server()
+        return None
+
+    def update_peer_cache_label(self):
+        if not hasattr(self, 'peer_cache_label'):
+            return
+        parts = [f"Sharing on port {self.peer_cache.port}" if self.peer_cache.server else "Not sharing"]
+        if self.peer_cache.use_peers:
+            parts.append(f"{self.peer_cache.hits} mod(s) fetched from peers")
+        self.peer_cache_label.config(text=" - ".join(parts))
+
+    def clear_archive_cache(self):
+        self.archive_cache.clear()
+        self.update_archive_cache_label()
+        self.set_status("Download cache cleared")
+
+    def update_archive_cache_label(self):
+        if not hasattr(self, 'archive_cache_label'):
+            return
+        stats = self.archive_cache.stats()
+        lookups = stats['hits'] + stats['misses']
+        hit_rate = f"{stats['hits'] / lookups:.0%}" if lookups else "n/a"
+        self.archive_cache_label.config(
+            text=f"{stats['entries']} archive(s), {(stats['size'] + stats['partial_size']) / 1048576:.1f} MB used - "
+                 f"{stats['hits']} hits, {stats['misses']} misses ({hit_rate} hit rate), {stats['evictions']} evicted"
+        )
+
+    def toggle_latency_tracking(self):
+        self.latency_tracker.enabled = self.latency_tracking.get()
+        self.save_settings()
+
+    def toggle_speculative_prefetch(self):
+        if not self.speculative_prefetch.get():
+            self.schedule_prefetch()
+        self.save_settings()
+
+    # puts a bind tag in front of the widget's own tags so the timer starts before any handler runs :3
+    def instrument_latency(self, widget, sequence, name):
+        tag = f"latency_{name.replace(' ', '_')}"
+        widget.bindtags((tag,) + widget.bindtags())
+        self.root.bind_class(tag, sequence, lambda e: self.latency_tracker.track(name))
+
+    # shows the latency histograms for every instrumented interaction :3
+    def show_latency_diagnostics(self):
+        if self.latency_window and self.latency_window.winfo_exists():
+            self.latency_window.lift()
+            return
+
+        self.latency_window = tk.Toplevel(self.root)
+        self.latency_window.title("UI Latency Diagnostics")
+        self.latency_window.geometry("760x360")
+
+        frame = ttk.Frame(self.latency_window, padding=10)
+        frame.pack(fill=tk.BOTH, expand=True)
+
+        text = tk.Text(frame, wrap=tk.NONE, font=("Courier", 9))
+        text.pack(fill=tk.BOTH, expand=True)
+
+        button_frame = ttk.Frame(frame)
+        button_frame.pack(fill=tk.X, pady=(5, 0))
+        ttk.Button(button_frame, text="Reset", command=self.latency_tracker.reset).pack(side=tk.LEFT)
+        ttk.Button(button_frame, text="Close", command=self.latency_window.destroy).pack(side=tk.RIGHT)
+
+        def refresh():
+            if not text.winfo_exists():
+                return
+            text.config(state='normal')
+            text.delete('1.0', tk.END)
+            if not self.latency_tracker.enabled:
+                text.insert(tk.END, "Latency measuring is off, turn on \"Measure UI latency\" in HLS Settings.\n\n")
+            if not self.latency_tracker.stats:
+                text.insert(tk.END, "No interactions recorded yet.\n")
+            for name in sorted(self.latency_tracker.stats):
+                text.insert(tk.END, self.latency_tracker.format_stats(name) + "\n\n")
+            if network_stats := self.http.format_stats():
+                text.insert(tk.END, "Network requests (time to response headers):\n" + network_stats + "\n\n")
+            if source_stats := self.source_selector.format_stats():
+                text.insert(tk.END, "Download sources:\n" + source_stats + "\n\n")
+            if self.speculative_prefetch.get() or self.prefetcher.fetched or self.prefetcher.cancelled:
+                text.insert(tk.END, self.prefetcher.format_stats() + "\n")
+            text.config(state='disabled')
+            self.latency_window.after(1000, refresh)
+
+        refresh()
+
     def show_uuid(self):
         """Show the real UUID label and hide the masked one"""
         self.masked_uuid_label.grid_remove()
@@ -2891,8 +5788,10 @@ class HookLineSinkerUI:
     def get_latest_version(self):
         """Fetches the latest version from HookLineSinker.lol"""
         try:
-            response = requests.get("https://hooklinesinker.lol/download/version.json")
-            version_data = response.json()
+            version_data = self.get_prefetched('hls_version')
+            if version_data is None:
+                response = self.http.get("https://hooklinesinker.lol/download/version.json")
+                version_data = response.json()
             return version_data['version']
         except Exception as e:
             logging.error(f"Error fetching latest version: {str(e)}")
@@ -3218,7 +6117,7 @@ Special Thanks:
                 os.makedirs(temp_dir, exist_ok=True)
                 
                 # download the installer :3
-                with requests.get(url, stream=True) as response:
+                with self.http.get(url, stream=True) as response:
                     response.raise_for_status()
                     total_size = int(response.headers.get('content-length', 0))
                     
@@ -3232,7 +6131,7 @@ Special Thanks:
                             if chunk:
                                 temp_file.write(chunk)
                                 downloaded_size += len(chunk)
-                                self.root.update_idletasks()
+                                self.bandwidth.consume(len(chunk))
                 
                 self.set_status("Download complete.")
 
@@ -3361,7 +6260,7 @@ Special Thanks:
                     # install available dependencies :3
                     for dep_mod in all_dependencies:
                         self.set_status(f"Installing dependency: {dep_mod['title']}")
-                        self.download_and_install_mod(dep_mod)
+                        self.download_and_install_mod(dep_mod, priority=InstallJob.PRIORITY_DEPENDENCY)
 
             # check if mod already exists :3
             if self.mod_id_exists(mod_id):
@@ -3428,11 +6327,14 @@ Special Thanks:
     # fetches the latest version of GDWeave from GitHub :3
     # uses a separate thread with a timeout to prevent hanging :3
     def get_gdweave_version(self):
+        if prefetched := self.get_prefetched('gdweave_version'):
+            return prefetched
+
         def fetch_version():
             try:
                 api_url = "https://api.github.com/repos/NotNite/GDWeave/releases/latest"
                 headers = {'Accept': 'application/vnd.github.v3+json'}
-                response = requests.get(api_url, headers=headers, timeout=30)
+                response = self.http.get(api_url, headers=headers, timeout=30)
                 response.raise_for_status()
                 data = response.json()
                 version = data['tag_name'].lstrip('v')  # remove 'v' prefix if present :3
@@ -3481,68 +6383,88 @@ Special Thanks:
         # get selected mod titles :3
         selected_titles = [self.available_listbox.get(index) for index in selected]
         logging.debug(f"Selected titles: {selected_titles}")
-        
+
+        mods_by_name = {}
+        for available_mod in self.available_mods:
+            mods_by_name.setdefault(self.get_backend_name(available_mod['title'].strip()), available_mod)
+
+        # collect selected mods :3
+        selected_mods = []
+        selected_ids = set()
+        for mod_title in selected_titles:
+            if mod_title.startswith("Category:"):
+                logging.debug("Skipping category header")
+                continue
+
+            # clean the title and convert to backend name for lookup :3
+            clean_title = mod_title.replace('✅', '').replace('❌', '').replace('[3rd]', '').strip()
+            backend_title = self.get_backend_name(clean_title)
+            mod = mods_by_name.get(backend_title)
+            if not mod:
+                logging.debug(f"Could not find mod for {backend_title}")
+                continue
+            if id(mod) not in selected_ids:
+                selected_ids.add(id(mod))
+                selected_mods.append(mod)
+
+        self.install_mods(selected_mods)
+
+    # resolves dependencies for a set of available mods, asks about them and queues the whole plan :3
+    # the command palette hands its mod straight to this, so it doesn't depend on what the mod list is showing :3
+    def install_mods(self, selected_mods):
         # check for protected mods :3
         protected_mods = ['GDWeave', 'Hook_Line_and_Sinker', 'r2modman', 'Hatchery']
-        for title in selected_titles:
-            # clean the title and convert display name to backend name :3
-            clean_title = title.replace('✅', '').replace('❌', '').replace('[3rd]', '').strip()
-            backend_title = self.get_backend_name(clean_title)
+        for mod in selected_mods:
+            backend_title = self.get_backend_name(mod['title'].strip())
             logging.debug(f"Checking protected status for {backend_title}")
             if backend_title in protected_mods:
                 logging.debug(f"{backend_title} is protected, showing error")
                 messagebox.showerror(
                     "Protected Mod",
-                    f"{clean_title} cannot be installed via the Mod Manager tab." 
+                    f"{self.get_display_name(mod['title'])} cannot be installed via the Mod Manager tab."
                 )
                 return
 
+        # lookup built once so resolving a big selection doesn't rescan the mod list for every dependency :3
+        mods_by_thunderstore_id = {}
+        for available_mod in self.available_mods:
+            if available_mod.get('thunderstore_id'):
+                mods_by_thunderstore_id.setdefault(available_mod['thunderstore_id'], available_mod)
+        installed_ids = {m.get('thunderstore_id') for m in self.installed_mods}
+
         all_dependencies = []
         missing_dependencies = []
+        planned = {id(mod) for mod in selected_mods}  # ids of the mod dicts already in the plan :3
 
         try:
-            # first check all dependencies :3
-            for index in selected:
-                mod_title = self.available_listbox.get(index)
-                logging.debug(f"Processing mod: {mod_title}")
-                if mod_title.startswith("Category:"):
-                    logging.debug("Skipping category header")
-                    continue
-
-                # clean the title and convert to backend name for lookup :3
-                clean_title = mod_title.replace('✅', '').replace('❌', '').replace('[3rd]', '').strip()
-                backend_title = self.get_backend_name(clean_title)
-                logging.debug(f"Cleaned title: {clean_title}, backend title: {backend_title}")
-                
-                # find the mod using the backend name :3
-                mod = next((m for m in self.available_mods if self.get_backend_name(m['title'].strip()) == backend_title), None)
-                if not mod:
-                    logging.debug(f"Could not find mod for {backend_title}")
-                    continue
+            # resolve the whole selection into one plan, dependencies of dependencies included :3
+            self.set_status_safe(f"Checking dependencies for {len(selected_mods)} mod{'s' if len(selected_mods) != 1 else ''}...")
+            pending = collections.deque(selected_mods)
+            while pending:
+                mod = pending.popleft()
+                for dep in mod.get('dependencies', []):
+                    # parse dependency string (format: owner-name-version) :3
+                    parts = dep.split('-')
+                    if len(parts) < 2:
+                        continue
+                    thunderstore_id = f"{parts[0]}-{parts[1]}"
+                    # skip gdweave and hls dependencies :3
+                    if thunderstore_id.startswith(('NotNet-GDWeave', 'Pyoid-Hook_Line_and_Sinker', 'ekbr-r2modman')):
+                        continue
+                    # check if dependency is installed using thunderstore_id :3
+                    if thunderstore_id in installed_ids:
+                        continue
+                    dep_mod = mods_by_thunderstore_id.get(thunderstore_id)
+                    if not dep_mod:
+                        logging.debug(f"Dependency {thunderstore_id} not found in available mods")
+                        if dep not in missing_dependencies:
+                            missing_dependencies.append(dep)
+                    elif id(dep_mod) not in planned:
+                        logging.debug(f"Adding {thunderstore_id} to dependencies to install")
+                        planned.add(id(dep_mod))
+                        all_dependencies.append(dep_mod)
+                        pending.append(dep_mod)
 
-                self.set_status_safe(f"Checking dependencies for {mod['title']}...")
-                if dependencies := mod.get('dependencies', []):
-                    logging.debug(f"Found dependencies for {mod['title']}: {dependencies}")
-                    for dep in dependencies:
-                        # parse dependency string (format: owner-name-version) :3
-                        parts = dep.split('-')
-                        if len(parts) >= 2:
-                            thunderstore_id = f"{parts[0]}-{parts[1]}"
-                            logging.debug(f"Checking dependency: {thunderstore_id}")
-                            # skip gdweave and hls dependencies :3
-                            if thunderstore_id.startswith(('NotNet-GDWeave', 'Pyoid-Hook_Line_and_Sinker', 'ekbr-r2modman')):
-                                logging.debug(f"Skipping core dependency: {thunderstore_id}")
-                                continue
-                            # check if dependency is installed using thunderstore_id :3
-                            if not any(m.get('thunderstore_id') == thunderstore_id for m in self.installed_mods):
-                                logging.debug(f"Dependency {thunderstore_id} not installed")
-                                if dep_mod := next((m for m in self.available_mods if m.get('thunderstore_id') == thunderstore_id), None):
-                                    if dep_mod not in all_dependencies:
-                                        logging.debug(f"Adding {thunderstore_id} to dependencies to install")
-                                        all_dependencies.append(dep_mod)
-                                else:
-                                    logging.debug(f"Dependency {thunderstore_id} not found in available mods")
-                                    missing_dependencies.append(dep)
             # if there are dependencies, prompt user :3
             if all_dependencies or missing_dependencies:
                 logging.debug(f"Found dependencies to handle - to install: {len(all_dependencies)}, missing: {len(missing_dependencies)}")
@@ -3569,34 +6491,11 @@ Special Thanks:
                     logging.debug("User cancelled dependency installation") 
                     return
 
-                # install available dependencies first :3
-                for dep_mod in all_dependencies:
-                    logging.debug(f"Installing dependency: {dep_mod['title']}")
-                    self.set_status_safe(f"Installing dependency: {dep_mod['title']}")
-                    self.download_and_install_mod(dep_mod)
-
-            # install selected mods :3
-            for index in selected:
-                mod_title = self.available_listbox.get(index)
-                logging.debug(f"Installing selected mod: {mod_title}")
-                if mod_title.startswith("Category:"):
-                    logging.debug("Skipping category header")
-                    continue
-
-                clean_title = mod_title.replace('✅', '').replace('❌', '').replace('[3rd]', '').strip()
-                backend_title = self.get_backend_name(clean_title)
-                mod = next((m for m in self.available_mods if self.get_backend_name(m['title'].strip()) == backend_title), None)
-                if not mod:
-                    logging.debug(f"Could not find mod for {clean_title}")
-                    continue
-
-                self.set_status_safe(f"Installing {mod['title']}")
-                logging.debug(f"Downloading and installing {mod['title']}")
-                self.download_and_install_mod(mod)
-
-            self.set_status_safe("Installation complete")
-            logging.debug("Installation completed successfully")
-            self.refresh_mod_lists()
+            # make sure the whole batch fits on disk before anything downloads :3
+            self.preflight_install_plan(
+                all_dependencies + selected_mods,
+                lambda plan: self.queue_install_plan(plan, len(all_dependencies))
+            )
 
         except Exception as e:
             error_message = f"Installation failed: {str(e)}"
@@ -3604,6 +6503,26 @@ Special Thanks:
             messagebox.showerror("Error", error_message)
             logging.ERROR(error_message)
 
+    # queues a checked plan, the first dependency_count mods are dependencies the rest wait on :3
+    def queue_install_plan(self, plan, dependency_count):
+        if not plan:
+            return
+        dependency_jobs = []
+
+        # install available dependencies first :3
+        for dep_mod in plan[:dependency_count]:
+            logging.debug(f"Installing dependency: {dep_mod['title']}")
+            dependency_jobs.append(self.download_and_install_mod(dep_mod, priority=InstallJob.PRIORITY_DEPENDENCY))
+
+        # install selected mods, they only start once the shared dependencies are in place :3
+        for mod in plan[dependency_count:]:
+            logging.debug(f"Downloading and installing {mod['title']}")
+            self.download_and_install_mod(mod, depends_on=dependency_jobs)
+
+        # the mod lists refresh once when the batch finishes :3
+        self.set_status_safe(f"Queued {len(plan)} mod{'s' if len(plan) != 1 else ''} for installation")
+        logging.debug("Installation queued successfully")
+
     # checks if a mod is installed by its ID :3
     def is_mod_installed(self, mod_id):
         return any(m['id'] == mod_id for m in self.installed_mods)
@@ -3660,7 +6579,8 @@ Special Thanks:
 
     # installs or updates GDWeave mod loader :3
     # backs up existing mods and configs before installation :3
-    def install_gdweave(self):
+    # background installs nobody clicked on go through the background bandwidth cap like other automatic downloads :3
+    def install_gdweave(self, background=False):
         if not self.settings.get('game_path'):
             self.set_status("Please set the game path first")
             return
@@ -3688,14 +6608,18 @@ Special Thanks:
                 shutil.copytree(configs_path, os.path.join(temp_backup_dir, 'configs'))
                 logging.info("Backed up configs folder")
 
-            # download and install GDWeave :3
+            # download and install GDWeave, from the pinned release too when we know the latest version :3
             self.set_status("Downloading GDWeave...")
-            response = requests.get(gdweave_url)
-            response.raise_for_status()
-            
+            gdweave_sources = [gdweave_url]
+            if (latest_gdweave := self.get_prefetched('gdweave_version')):
+                gdweave_sources.append(f"https://github.com/NotNite/GDWeave/releases/download/v{latest_gdweave}/GDWeave.zip")
+
             zip_path = os.path.join(temp_dir, "GDWeave.zip")
-            with open(zip_path, 'wb') as f:
-                f.write(response.content)
+            self.http.retry.call(lambda: self.stream_from_sources(
+                {'title': 'GDWeave', 'download': gdweave_url}, zip_path, gdweave_sources,
+                throttle=lambda amount: self.bandwidth.consume(amount, background),
+                capped=bool(self.bandwidth.bucket(background).rate)
+            ))
             
             self.set_status("Installing GDWeave...")
             logging.info(f"Zip file downloaded to: {zip_path}")
@@ -3753,6 +6677,10 @@ Special Thanks:
         
     # updates the UI to reflect the current setup status :3
     def update_setup_status(self):
+        # the setup tab updates itself when it gets built :3
+        if not hasattr(self, 'step1_status'):
+            return
+
         # update step statuses :3
         self.update_step1_status()
         self.update_step2_status()
@@ -4058,8 +6986,11 @@ Special Thanks:
     # fetches the latest version from the server :3
     def update_latest_version_label(self):
         try:
-            response = requests.get("https://hooklinesinker.lol/download/version.json")
-            latest_version = response.json()['version']
+            version_data = self.get_prefetched('hls_version')
+            if version_data is None:
+                response = self.http.get("https://hooklinesinker.lol/download/version.json")
+                version_data = response.json()
+            latest_version = version_data['version']
             self.gui_queue.put(('latest_version', latest_version))
         except Exception as e:
             logging.info(f"Error fetching latest version: {str(e)}")
@@ -4102,14 +7033,17 @@ Special Thanks:
     # checks for program updates and prompts user to update if available :3
     def check_for_program_updates(self, silent=False):
         try:
-            response = requests.get("https://raw.githubusercontent.com/isovel/HookLineSinker/main/version.json")
-            version_data = response.json()
+            version_data = self.get_prefetched('program_version')
+            if version_data is None:
+                response = self.http.get("https://raw.githubusercontent.com/isovel/HookLineSinker/main/version.json")
+                version_data = response.json()
             remote_version = version_data['version']
             update_message = version_data.get('message', '')
             local_version = get_version()
 
-            self.current_version_label.config(text=f"Current Version: {local_version}")
-            self.latest_version_label.config(text=f"Latest Version: {remote_version}")
+            if hasattr(self, 'latest_version_label'):
+                self.current_version_label.config(text=f"Current Version: {local_version}")
+                self.latest_version_label.config(text=f"Latest Version: {remote_version}")
 
             if remote_version != local_version:
                 message = f"A new version ({remote_version}) is available. You are currently on version {local_version}."
@@ -4135,7 +7069,7 @@ Special Thanks:
         def download_and_install(progress_window):
             logging.info(f"Starting download and install of version {version}")
             try:
-                progress_window.status_label.config(text="Downloading HLS update...")
+                self.ui_batcher.set('update_status', progress_window.status_label.config, {'text': "Downloading HLS update..."})
                 logging.info("Updating status label to downloading")
                 
                 # create temp directory :3
@@ -4148,7 +7082,7 @@ Special Thanks:
                 installer_path = os.path.join(temp_dir, 'HLS_Setup.exe')
                 logging.info(f"Downloading installer from {url} to {installer_path}")
                 
-                with requests.get(url, stream=True) as response:
+                with self.http.get(url, stream=True) as response:
                     response.raise_for_status()
                     total_size = int(response.headers.get('content-length', 0))
                     downloaded_size = 0
@@ -4159,12 +7093,12 @@ Special Thanks:
                             if chunk:
                                 f.write(chunk)
                                 downloaded_size += len(chunk)
+                                self.bandwidth.consume(len(chunk))
                                 progress = (downloaded_size / total_size) * 100
-                                progress_window.progress_bar['value'] = progress
-                                progress_window.update_idletasks()
+                                self.set_progress(progress_window.progress_bar, progress)
                 
-                progress_window.status_label.config(text="Installing update...")
-                progress_window.progress_bar['value'] = 100
+                self.ui_batcher.set('update_status', progress_window.status_label.config, {'text': "Installing update..."})
+                self.set_progress(progress_window.progress_bar, 100)
                 logging.info("Download complete, starting installation")
                 
                 # run installer silently and wait for it to finish :3
@@ -4297,7 +7231,7 @@ Special Thanks:
             try:
                 self.set_status("Downloading update...")
                 url = f"https://hooklinesinker.lol/download/{new_version}"
-                response = requests.get(url, stream=True, allow_redirects=True)
+                response = self.http.get(url, stream=True, allow_redirects=True)
                 response.raise_for_status()
 
                 temp_dir = os.path.join(self.app_data_dir, 'temp')
@@ -4308,6 +7242,7 @@ Special Thanks:
                     for chunk in response.iter_content(chunk_size=8192):
                         if chunk:
                             f.write(chunk)
+                            self.bandwidth.consume(len(chunk))
 
                 self.set_status("Update downloaded, launching installer...")
                 if sys.platform.startswith('win'):
@@ -4342,10 +7277,13 @@ Special Thanks:
         self.status_bar = ttk.Label(self.root, text="Ready", anchor=tk.W, padding=(8, 4))
         self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
 
-    # updates the status bar with a new message :3
+    # updates the status bar with a new message, safe to call from any thread :3
     def set_status(self, message):
-        self.status_bar.config(text=message)
-        self.root.update_idletasks()
+        self.ui_batcher.set('status', self.status_bar.config, {'text': message})
+
+    # sets a progress bar value on the next frame, safe to call from any thread :3
+    def set_progress(self, progress_bar, value):
+        self.ui_batcher.set(('progress', str(progress_bar)), progress_bar.config, {'value': value})
 
     # clears placeholder text when entry widget is clicked :3
     def clear_placeholder(self, event, placeholder):
@@ -4628,7 +7566,7 @@ Special Thanks:
                 return []
 
             # get all mods from thunderstore API :3
-            response = requests.get("https://thunderstore.io/c/webfishing/api/v1/package/")
+            response = self.http.get("https://thunderstore.io/c/webfishing/api/v1/package/")
             response.raise_for_status()
             all_mods = response.json()
 
@@ -5338,7 +8276,24 @@ Special Thanks:
             'gdweave_version': 'Unknown',
             'blacklisted_versions': {},
             'available_sort_by': 'Last Updated',
-            'installed_sort_by': 'Recently Installed'
+            'installed_sort_by': 'Recently Installed',
+            'available_search_mode': 'Exact',
+            'installed_search_mode': 'Exact',
+            'latency_tracking': False,
+            'install_workers': DEFAULT_INSTALL_WORKERS,
+            'deploy_workers': DEFAULT_DEPLOY_WORKERS,
+            'archive_cache_mb': ARCHIVE_CACHE_LIMIT // 1048576,
+            'peer_cache_serve': False,
+            'peer_cache_use': False,
+            'peer_addresses': '',
+            'peer_trust_discovered': False,
+            'peer_accept_unverified': False,
+            'download_mirrors': [],
+            'foreground_limit_kbps': 0,
+            'background_limit_kbps': 0,
+            'extract_sizes': [0, 0],
+            'speculative_prefetch': False,
+            'prefetch_limit_kbps': PREFETCH_LIMIT_KBPS
         }
 
     # verifies the game installation path :3
@@ -5388,14 +8343,20 @@ Special Thanks:
             "show_nsfw": self.show_nsfw.get(),
             "show_deprecated": self.show_deprecated.get(),
             "auto_backup": self.auto_backup.get(),
-            "suppress_mod_warning": self.suppress_mod_warning.get()
+            "suppress_mod_warning": self.suppress_mod_warning.get(),
+            "latency_tracking": self.latency_tracking.get(),
+            "speculative_prefetch": self.speculative_prefetch.get()
         })
         
+        self.write_settings()
+        self.set_status("Settings saved successfully!")
+        logging.info("Settings saved:", self.settings)
+
+    # writes the settings as they stand, for values that change outside the settings tab :3
+    def write_settings(self):
         settings_path = os.path.join(self.app_data_dir, 'settings.json')
         with open(settings_path, 'w') as f:
             json.dump(self.settings, f)
-        self.set_status("Settings saved successfully!")
-        logging.info("Settings saved:", self.settings)
         
     # updates the ui lists of available and installed mods :3
     def refresh_mod_lists(self):
@@ -5403,8 +8364,8 @@ Special Thanks:
             # preserve the current items in the listbox :3
             current_items = list(self.available_listbox.get(0, tk.END))
             
-            # only update if the list is empty (first load) :3
-            if not current_items:
+            # only update if the list is empty (first load), unless the startup fetch is still bringing it in :3
+            if not current_items and not self.startup_fetch_pending:
                 self.load_available_mods()
 
         self.installed_mods = self.get_installed_mods()
@@ -5476,20 +8437,462 @@ Special Thanks:
 
         return installed_mods
 
+    # archive size of each mod in a plan as (bytes, already cached), cached sizes and the ones from the package listing skip the network :3
+    # anything else gets a HEAD request, all of them at once on the network loop :3
+    def get_archive_sizes(self, mods):
+        sizes = [(SOURCE_ESTIMATE_SIZE, False)] * len(mods)
+        fetches = {}
+        for index, mod in enumerate(mods):
+            cache_key = ArchiveCache.make_key(mod)
+            if cache_key and (cached := self.archive_cache.lookup(cache_key)):
+                sizes[index] = (cached[2], True)
+            elif mod.get('file_size'):
+                sizes[index] = (mod['file_size'], False)
+            elif mod.get('download'):
+                fetches[index] = (
+                    lambda url=mod['download']: self.http.head(url, allow_redirects=True, timeout=PREFLIGHT_DEADLINE),
+                    PREFLIGHT_DEADLINE
+                )
+
+        if fetches:
+            results = self.network_loop.fetch_all(fetches, lambda name, value, error: None).result()
+            for index, (response, error) in results.items():
+                if error:
+                    logging.info(f"Couldn't get the size of {mods[index]['title']}: {error}")
+                    continue
+                response.close()
+                if response.ok and (length := int(response.headers.get('content-length', 0))):
+                    # the source ranking uses this too :3
+                    mods[index]['file_size'] = length
+                    sizes[index] = (length, False)
+        return sizes
+
+    # unzipped size over zipped size across recent installs, weighted by bytes so tiny mods don't skew it :3
+    def get_extract_ratio(self):
+        archive_bytes, extracted_bytes = self.settings.get('extract_sizes', [0, 0])
+        if archive_bytes <= 0:
+            return DEFAULT_EXTRACT_RATIO
+        return max(1.0, extracted_bytes / archive_bytes)
+
+    # adds one install to the learned extract ratio, older installs fade out so it follows what people install now :3
+    # called from the deploy workers, the settings themselves only change on the tk thread :3
+    def record_extract_sizes(self, archive_size, extracted_size):
+        if archive_size > 0:
+            self.ui_batcher.call(self._add_extract_sizes, archive_size, extracted_size)
+
+    def _add_extract_sizes(self, archive_size, extracted_size):
+        archive_bytes, extracted_bytes = self.settings.get('extract_sizes', [0, 0])
+        self.settings['extract_sizes'] = [
+            archive_bytes * EXTRACT_RATIO_DECAY + archive_size,
+            extracted_bytes * EXTRACT_RATIO_DECAY + extracted_size
+        ]
+        self.ui_batcher.set('extract_sizes', self.write_settings)
+
+    # checks a batch against free space before anything downloads :3
+    # archives land in app data (plus a copy in the cache) and get extracted there, then enabled mods are copied into the game folder :3
+    # the sizes are looked up on a worker thread, on_plan(plan) then runs on the tk thread with the mods that fit,
+    # always a prefix of the plan so dependencies queued first stay with their dependents :3
+    def preflight_install_plan(self, mods, on_plan, interactive=True):
+        if not mods:
+            self.ui_batcher.call(on_plan, mods)
+            return
+        self.set_status_safe(f"Checking disk space for {len(mods)} mod{'s' if len(mods) != 1 else ''}...")
+        threading.Thread(target=self._measure_install_plan, args=(mods, on_plan, interactive), daemon=True).start()
+
+    def _measure_install_plan(self, mods, on_plan, interactive):
+        # jobs already in the queue are going to use space too, the ones for packages in this plan get replaced by it :3
+        keys = {InstallJob.package_key(mod) for mod in mods}
+        queued = [job.mod for job in self.install_executor.snapshot() if not job.finished and job.key not in keys]
+        try:
+            sizes = self.get_archive_sizes(mods + queued)
+            app_free, app_device = get_disk_space(self.app_data_dir)
+            free = {app_device: app_free - DISK_SPACE_RESERVE}
+            paths = {app_device: self.app_data_dir}
+            game_device = None
+            if game_path := self.settings.get('game_path'):
+                game_free, game_device = get_disk_space(game_path)
+                free.setdefault(game_device, game_free - DISK_SPACE_RESERVE)
+                paths.setdefault(game_device, game_path)
+        except OSError as e:
+            logging.warning(f"Disk space check failed, installing without it: {e}")
+            self.ui_batcher.call(on_plan, mods)
+            return
+
+        ratio = self.get_extract_ratio()
+
+        def space_for(size, cached):
+            extracted = int(size * ratio)
+            additions = collections.Counter({app_device: extracted + (0 if cached else 2 * size)})
+            if game_device is not None:
+                additions[game_device] += extracted
+            return additions
+
+        committed = collections.Counter()
+        for size, cached in sizes[len(mods):]:
+            committed.update(space_for(size, cached))
+        sizes = sizes[:len(mods)]
+
+        with self.preflight_lock:
+            for device in free:
+                free[device] -= committed[device] + self.preflight_reserved[device]
+            needed = collections.Counter()
+            fitted = []
+            short_device = None
+            for mod, (size, cached) in zip(mods, sizes):
+                additions = space_for(size, cached)
+                short_device = next((device for device, amount in additions.items() if needed[device] + amount > free[device]), None)
+                if short_device is not None:
+                    break
+                needed.update(additions)
+                fitted.append(mod)
+            # held until the plan is queued, by then the queued jobs are counted instead :3
+            self.preflight_reserved.update(needed)
+
+        def release(plan):
+            with self.preflight_lock:
+                self.preflight_reserved.subtract(needed)
+                self.preflight_reserved = +self.preflight_reserved
+            on_plan(plan)
+
+        if short_device is None:
+            self.ui_batcher.call(release, mods)
+            return
+
+        total = sum(size for size, cached in sizes)
+        message = (f"There isn't enough free space on the drive with {paths[short_device]} for all {len(mods)} mods "
+                   f"(about {format_bytes(total)} to download, {format_bytes(max(0, free[short_device]))} free after "
+                   f"keeping {format_bytes(DISK_SPACE_RESERVE)} spare and leaving room for installs already queued).")
+        logging.warning(f"{message} {len(fitted)} fit")
+        self.ui_batcher.call(self._confirm_install_plan, mods, fitted, message, release, interactive)
+
+    # asks what to do about a plan that doesn't fit, on the tk thread :3
+    def _confirm_install_plan(self, mods, fitted, message, on_plan, interactive):
+        if not interactive:
+            self.set_status(f"Low disk space, only installing {len(fitted)} of {len(mods)} mods")
+            on_plan(fitted)
+        elif not fitted:
+            messagebox.showerror("Not Enough Disk Space", f"{message}\n\nFree up some space and try again.")
+            on_plan([])
+        elif messagebox.askyesno("Not Enough Disk Space", f"{message}\n\nInstall the first {len(fitted)} that fit?"):
+            on_plan(fitted)
+        else:
+            self.set_status("Installation cancelled, not enough disk space")
+            on_plan([])
+
     # downloads and installs a mod :3
-    def download_and_install_mod(self, mod, install=True):
-        # create thy thread to handle the download and installation :3
-        thread = threading.Thread(
-            target=self._download_and_install_mod_thread,
-            args=(mod, install)
+    # queues the download and installation on the install executor, returns the InstallJob :3
+    # requests for a package that's already queued or installing get that job back instead of a second one :3
+    # background is for installs nobody clicked on (auto updates, server joins), they get the background bandwidth cap :3
+    def download_and_install_mod(self, mod, install=True, priority=InstallJob.PRIORITY_NORMAL, depends_on=(), background=False):
+        return self.install_executor.submit(mod, install, priority, depends_on, background)
+
+    def run_install_job(self, job):
+        # a prefetch could be writing the same partial download, it lets go at its next chunk and the install takes over :3
+        if self.prefetcher.busy:
+            self.prefetcher.cancel()
+
+        # pausing or cancelling stops the download at the next chunk, the partial is picked up again later :3
+        def throttle(amount):
+            job.check_interrupt()
+            self.bandwidth.consume(amount, job.background)
+
+        return self._download_and_install_mod_thread(
+            job.mod, job.install,
+            report=lambda stage, done, total=0: self.report_install_progress(job, stage, done, total),
+            throttle=throttle,
+            capped=bool(self.bandwidth.bucket(job.background).rate),
+            deploy_stage=self.deploy_stage
         )
-        thread.daemon = True
-        thread.start()
-        
-    def _download_and_install_mod_thread(self, mod, install=True):
+
+    # progress events from the worker threads, the queue view redraws at most once per frame :3
+    def report_install_progress(self, job, stage, done, total=0):
+        job.progress.update(stage, done, total)
+        self.ui_batcher.set('install_queue', self.refresh_install_queue_view)
+
+    # where a partially downloaded archive and its sidecar live so they survive restarts :3
+    # keyed by package and version rather than url, so a download that failed over to another source carries on from the same bytes :3
+    def get_partial_download_paths(self, mod, url=None):
+        partial_dir = os.path.join(self.app_data_dir, 'temp', 'partial')
+        os.makedirs(partial_dir, exist_ok=True)
+        key = hashlib.sha1((ArchiveCache.make_key(mod) or url or mod['download']).encode('utf-8')).hexdigest()
+        return os.path.join(partial_dir, f"{key}.part"), os.path.join(partial_dir, f"{key}.json")
+
+    def get_partial_lock(self, part_path):
+        with self.partial_locks_lock:
+            return self.partial_locks.setdefault(part_path, threading.Lock())
+
+    # removes the unfinished download of a cancelled install, unless another stream is still writing it :3
+    def discard_partial_downloads(self, mod):
+        part_path, meta_path = self.get_partial_download_paths(mod)
+        lock = self.get_partial_lock(part_path)
+        if not lock.acquire(blocking=False):
+            return
+        try:
+            for path in (part_path, meta_path):
+                if os.path.exists(path):
+                    os.remove(path)
+        finally:
+            lock.release()
+
+    # run at startup before anything downloads: drops stale or orphaned partials, then counts the rest against the archive cache :3
+    def prune_partial_downloads(self):
+        partial_dir = os.path.join(self.app_data_dir, 'temp', 'partial')
+        if not os.path.isdir(partial_dir):
+            return
+        files = collections.defaultdict(list)  # key -> paths of its .part and .json :3
+        for name in os.listdir(partial_dir):
+            files[os.path.splitext(name)[0]].append(os.path.join(partial_dir, name))
+        total = 0
+        for key, paths in files.items():
+            try:
+                complete = sorted(os.path.splitext(path)[1] for path in paths) == ['.json', '.part']
+                if complete and time.time() - max(os.path.getmtime(path) for path in paths) < PARTIAL_DOWNLOAD_MAX_AGE:
+                    total += sum(os.path.getsize(path) for path in paths)
+                    continue
+                for path in paths:
+                    os.remove(path)
+            except OSError as e:
+                logging.warning(f"Failed to clean up partial download {key}: {e}")
+        self.archive_cache.set_partial_size(total)
+
+    # the sidecar for a partial download, or None if there's nothing usable to resume :3
+    # it keeps a validator per source url, since each server has its own etags :3
+    def load_partial_download(self, part_path, meta_path):
+        try:
+            with open(meta_path, 'r') as f:
+                meta = json.load(f)
+            if meta.get('validators') and meta.get('length') and os.path.exists(part_path):
+                return meta
+        except (OSError, ValueError):
+            pass
+        for path in (part_path, meta_path):
+            if os.path.exists(path):
+                os.remove(path)
+        return None
+
+    # strong etags or last-modified can be sent back in If-Range, weak etags can't :3
+    @staticmethod
+    def get_resume_validator(headers):
+        etag = headers.get('ETag')
+        if etag and not etag.startswith('W/'):
+            return etag
+        return headers.get('Last-Modified')
+
+    # streams a mod archive to zip_path, resuming a partial download from an earlier attempt or session if there is one :3
+    # Range is sent with If-Range so a changed file comes back whole (200) instead of being spliced onto stale bytes :3
+    # the size check uses the response headers, or happens once the download passes the limit when there's no size :3
+    # url defaults to the mod's own download url, with min_rate a source slower than that gives up after the grace period :3
+    # with interactive off an unusually large archive is refused instead of asking about it :3
+    # the partial download is held for the whole stream, waiting for it still calls throttle so pausing or cancelling works :3
+    # capped says throttle is rate limited, the source's throughput isn't measured then since it'd only measure our cap :3
+    def stream_mod_archive(self, mod, zip_path, report=None, url=None, min_rate=None, throttle=None, interactive=True, capped=False):
+        throttle = throttle or self.bandwidth.foreground.consume
+        url = url or mod['download']
+        part_path, meta_path = self.get_partial_download_paths(mod, url)
+        lock = self.get_partial_lock(part_path)
+        while not lock.acquire(timeout=PARTIAL_LOCK_POLL):
+            throttle(0)
+        try:
+            return self._stream_mod_archive(mod, zip_path, report, url, part_path, meta_path, min_rate, throttle, interactive, capped)
+        finally:
+            lock.release()
+
+    def _stream_mod_archive(self, mod, zip_path, report, url, part_path, meta_path, min_rate, throttle, interactive, capped):
+        report = report or (lambda stage, done, total=0: None)
+        meta = self.load_partial_download(part_path, meta_path)
+        offset = os.path.getsize(part_path) if meta else 0
+        # a partial another source started has no validator from this one, it's only carried on if the full length matches :3
+        source_validator = meta['validators'].get(url) if meta else None
+
+        headers = {}
+        if offset:
+            headers['Range'] = f"bytes={offset}-"
+            if source_validator:
+                headers['If-Range'] = source_validator
+
+        requested_at = time.monotonic()
+        with self.http.get(url, stream=True, timeout=30, headers=headers) as response:
+            latency = time.monotonic() - requested_at
+            if response.status_code == 416 and offset and offset == meta.get('length'):
+                # the earlier attempt already got every byte :3
+                report(InstallProgress.DOWNLOADING, offset, offset)
+                os.replace(part_path, zip_path)
+                os.remove(meta_path)
+                return hash_file(zip_path)
+            if response.status_code == 416 and offset:
+                # the partial no longer lines up with the file on the server :3
+                os.remove(part_path)
+                os.remove(meta_path)
+                raise requests.ConnectionError("Partial download is stale, restarting")
+            response.raise_for_status()
+
+            content_range = re.match(r'bytes (\d+)-\d+/(\d+|\*)', response.headers.get('Content-Range', ''))
+            if response.status_code == 206 and content_range and int(content_range.group(1)) == offset:
+                total = content_range.group(2)
+                file_size = int(total) if total != '*' else meta['length']
+                if not source_validator and file_size != meta['length']:
+                    # this source's file isn't the one the partial came from :3
+                    os.remove(part_path)
+                    os.remove(meta_path)
+                    raise requests.ConnectionError("Partial download doesn't match this source, restarting")
+                logging.info(f"Resuming {mod['title']} at {offset / 1024 / 1024:.1f}MB")
+            else:
+                # the server ignored the range or the file changed, start over :3
+                offset = 0
+                meta = None
+                file_size = int(response.headers.get('content-length', 0))
+
+            # log the mod size :3
+            logging.info(f"Downloading mod {mod['title']} ({file_size / 1024 / 1024:.1f}MB)")
+
+            size_confirmed = bool(meta and meta.get('size_confirmed'))
+            if file_size > LARGE_MOD_SIZE and not size_confirmed:
+                if not interactive:
+                    raise ValueError(f"{mod['title']} is too large to download without asking")
+                self.confirm_large_mod(mod, file_size)
+                size_confirmed = True
+
+            validator = self.get_resume_validator(response.headers) or source_validator
+            validators = dict(meta['validators']) if meta else {}
+            if validator:
+                validators[url] = validator
+
+            def write_sidecar():
+                with open(meta_path, 'w') as f:
+                    json.dump({
+                        'length': file_size,
+                        'validators': validators,
+                        'size_confirmed': size_confirmed
+                    }, f)
+
+            # without any validator a resume could mix two versions of the file, so don't keep the partial :3
+            if validators:
+                write_sidecar()
+            elif os.path.exists(meta_path):
+                os.remove(meta_path)
+
+            # the archive is hashed as it streams in, a resumed download only reads back the part it already had :3
+            digest = hashlib.sha256()
+            if offset:
+                with open(part_path, 'rb') as f:
+                    for chunk in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b''):
+                        digest.update(chunk)
+
+            downloaded = offset
+            body_started = time.monotonic()
+            report(InstallProgress.DOWNLOADING, downloaded, file_size)
+            with open(part_path, 'ab' if offset else 'wb') as f:
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    if not chunk:
+                        continue
+                    f.write(chunk)
+                    digest.update(chunk)
+                    downloaded += len(chunk)
+                    report(InstallProgress.DOWNLOADING, downloaded, file_size)
+                    throttle(len(chunk))
+                    elapsed = time.monotonic() - body_started
+                    if min_rate and elapsed > SLOW_SOURCE_GRACE and (downloaded - offset) / elapsed < min_rate:
+                        raise SlowSourceError(f"{SourceSelector.source_of(url)} is only sending {format_bytes((downloaded - offset) / elapsed)}/s")
+                    if not size_confirmed and downloaded > LARGE_MOD_SIZE:
+                        if not interactive:
+                            raise ValueError(f"{mod['title']} is too large to download without asking")
+                        # time spent looking at the dialog isn't the source being slow :3
+                        asked_at = time.monotonic()
+                        self.confirm_large_mod(mod, downloaded)
+                        body_started += time.monotonic() - asked_at
+                        size_confirmed = True
+                        if validator:
+                            write_sidecar()
+
+        if file_size and downloaded != file_size:
+            raise requests.exceptions.ChunkedEncodingError(f"Download ended early ({downloaded} of {file_size} bytes)")
+
+        self.source_selector.record(url, latency, downloaded - offset, None if capped else time.monotonic() - body_started)
+        os.replace(part_path, zip_path)
+        if os.path.exists(meta_path):
+            os.remove(meta_path)
+        return digest.hexdigest()
+
+    # every url the archive for mod can come from: its own, the thunderstore cdn and any configured mirrors :3
+    def get_download_sources(self, mod):
+        urls = [mod['download']]
+        if package := parse_thunderstore_download_url(mod['download']):
+            owner, name, version_number = package
+            templates = [THUNDERSTORE_CDN_TEMPLATE] + self.settings.get('download_mirrors', [])
+            for template in templates:
+                try:
+                    urls.append(template.format(owner=owner, name=name, version=version_number))
+                except (KeyError, IndexError, ValueError):
+                    logging.warning(f"Ignoring malformed download mirror: {template}")
+        return urls
+
+    # tries the sources fastest first, moving on when one fails or crawls, returns the archive's sha256 :3
+    # the error raised when everything fails is a transient one if there was any, so the retry policy goes again :3
+    # capped says whether throttle itself is rate limited, a capped download is slow on purpose so it never counts as crawling,
+    # without a throttle it's the foreground cap that applies :3
+    def stream_from_sources(self, mod, zip_path, urls, report=None, throttle=None, interactive=True, capped=None):
+        if capped is None:
+            capped = bool(self.bandwidth.foreground.rate)
+        ranked = self.source_selector.rank(urls, mod.get('file_size', 0))
+        errors = []
+        for position, url in enumerate(ranked):
+            try:
+                min_rate = SLOW_SOURCE_RATE if position < len(ranked) - 1 and not capped else None
+                return self.stream_mod_archive(
+                    mod, zip_path, report, url=url, min_rate=min_rate, throttle=throttle, interactive=interactive, capped=capped
+                )
+            except requests.RequestException as e:
+                self.source_selector.failure(url)
+                errors.append(e)
+                if position < len(ranked) - 1:
+                    logging.warning(f"Download of {mod['title']} from {SourceSelector.source_of(url)} failed ({e}), trying the next source")
+        raise next((e for e in errors if RetryPolicy.is_transient(e)), errors[-1])
+
+    # a whole queue of downloads fails together during an outage, one dialog a minute is plenty :3
+    def show_download_outage_error(self):
+        if time.time() - self.last_outage_dialog < 60:
+            return
+        self.last_outage_dialog = time.time()
+        messagebox.showerror("Download Error", "Thunderstore appears to be having issues. Please try again in a few minutes.")
+
+    # asks whether to keep downloading an unusually large mod, raises if the user says no :3
+    def confirm_large_mod(self, mod, file_size):
+        warning_msg = (
+            f"WARNING: {mod['title']} is {file_size / 1024 / 1024:.1f}MB which exceeds the recommended 50MB limit.\n\n"
+            "This is unusually large for a mod. Large mods are not recommended as they may:\n\n"
+            "• Take a long time to download\n"
+            "• Use excessive system memory\n"
+            "• Cause Hook, Line, Sinker to stop responding\n\n"
+            "Consider finding a smaller alternative mod.\n\n"
+            "Do you want to continue anyway?"
+        )
+        if not self.ask_on_ui_thread(messagebox.askyesno, "Excessive File Size", warning_msg, icon='warning'):
+            raise ValueError("Download cancelled - file too large")
+
+    # runs a dialog on the tk thread and waits for its answer, worker threads must not open dialogs themselves :3
+    def ask_on_ui_thread(self, dialog, *args, **kwargs):
+        if threading.current_thread() is threading.main_thread():
+            return dialog(*args, **kwargs)
+        answer = concurrent.futures.Future()
+
+        def ask():
+            try:
+                answer.set_result(dialog(*args, **kwargs))
+            except Exception as e:
+                answer.set_exception(e)
+
+        self.ui_batcher.call(ask)
+        return answer.result()
+
+    # report(stage, done, total) gets called with structured progress as the download and extract go :3
+    # throttle(bytes) is called for every chunk downloaded and sleeps to keep under the bandwidth cap, capped says if that cap is set :3
+    # deploy_stage, when given, takes the extract and deploy half so this thread can move on to the next download,
+    # the return value is then a future for the installed mod_info :3
+    def _download_and_install_mod_thread(self, mod, install=True, report=None, throttle=None, capped=None, deploy_stage=None):
+        report = report or (lambda stage, done, total=0: None)
+        throttle = throttle or self.bandwidth.foreground.consume
         download_temp_dir = None
         try:
-            self.mod_downloading = True
             self.set_status_safe(f"Downloading {mod['title']}...")
             
             # create temp directory :3
@@ -5500,90 +8903,89 @@ Special Thanks:
             download_temp_dir = os.path.join(temp_dir, f"download_{uuid.uuid4().hex}")
             os.makedirs(download_temp_dir)
             
-            # download the mod file with error handling and size check :3
-            try:
-                # first try head request to check file size :3
-                max_retries = 3
-                retry_count = 0
-                while True:
-                    try:
-                        response = requests.head(mod['download'], timeout=30)
-                        file_size = int(response.headers.get('content-length', 0))
-
-                        # if head request returns 0 size, try get request with stream=true :3
-                        if file_size == 0:
-                            response = requests.get(mod['download'], stream=True, timeout=30)
-                            file_size = int(response.headers.get('content-length', 0))
-                        break
-                    except Exception as e:
-                        if ('ConnectionResetError' in str(e) or '10054' in str(e)):
-                            retry_count += 1
-                            if retry_count >= max_retries:
-                                self.root.after(0, lambda: messagebox.showerror("Download Error", 
-                                    "Thunderstore appears to be having issues. Please try again in a few minutes."))
-                                raise ValueError("Thunderstore connection issues - please try again later")
-                            time.sleep(1)  # wait a second before retrying :3
-                            continue
-                        raise  # re-raise if it's a different error :3
-
-                # log the mod size :3
-                logging.info(f"Downloading mod {mod['title']} ({file_size / 1024 / 1024:.1f}MB)")
-
-                # check if file is over 50mb (50 * 1024 * 1024 bytes) :3
-                if file_size > 52428800:  # 50MB in bytes :3
-                    warning_msg = (
-                        f"WARNING: {mod['title']} is {file_size / 1024 / 1024:.1f}MB which exceeds the recommended 50MB limit.\n\n"
-                        "This is unusually large for a mod. Large mods are not recommended as they may:\n\n"
-                        "• Take a long time to download\n"
-                        "• Use excessive system memory\n"
-                        "• Cause Hook, Line, Sinker to stop responding\n\n"
-                        "Consider finding a smaller alternative mod.\n\n"
-                        "Do you want to continue anyway?"
-                    )
-                    if not messagebox.askyesno("Excessive File Size", warning_msg, icon='warning'):
-                        raise ValueError("Download cancelled - file too large")
-
-                # proceed with download :3
-                retry_count = 0
-                while True:
-                    try:
-                        response = requests.get(mod['download'], timeout=30)
-                        response.raise_for_status()
-                        break
-                    except Exception as e:
-                        if ('ConnectionResetError' in str(e) or '10054' in str(e)):
-                            retry_count += 1
-                            if retry_count >= max_retries:
-                                self.root.after(0, lambda: messagebox.showerror("Download Error", 
-                                    "Thunderstore appears to be having issues. Please try again in a few minutes."))
-                                raise ValueError("Thunderstore connection issues - please try again later")
-                            time.sleep(1)  # wait a second before retrying :3
-                            continue
-                        raise  # re-raise if it's a different error :3
+            # download the mod file in a single streamed request, chunks go straight to disk :3
+            zip_path = os.path.join(download_temp_dir, f"{mod['id']}.zip")
+            # reuse an archive we already downloaded if it still matches its hash :3
+            cache_key = ArchiveCache.make_key(mod)
+            archive_sha256 = self.archive_cache.get(cache_key, zip_path) if cache_key else None
+            cached = archive_sha256 is not None
+            if cached:
+                logging.info(f"Using cached archive for {mod['title']} ({cache_key})")
+                cached_size = os.path.getsize(zip_path)
+                report(InstallProgress.CACHED, cached_size, cached_size)
+            def on_retry(attempt, error, wait):
+                logging.warning(f"Download of {mod['title']} failed ({error}), retry {attempt} in {wait:.1f}s")
+                self.set_status_safe(f"Download of {mod['title']} failed, retrying in {wait:.0f}s...")
+
+            # another pc on the lan may already have it, checked against our own record of it :3
+            # it goes through the same size warning and bandwidth cap as a download from thunderstore :3
+            if not cached and cache_key:
+                archive_sha256 = self.peer_cache.fetch(
+                    cache_key, zip_path,
+                    on_progress=lambda done, total: report(InstallProgress.DOWNLOADING, done, total),
+                    expected_sha256=self.get_known_archive_sha256(mod),
+                    throttle=throttle,
+                    on_size=lambda total: total > LARGE_MOD_SIZE and self.confirm_large_mod(mod, total)
+                )
 
+            try:
+                # transient failures back off and retry, dropped connections pick up where they left off :3
+                if archive_sha256 is None:
+                    sources = self.get_download_sources(mod)
+                    archive_sha256 = self.http.retry.call(lambda: self.stream_from_sources(mod, zip_path, sources, report, throttle, capped=capped), on_retry)
             except requests.Timeout:
                 raise ValueError("Download timed out - please try again")
-            except requests.RequestException as e:
-                raise ValueError(f"Download failed: {str(e)}")
-            
-            zip_path = os.path.join(download_temp_dir, f"{mod['id']}.zip")
-            try:
-                with open(zip_path, 'wb') as f:
-                    f.write(response.content)
-            except IOError as e:
+            except (requests.RequestException, OSError) as e:
+                if RetryPolicy.is_transient(e):
+                    self.ui_batcher.call(self.show_download_outage_error)
+                    raise ValueError("Thunderstore connection issues - please try again later")
+                if isinstance(e, requests.RequestException):
+                    raise ValueError(f"Download failed: {str(e)}")
                 raise ValueError(f"Failed to save downloaded file: {str(e)}")
-                
+
+            if cache_key and not cached:
+                try:
+                    self.archive_cache.put(cache_key, zip_path, archive_sha256)
+                except OSError as e:
+                    logging.warning(f"Failed to cache archive for {mod['title']}: {e}")
+        except Exception as e:
+            if download_temp_dir:
+                self.remove_download_temp_dir(download_temp_dir)
+            if isinstance(e, InstallInterrupted) and e.state == InstallJob.CANCELLED:
+                self.discard_partial_downloads(mod)
+                logging.info(f"Install of {mod['title']} was cancelled, partial download removed")
+                raise
+            if isinstance(e, InstallInterrupted):
+                logging.info(f"Install of {mod['title']} was interrupted, partial download kept")
+                raise
+            raise self.report_install_failure(mod, install, e)
+
+        # the deploy step owns the temp folder from here on :3
+        if deploy_stage:
+            report(InstallProgress.DOWNLOADED, 0)
+            return deploy_stage.submit(self._deploy_mod_archive, mod, install, zip_path, archive_sha256, download_temp_dir, report)
+        return self._deploy_mod_archive(mod, install, zip_path, archive_sha256, download_temp_dir, report)
+
+    # second half of an install: extract, move into the mods folder, write mod_info and copy to the game :3
+    def _deploy_mod_archive(self, mod, install, zip_path, archive_sha256, download_temp_dir, report):
+        try:
             # extract the zip :3
             extract_dir = os.path.join(download_temp_dir, 'extracted')
             os.makedirs(extract_dir)
             
             try:
                 with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                    zip_ref.extractall(extract_dir)
+                    extracted_digests = extract_zip_with_digests(
+                        zip_ref, extract_dir,
+                        lambda done, total: report(InstallProgress.EXTRACTING, done, total)
+                    )
+                    extracted_size = sum(member.file_size for member in zip_ref.infolist())
             except zipfile.BadZipFile:
                 raise ValueError("Downloaded file is not a valid zip archive")
             except Exception as e:
                 raise ValueError(f"Failed to extract zip file: {str(e)}")
+            # teaches the disk space check how much bigger mods get once unzipped :3
+            self.record_extract_sizes(os.path.getsize(zip_path), extracted_size)
                 
             # find manifest.json with valid id field :3
             manifest_path = None
@@ -5611,6 +9013,7 @@ Special Thanks:
                 raise ValueError(f"{mod['title']} is likely not an installable mod!")
                 
             # create the final mod directory :3
+            report(InstallProgress.INSTALLING, 0)
             mod_dir = os.path.join(self.mods_dir, mod_id)
             if os.path.exists(mod_dir):
                 try:
@@ -5618,9 +9021,16 @@ Special Thanks:
                 except Exception as e:
                     raise ValueError(f"Failed to remove existing mod directory: {str(e)}")
                 
+            # per file digests, relative to the folder that becomes the mod directory :3
+            manifest_parent = os.path.dirname(manifest_path)
+            file_digests = {}
+            for name, file_digest in extracted_digests.items():
+                relative = os.path.relpath(os.path.join(extract_dir, name), manifest_parent)
+                if not relative.startswith('..'):
+                    file_digests[relative.replace(os.sep, '/')] = file_digest
+
             # move the mod files :3
             try:
-                manifest_parent = os.path.dirname(manifest_path)
                 if manifest_parent != extract_dir:
                     shutil.move(manifest_parent, mod_dir)
                 else:
@@ -5652,7 +9062,9 @@ Special Thanks:
                 'has_nsfw_content': mod.get('has_nsfw_content', False),
                 'website': mod.get('website', ''),
                 'updated_on': int(time.time()),
-                'dependencies': manifest.get('Dependencies', [])
+                'dependencies': manifest.get('Dependencies', []),
+                'archive_sha256': archive_sha256,
+                'file_hashes': file_digests
             }
             
             try:
@@ -5676,36 +9088,34 @@ Special Thanks:
             logging.info(f"Installed mod: {mod['title']} (ID: {mod_id})")
 
             if install:
-                self.root.after(0, self.installation_complete, mod_info)
-            else:
-                return mod_info
-                
+                self.ui_batcher.call(self.installation_complete, mod_info)
+            return mod_info
+
         except Exception as e:
-            error_message = f"Failed to install {mod['title']}: {str(e)}"
-            self.set_status_safe(error_message)
-            logging.error(error_message)
-            if install:
-                self.root.after(0, self.installation_failed, error_message)
-            else:
-                raise ValueError(error_message)
+            raise self.report_install_failure(mod, install, e)
         finally:
-            self.mod_downloading = False
-            # clean up temp directory :3
-            if download_temp_dir and os.path.exists(download_temp_dir):
-                try:
-                    shutil.rmtree(download_temp_dir)
-                except Exception as e:
-                    logging.error(f"Failed to clean up temp directory: {str(e)}")
-
-    # called when mod installation is complete :3
-    def installation_complete(self, mod_info):
-        self.set_status_safe(f"Mod {mod_info['title']} version {mod_info['version']} installed successfully!")
-        self.refresh_mod_lists()
-        self.copy_mod_to_game(mod_info)
+            self.remove_download_temp_dir(download_temp_dir)
+
+    # logs and shows a failed install the same way whichever stage it failed in, returns the error to raise :3
+    def report_install_failure(self, mod, install, error):
+        error_message = f"Failed to install {mod['title']}: {str(error)}"
+        self.set_status_safe(error_message)
+        logging.error(error_message)
+        if install:
+            self.ui_batcher.call(self.installation_failed, error_message)
+        return ValueError(error_message)
+
+    # clean up temp directory :3
+    def remove_download_temp_dir(self, download_temp_dir):
+        if os.path.exists(download_temp_dir):
+            try:
+                shutil.rmtree(download_temp_dir)
+            except Exception as e:
+                logging.error(f"Failed to clean up temp directory: {str(e)}")
 
     def download_file(self, url, destination):
         try:
-            response = requests.get(url, stream=True)
+            response = self.http.get(url, stream=True)
             response.raise_for_status()
             
             # get file size if available :3
@@ -5748,16 +9158,213 @@ Special Thanks:
                         logging.info(f"  - {os.path.join(os.path.relpath(root, mod_path), file)}")
                         
     # called when mod installation is complete :3
+    # the worker already put the mod in place and copied it to the game, the list refresh and mod cache write
+    # wait for the rest of the batch so installing 200 mods redraws once instead of 200 times :3
     def installation_complete(self, mod_info):
         self.set_status(f"Mod {mod_info['title']} version {mod_info['version']} installed successfully!")
+        self.completed_installs.append(mod_info)
+        self.ui_batcher.set('install_batch_finished', self.finish_install_batch)
+
+    # one refresh for everything installed since the last one, once nothing is running or about to start :3
+    def finish_install_batch(self):
+        if not self.completed_installs or self.install_executor.busy():
+            return
+        completed, self.completed_installs = self.completed_installs, []
         self.refresh_mod_lists()
-        self.verify_appdata_mods() 
-        self.copy_mod_to_game(mod_info)
+        self.verify_appdata_mods()
+        self.update_archive_cache_label()
+        self.update_peer_cache_label()
+        if len(completed) > 1:
+            self.set_status(f"Installed {len(completed)} mods")
 
     # called when mod installation fails :3
     def installation_failed(self, error_message):
         self.set_status_safe(f"Failed to install mod: {error_message}")
 
+    # shows every queued, running and finished install job :3
+    def show_install_queue(self):
+        if self.install_queue_window and self.install_queue_window.winfo_exists():
+            self.install_queue_window.lift()
+            return
+
+        self.install_queue_window = tk.Toplevel(self.root)
+        self.install_queue_window.title("Install Queue")
+        self.install_queue_window.geometry("860x380")
+
+        frame = ttk.Frame(self.install_queue_window, padding=10)
+        frame.pack(fill=tk.BOTH, expand=True)
+
+        self.install_queue_summary = ttk.Label(frame, text="")
+        self.install_queue_summary.pack(fill=tk.X, pady=(0, 5))
+
+        self.install_batch_window_bar = ttk.Progressbar(frame, mode='determinate', maximum=100)
+        self.install_batch_window_bar.pack(fill=tk.X, pady=(0, 5))
+
+        columns = (('Mod', 230), ('State', 150), ('Progress', 130), ('Speed', 80), ('ETA', 60), ('Time', 60))
+        self.install_queue_tree = ttk.Treeview(frame, columns=[name for name, _ in columns], show='headings', height=12)
+        for name, width in columns:
+            self.install_queue_tree.heading(name, text=name)
+            self.install_queue_tree.column(name, width=width)
+        self.install_queue_tree.pack(fill=tk.BOTH, expand=True)
+        self.install_queue_rows = {}  # job id -> values last drawn, unchanged rows are skipped :3
+
+        button_frame = ttk.Frame(frame)
+        button_frame.pack(fill=tk.X, pady=(5, 0))
+        ttk.Button(button_frame, text="Pause", command=lambda: self.apply_to_selected_install_jobs(self.install_executor.pause)).pack(side=tk.LEFT)
+        ttk.Button(button_frame, text="Resume", command=lambda: self.apply_to_selected_install_jobs(self.install_executor.resume)).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Cancel", command=lambda: self.apply_to_selected_install_jobs(self.install_executor.cancel)).pack(side=tk.LEFT)
+        ttk.Separator(button_frame, orient=tk.VERTICAL).pack(side=tk.LEFT, fill=tk.Y, padx=10)
+        self.install_queue_pause_button = ttk.Button(button_frame, text="Pause All", command=self.toggle_install_queue_pause)
+        self.install_queue_pause_button.pack(side=tk.LEFT)
+        ttk.Button(button_frame, text="Cancel All", command=self.cancel_all_install_jobs).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Clear Finished", command=self.install_executor.clear_finished).pack(side=tk.LEFT)
+        ttk.Button(button_frame, text="Close", command=self.install_queue_window.destroy).pack(side=tk.RIGHT)
+
+        self.refresh_install_queue_view()
+
+    # runs pause, resume or cancel on each selected job :3
+    def apply_to_selected_install_jobs(self, action):
+        selection = self.install_queue_tree.selection()
+        if not selection:
+            self.set_status("Select an install in the queue first")
+            return
+        if not sum(action(job_id) for job_id in selection):
+            self.set_status("That doesn't apply to the selected installs")
+
+    def toggle_install_queue_pause(self):
+        if self.install_executor.paused:
+            self.install_executor.resume_all()
+            self.set_status("Install queue resumed")
+        else:
+            self.install_executor.pause_all()
+            self.set_status("Install queue paused")
+
+    def cancel_all_install_jobs(self):
+        running, queued = self.install_executor.counts()
+        if not running and not queued:
+            return
+        if messagebox.askyesno("Cancel All", f"Cancel all {running + queued} unfinished installs?", parent=self.install_queue_window):
+            self.install_executor.cancel_all()
+
+    # queue changes redraw the view and get saved, both at most once per frame :3
+    def on_install_queue_change(self):
+        self.ui_batcher.set('install_queue', self.refresh_install_queue_view)
+        self.ui_batcher.set('install_queue_save', self.save_install_queue)
+        if self.completed_installs:
+            self.ui_batcher.set('install_batch_finished', self.finish_install_batch)
+
+    # written to a temp file first so a crash mid write can't lose the queue :3
+    def save_install_queue(self):
+        # nothing gets written until last session's queue has been read back in :3
+        if not self.install_queue_restored:
+            return
+        state = self.install_executor.pending_state()
+        temp_path = f"{self.install_queue_path}.tmp"
+        try:
+            with open(temp_path, 'w') as f:
+                json.dump(state, f, default=str)
+            os.replace(temp_path, self.install_queue_path)
+        except OSError as e:
+            logging.error(f"Failed to save install queue: {e}")
+
+    # queues whatever was unfinished when the app last closed, downloads carry on from their partial files :3
+    def restore_install_queue(self):
+        self.install_queue_restored = True
+        try:
+            with open(self.install_queue_path, 'r') as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logging.error(f"Failed to read saved install queue: {e}")
+            return
+
+        jobs = self.install_executor.restore(state)
+        if jobs:
+            paused = sum(1 for job in jobs if job.state == InstallJob.PAUSED)
+            message = f"Carrying on with {len(jobs)} install{'s' if len(jobs) != 1 else ''} from last time"
+            if self.install_executor.paused:
+                message += " (queue paused)"
+            elif paused:
+                message += f" ({paused} paused)"
+            self.set_status(message)
+            logging.info(message)
+        self.save_install_queue()
+
+    # redraws the queue button and window from the executor's current jobs :3
+    def refresh_install_queue_view(self):
+        running, queued = self.install_executor.counts()
+        finished, batch_size, fraction, rate = self.install_executor.batch_progress()
+        if hasattr(self, 'install_queue_button'):
+            text = f"Install Queue ({running} running, {queued} queued)" if running or queued else "Install Queue"
+            if self.install_executor.paused:
+                text += " - Paused"
+            self.install_queue_button.config(text=text)
+            self.install_batch_bar.config(value=fraction * 100)
+
+        if not (self.install_queue_window and self.install_queue_window.winfo_exists()):
+            return
+
+        summary = (f"{running} running, {queued} queued, up to {self.install_executor.workers} downloads "
+                   f"and {self.deploy_stage.workers} extracts at once")
+        if self.install_executor.paused:
+            summary += " (paused)"
+        self.install_queue_pause_button.config(text="Resume All" if self.install_executor.paused else "Pause All")
+        if batch_size:
+            summary += f" - {finished}/{batch_size} done"
+        if rate:
+            summary += f", {format_bytes(rate)}/s"
+        self.install_queue_summary.config(text=summary)
+        self.install_batch_window_bar.config(value=fraction * 100)
+
+        now = time.time()
+        jobs = self.install_executor.snapshot()
+        existing = set(self.install_queue_rows)
+        for job in jobs:
+            values = self.get_install_queue_row(job, now)
+            if job.id in existing:
+                existing.discard(job.id)
+                if self.install_queue_rows[job.id] == values:
+                    continue
+                self.install_queue_tree.item(job.id, values=values)
+            else:
+                self.install_queue_tree.insert('', 'end', iid=job.id, values=values)
+            self.install_queue_rows[job.id] = values
+        for job_id in existing:
+            self.install_queue_tree.delete(job_id)
+            del self.install_queue_rows[job_id]
+
+    # one row of the install queue panel: mod, stage, bytes, speed, eta and elapsed time :3
+    def get_install_queue_row(self, job, now):
+        progress = job.progress
+        state = f"{job.state}: {job.error}" if job.error else job.state
+        if job.state == InstallJob.RUNNING and job.interrupt:
+            state = "Cancelling..." if job.interrupt == InstallJob.CANCELLED else "Pausing..."
+        elif job.state == InstallJob.QUEUED and job.blocked:
+            state = "Waiting for dependencies"
+        elif job.state == InstallJob.RUNNING and progress.stage:
+            state = progress.stage
+        title = f"{job.title} (requested {job.requests}x)" if job.requests > 1 else job.title
+
+        done = speed = eta = ""
+        if progress.stage and progress.stage not in (InstallProgress.DOWNLOADED, InstallProgress.INSTALLING):
+            done = format_bytes(progress.done)
+            if progress.total:
+                done += f" / {format_bytes(progress.total)} ({progress.fraction:.0%})"
+        if job.state == InstallJob.RUNNING:
+            if progress.stage == InstallProgress.DOWNLOADING and progress.smoothed_rate:
+                speed = f"{format_bytes(progress.smoothed_rate)}/s"
+            if progress.eta is not None:
+                eta = f"{progress.eta:.0f}s"
+
+        if job.finished_at and job.started_at:
+            elapsed = f"{job.finished_at - job.started_at:.1f}s"
+        elif job.started_at:
+            elapsed = f"{now - job.started_at:.1f}s"
+        else:
+            elapsed = ""
+        return (title, state, done, speed, eta, elapsed)
+
     # retrieves the version information for a mod :3
     def get_mod_version(self, mod):
         try:
@@ -5775,7 +9382,7 @@ Special Thanks:
                 repo_owner, repo_name = path_parts[1:3]
                 api_url = f"{base_url}/api/v1/repos/{repo_owner}/{repo_name}/releases/latest"
 
-            response = requests.get(api_url)
+            response = self.http.get(api_url)
             response.raise_for_status()
             data = response.json()
 
@@ -5798,8 +9405,10 @@ Special Thanks:
     def check_for_updates(self, silent=False):
         try:
             # check for program update first :3
-            response = requests.get("https://hooklinesinker.lol/download/version.json")
-            version_data = response.json()
+            version_data = self.get_prefetched('hls_version')
+            if version_data is None:
+                response = self.http.get("https://hooklinesinker.lol/download/version.json")
+                version_data = response.json()
             remote_version = version_data['version']
             update_message = version_data.get('message', '')
             local_version = get_version()
@@ -5859,8 +9468,12 @@ Special Thanks:
                     update_message += "Would you like to install all updates?"
 
                     if silent or messagebox.askyesno("Updates Available", update_message):
-                        for mod in mods_to_update:
-                            self.download_and_install_mod(mod['available'])
+                        # silent checks are the automatic ones, they download in the background :3
+                        def queue_updates(plan):
+                            for mod in plan:
+                                self.download_and_install_mod(mod, background=silent)
+
+                        self.preflight_install_plan([mod['available'] for mod in mods_to_update], queue_updates, interactive=not silent)
 
             # check for gdweave update :3
             gdweave_version = self.get_gdweave_version()
@@ -5874,7 +9487,8 @@ Special Thanks:
                         "Update available for GDWeave. Do you want to update?",
                     )
                 ):
-                    self.install_gdweave()
+                    # silent updates are automatic, so they get the background bandwidth cap :3
+                    self.install_gdweave(background=silent)
                 else:
                     self.set_status_safe("GDWeave update skipped by user.")
 
@@ -6124,11 +9738,13 @@ Special Thanks:
         self.filter_available_mods()
 
     # loads and displays available mods categorized :3
-    def load_available_mods(self):
+    # thunderstore_mods can be handed in when the package list was already fetched :3
+    def load_available_mods(self, thunderstore_mods=None):
         try:
             # fetch mods from thunderstore api :3
-            response = requests.get("https://thunderstore.io/c/webfishing/api/v1/package/")
-            thunderstore_mods = response.json()
+            if thunderstore_mods is None:
+                response = self.http.get("https://thunderstore.io/c/webfishing/api/v1/package/")
+                thunderstore_mods = response.json()
             
             # track mods by name to detect duplicates :3
             mod_map = {}
@@ -6160,6 +9776,7 @@ Special Thanks:
                     'dependencies': latest_version['dependencies'],
                     'website': latest_version.get('website_url', ''),
                     'downloads': latest_version.get('downloads', 0),
+                    'file_size': latest_version.get('file_size', 0),
                     'likes': mod.get('rating_score', 0),
                     'last_updated': mod.get('date_updated', ''),
                     'is_deprecated': is_deprecated,
@@ -6187,6 +9804,7 @@ Special Thanks:
 
             # convert map to list :3
             self.available_mods = list(mod_map.values())
+            self.rebuild_available_search_index()
             
             # collect unique categories :3
             categories = set()